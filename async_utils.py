@@ -0,0 +1,15 @@
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+
+def run_sync(coro):
+    # FastAPI 백그라운드 작업처럼 이미 이벤트 루프가 돌고 있으면 별도 스레드에서 실행
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # 컨텍스트 변수(진행 중인 실행 기록 등)가 이어지도록 현재 컨텍스트에서 실행
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(contextvars.copy_context().run, asyncio.run, coro).result()
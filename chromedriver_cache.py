@@ -0,0 +1,97 @@
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+from config import Config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CHROME_BINARIES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+]
+
+WINDOWS_VERSION_QUERY = ["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"]
+
+VERSION_PATTERN = re.compile(r"(\d+)\.\d+\.\d+(?:\.\d+)?")
+
+
+def _run_version_command(command):
+    try:
+        output = subprocess.run(command, capture_output=True, text=True, timeout=5).stdout
+    except Exception:
+        return None
+
+    match = VERSION_PATTERN.search(output or "")
+    return match.group(0) if match else None
+
+
+def detect_chrome_version():
+    if sys.platform.startswith("win"):
+        return _run_version_command(WINDOWS_VERSION_QUERY)
+
+    for binary in CHROME_BINARIES:
+        path = binary if os.path.isabs(binary) else shutil.which(binary)
+        if path and os.path.exists(path):
+            version = _run_version_command([path, "--version"])
+            if version:
+                return version
+
+    return None
+
+
+def _major(version):
+    return version.split(".")[0] if version else None
+
+
+def _load_cache(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _save_cache(path, data):
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    except Exception as e:
+        logger.warning(f"chromedriver 경로 캐시 저장 실패: {str(e)}")
+
+
+def resolve_chromedriver_path(config=None):
+    config = config or Config()
+
+    if config.CHROME_DRIVER_PATH:
+        if os.path.exists(config.CHROME_DRIVER_PATH):
+            logger.info(f"설정된 chromedriver 사용: {config.CHROME_DRIVER_PATH}")
+            return config.CHROME_DRIVER_PATH
+        logger.warning(f"CHROME_DRIVER_PATH가 존재하지 않습니다: {config.CHROME_DRIVER_PATH}")
+
+    chrome_version = detect_chrome_version()
+    cache = _load_cache(config.CHROMEDRIVER_CACHE_FILE)
+    cached_path = cache.get("path")
+
+    if cached_path and os.path.exists(cached_path):
+        # Chrome 버전을 알 수 없으면 캐시를 그대로 쓰고, 알 수 있으면 메이저 버전이 같을 때만 사용
+        if not chrome_version or _major(chrome_version) == _major(cache.get("chrome_version")):
+            logger.info(f"캐시된 chromedriver 사용: {cached_path}")
+            return cached_path
+        logger.info(f"Chrome 버전 변경 감지 ({cache.get('chrome_version')} -> {chrome_version}), 드라이버를 갱신합니다.")
+
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    path = ChromeDriverManager().install()
+    _save_cache(config.CHROMEDRIVER_CACHE_FILE, {"path": path, "chrome_version": chrome_version})
+    logger.info(f"chromedriver 설치 경로 캐시: {path}")
+    return path
@@ -6,13 +6,112 @@ load_dotenv()
 
 class Config:
     DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
+    # 여러 채널로 보낼 때는 쉼표로 구분 (없으면 DISCORD_WEBHOOK_URL 하나만 사용)
+    DISCORD_WEBHOOK_URLS = [item.strip() for item in os.getenv(
+        "DISCORD_WEBHOOK_URLS", DISCORD_WEBHOOK_URL or "").split(",") if item.strip()]
     DAILY_DEV_EMAIL = os.getenv("DAILY_DEV_EMAIL")
     DAILY_DEV_PASSWORD = os.getenv("DAILY_DEV_PASSWORD")
     CHROME_DRIVER_PATH = os.getenv("CHROME_DRIVER_PATH")
     GOOGLE_TRANSLATE_API_KEY = os.getenv("GOOGLE_TRANSLATE_API_KEY")
+    CHROME_USER_DATA_DIR = os.getenv("CHROME_USER_DATA_DIR")
+    CHROMEDRIVER_CACHE_FILE = os.getenv("CHROMEDRIVER_CACHE_FILE", ".chromedriver_cache.json")
 
-    SCHEDULE_TIME = "08:00"
+    PERSIST_SESSION = os.getenv("PERSIST_SESSION", "true").lower() == "true"
+    SESSION_FILE = os.getenv("SESSION_FILE", "daily_dev_session.json")
+    SESSION_MAX_AGE_HOURS = int(os.getenv("SESSION_MAX_AGE_HOURS", "168"))
+
+    DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "0"))
+    DRIVER_POOL_MAX_USES = int(os.getenv("DRIVER_POOL_MAX_USES", "20"))
+    DRIVER_POOL_MAX_MEMORY_MB = int(os.getenv("DRIVER_POOL_MAX_MEMORY_MB", "512"))
+    DRIVER_POOL_LEASE_TIMEOUT = int(os.getenv("DRIVER_POOL_LEASE_TIMEOUT", "300"))
+
+    SCHEDULE_TIME = os.getenv("SCHEDULE_TIME", "08:00")
+    # 비어 있으면 시스템 시간대 사용 (예: Asia/Seoul)
+    SCHEDULE_TIMEZONE = os.getenv("SCHEDULE_TIMEZONE", "")
+    # "cron 식 | 시간대 | 게시글 수"를 ;로 구분해 여러 개 등록 (비어 있으면 매일 SCHEDULE_TIME에 실행)
+    SCHEDULES = os.getenv("SCHEDULES", "")
+    SCHEDULE_STATE_PATH = os.getenv("SCHEDULE_STATE_PATH", "schedule_state.json")
+    SCHEDULE_CATCHUP_GRACE_MINUTES = int(os.getenv("SCHEDULE_CATCHUP_GRACE_MINUTES", "120"))
 
     DAILY_DEV_URL = "https://app.daily.dev"
     POST_LIMIT = 10
-    FETCH_CONTENT = os.getenv("FETCH_CONTENT", "true").lower() == "true"
\ No newline at end of file
+    FETCH_CONTENT = os.getenv("FETCH_CONTENT", "true").lower() == "true"
+    CONTENT_FETCH_CONCURRENCY = int(os.getenv("CONTENT_FETCH_CONCURRENCY", "8"))
+    CONTENT_FETCH_TIMEOUT = int(os.getenv("CONTENT_FETCH_TIMEOUT", "15"))
+    CARD_EXTRACTION_MODE = os.getenv("CARD_EXTRACTION_MODE", "script").lower()
+    MAX_SCROLL_ROUNDS = int(os.getenv("MAX_SCROLL_ROUNDS", "15"))
+    SCROLL_WAIT_TIMEOUT = float(os.getenv("SCROLL_WAIT_TIMEOUT", "3"))
+
+    RESOURCE_BLOCKING = os.getenv("RESOURCE_BLOCKING", "true").lower() == "true"
+    FEED_BLOCKED_RESOURCE_TYPES = [item.strip() for item in os.getenv(
+        "FEED_BLOCKED_RESOURCE_TYPES", "image,media,font").split(",") if item.strip()]
+    ARTICLE_BLOCKED_RESOURCE_TYPES = [item.strip() for item in os.getenv(
+        "ARTICLE_BLOCKED_RESOURCE_TYPES", "image,media,font,stylesheet").split(",") if item.strip()]
+    BLOCKED_DOMAINS = [item.strip() for item in os.getenv(
+        "BLOCKED_DOMAINS",
+        "google-analytics.com,googletagmanager.com,doubleclick.net,googlesyndication.com,"
+        "facebook.net,hotjar.com,segment.io").split(",") if item.strip()]
+
+    HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+    HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "15"))
+    HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+    HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "10"))
+    HTTP_HOST_POOL_SIZES = os.getenv("HTTP_HOST_POOL_SIZES", "translate.googleapis.com=8,discord.com=2")
+    HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+    HTTP_RETRY_BACKOFF = float(os.getenv("HTTP_RETRY_BACKOFF", "0.5"))
+    DISCORD_MAX_RETRIES = int(os.getenv("DISCORD_MAX_RETRIES", "5"))
+    DISCORD_DELIVERY_RETRIES = int(os.getenv("DISCORD_DELIVERY_RETRIES", "2"))
+    DISCORD_BACKOFF_BASE = float(os.getenv("DISCORD_BACKOFF_BASE", "2"))
+    DISCORD_BACKOFF_MAX = float(os.getenv("DISCORD_BACKOFF_MAX", "60"))
+    DISCORD_OUTBOX = os.getenv("DISCORD_OUTBOX", "true").lower() == "true"
+    DISCORD_OUTBOX_PATH = os.getenv("DISCORD_OUTBOX_PATH", "discord_outbox.db")
+    # 전송 중으로 표시된 메시지를 다른 프로세스가 가져가기 전까지 기다리는 시간 (초)
+    DISCORD_OUTBOX_CLAIM_TIMEOUT = int(os.getenv("DISCORD_OUTBOX_CLAIM_TIMEOUT", "600"))
+    DISCORD_OUTBOX_MAX_ATTEMPTS = int(os.getenv("DISCORD_OUTBOX_MAX_ATTEMPTS", "10"))
+    DISCORD_OUTBOX_RETENTION_DAYS = int(os.getenv("DISCORD_OUTBOX_RETENTION_DAYS", "7"))
+
+    # 번역 요청 하나의 최대 크기 (URL 인코딩 기준 바이트). 긴 본문은 이보다 작은 조각으로 나누고,
+    # 짧은 문장들은 이 크기 안에서만 한 요청으로 묶음.
+    # 설정하지 않으면 예전 설정인 TRANSLATION_CHUNK_MAX_BYTES, TRANSLATION_BATCH_MAX_BYTES 순으로 사용
+    TRANSLATION_REQUEST_MAX_BYTES = int(os.getenv(
+        "TRANSLATION_REQUEST_MAX_BYTES",
+        os.getenv("TRANSLATION_CHUNK_MAX_BYTES", os.getenv("TRANSLATION_BATCH_MAX_BYTES", "1800"))))
+    KOREAN_RATIO_THRESHOLD = float(os.getenv("KOREAN_RATIO_THRESHOLD", "0.5"))
+    TRANSLATION_CONCURRENCY = int(os.getenv("TRANSLATION_CONCURRENCY", "4"))
+    TRANSLATION_RATE_PER_SEC = float(os.getenv("TRANSLATION_RATE_PER_SEC", "2"))
+    TRANSLATION_BURST = int(os.getenv("TRANSLATION_BURST", "4"))
+    TRANSLATION_MAX_RETRIES = int(os.getenv("TRANSLATION_MAX_RETRIES", "4"))
+    TRANSLATION_BACKOFF_BASE = float(os.getenv("TRANSLATION_BACKOFF_BASE", "1"))
+    TRANSLATION_BACKOFF_MAX = float(os.getenv("TRANSLATION_BACKOFF_MAX", "30"))
+    TRANSLATION_BACKENDS = [item.strip() for item in os.getenv(
+        "TRANSLATION_BACKENDS", "google,googletrans").split(",") if item.strip()]
+    TRANSLATION_BREAKER_THRESHOLD = int(os.getenv("TRANSLATION_BREAKER_THRESHOLD", "3"))
+    TRANSLATION_BREAKER_COOLDOWN = float(os.getenv("TRANSLATION_BREAKER_COOLDOWN", "300"))
+    TRANSLATION_STANDIN_URL = os.getenv("TRANSLATION_STANDIN_URL", "http://127.0.0.1:8765/translate_a/single")
+
+    TRANSLATION_CACHE = os.getenv("TRANSLATION_CACHE", "true").lower() == "true"
+    TRANSLATION_CACHE_PATH = os.getenv("TRANSLATION_CACHE_PATH", "translation_cache.db")
+    TRANSLATION_CACHE_MAX_ENTRIES = int(os.getenv("TRANSLATION_CACHE_MAX_ENTRIES", "20000"))
+    TRANSLATION_CACHE_TTL_HOURS = int(os.getenv("TRANSLATION_CACHE_TTL_HOURS", "0"))
+
+    ADAPTIVE_SELECTORS = os.getenv("ADAPTIVE_SELECTORS", "true").lower() == "true"
+    SELECTOR_STATS_FILE = os.getenv("SELECTOR_STATS_FILE", "selector_stats.json")
+    SELECTOR_STATS_HALF_LIFE_DAYS = float(os.getenv("SELECTOR_STATS_HALF_LIFE_DAYS", "7"))
+
+    POST_HISTORY = os.getenv("POST_HISTORY", "true").lower() == "true"
+    POST_HISTORY_PATH = os.getenv("POST_HISTORY_PATH", "post_history.db")
+    POST_HISTORY_RETENTION_DAYS = int(os.getenv("POST_HISTORY_RETENTION_DAYS", "90"))
+    # mark: 이전에 보낸 게시글 표시, skip: 제외, send: 구분 없이 전송
+    REPEAT_POST_POLICY = os.getenv("REPEAT_POST_POLICY", "mark").lower()
+
+    PIPELINE_STREAMING = os.getenv("PIPELINE_STREAMING", "true").lower() == "true"
+    PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "4"))
+    PIPELINE_TRANSLATE_BATCH = int(os.getenv("PIPELINE_TRANSLATE_BATCH", "5"))
+    PIPELINE_SEND_LINGER = float(os.getenv("PIPELINE_SEND_LINGER", "1"))
+    # first: 첫 게시글과 함께 헤더 전송, none: 헤더 없이 전송
+    PIPELINE_HEADER_POLICY = os.getenv("PIPELINE_HEADER_POLICY", "first").lower()
+    PIPELINE_FOOTER = os.getenv("PIPELINE_FOOTER", "true").lower() == "true"
+    # 전송 단계가 실패했을 때 앞 단계가 끝나기를 기다리는 최대 시간 (초)
+    PIPELINE_SHUTDOWN_TIMEOUT = float(os.getenv("PIPELINE_SHUTDOWN_TIMEOUT", "30"))
+
+    METRICS_HISTORY_RUNS = int(os.getenv("METRICS_HISTORY_RUNS", "20"))
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+from urllib.parse import urlparse
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+from async_utils import run_sync
+from config import Config
+from metrics import get_metrics
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+
+class ArticleContentFetcher:
+    def __init__(self, content_selectors, max_length=1000, selector_stats=None):
+        self.config = Config()
+        self.content_selectors = content_selectors
+        self.selector_stats = selector_stats
+        self.max_length = max_length
+        self.concurrency = max(1, self.config.CONTENT_FETCH_CONCURRENCY)
+        self.timeout = self.config.CONTENT_FETCH_TIMEOUT
+
+    def fetch_all(self, urls, on_result=None):
+        unique_urls = list(dict.fromkeys(url for url in urls if url and url.startswith("http")))
+        if not unique_urls:
+            return {}
+
+        logger.info(f"본문 {len(unique_urls)}개 동시 요청 시작 (동시 연결 {self.concurrency}개)")
+        contents = run_sync(self._fetch_all(unique_urls, on_result))
+
+        found = sum(1 for content in contents.values() if content)
+        logger.info(f"정적 HTML 본문 수집: {found}/{len(unique_urls)}개 성공")
+        return contents
+
+    async def _fetch_all(self, urls, on_result=None):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers={"User-Agent": USER_AGENT}) as session:
+            results = await asyncio.gather(*(self._fetch_and_report(session, semaphore, url, on_result) for url in urls))
+
+        return dict(zip(urls, results))
+
+    async def _fetch_and_report(self, session, semaphore, url, on_result):
+        with get_metrics().span("article_http", post=url):
+            content = await self._fetch_one(session, semaphore, url)
+        get_metrics().incr("article_fetches", result="ok" if content is not None else "fallback")
+        if on_result and content is not None:
+            # 콜백이 다음 단계 큐에서 기다릴 수 있으므로 이벤트 루프를 막지 않게 스레드에서 호출
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, on_result, url, content)
+        return content
+
+    async def _fetch_one(self, session, semaphore, url):
+        async with semaphore:
+            try:
+                async with session.get(url, allow_redirects=True) as response:
+                    if response.status != 200:
+                        logger.debug(f"본문 요청 실패 ({response.status}): {url[:50]}...")
+                        return None
+
+                    if "html" not in response.headers.get("Content-Type", ""):
+                        logger.debug(f"HTML이 아닌 응답: {url[:50]}...")
+                        return None
+
+                    html = await response.text(errors="replace")
+
+            except Exception as e:
+                logger.debug(f"본문 요청 중 오류: {url[:50]}... - {str(e)}")
+                return None
+
+        # 파싱은 CPU 작업이므로 다른 요청을 막지 않도록 스레드에서 처리
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(None, self.extract_content, html, urlparse(url).netloc)
+        except Exception as e:
+            logger.debug(f"본문 파싱 실패: {url[:50]}... - {str(e)}")
+            return None
+
+    def extract_content(self, html, domain=None):
+        soup = BeautifulSoup(html, "lxml")
+        for element in soup(["script", "style", "noscript", "template", "svg"]):
+            element.decompose()
+
+        content_text = ""
+        content_selectors = self.content_selectors
+        if self.selector_stats:
+            content_selectors = self.selector_stats.order("content", content_selectors, domain)
+
+        matched = None
+        for selector in content_selectors:
+            try:
+                content_elements = soup.select(selector)
+            except Exception:
+                continue
+
+            for element in content_elements:
+                text = element.get_text("\n", strip=True)
+                if text and len(text) > 200:
+                    content_text = text
+                    break
+
+            if content_text:
+                matched = selector
+                break
+
+        if self.selector_stats:
+            self.selector_stats.record_attempts("content", content_selectors, matched, domain)
+
+        if not content_text:
+            paragraph_texts = []
+            for p in soup.select("p"):
+                text = p.get_text(" ", strip=True)
+                if text and len(text) > 30:
+                    paragraph_texts.append(text)
+
+            if paragraph_texts:
+                content_text = "\n\n".join(paragraph_texts[:5])
+
+        if not content_text:
+            return None
+
+        if len(content_text) > self.max_length:
+            content_text = content_text[:self.max_length] + "..."
+
+        return content_text
@@ -0,0 +1,246 @@
+import json
+import logging
+import os
+from datetime import datetime, time as dtime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from config import Config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ALIASES = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+MONTH_NAMES = {name: i + 1 for i, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"])}
+WEEKDAY_NAMES = {name: i for i, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])}
+
+# 2월 29일처럼 드물게 오는 날짜도 찾을 수 있도록 윤년 주기만큼 탐색
+SEARCH_DAYS = 366 * 8
+
+
+def _parse_value(text, names):
+    text = text.strip().lower()
+    if text in names:
+        return names[text]
+    return int(text)
+
+
+def _parse_field(text, low, high, names=None):
+    names = names or {}
+    values = set()
+
+    for part in text.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step < 1:
+                raise ValueError(f"잘못된 간격: {text}")
+
+        if part in ("*", "?"):
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = _parse_value(start_text, names), _parse_value(end_text, names)
+        else:
+            start = _parse_value(part, names)
+            # "5/15"는 5부터 끝까지 15 간격
+            end = high if step > 1 else start
+
+        if not low <= start <= end <= high:
+            raise ValueError(f"허용 범위({low}-{high})를 벗어난 값: {text}")
+
+        values.update(range(start, end + 1, step))
+
+    return sorted(values)
+
+
+def _localize(naive, tz):
+    """벽시계 시각을 시간대에 맞춰 변환.
+
+    서머타임 시작으로 건너뛴 시각은 그만큼 뒤로 밀린 시각으로, 두 번 오는 시각은 처음 한 번으로 본다.
+    """
+    aware = naive.astimezone() if tz is None else naive.replace(tzinfo=tz)
+    return datetime.fromtimestamp(aware.timestamp(), tz).astimezone(tz)
+
+
+class CronExpression:
+    """분 시 일 월 요일 형식의 cron 식 (목록, 범위, 간격, 영문 약어, @daily 등 별칭 지원)"""
+
+    def __init__(self, expression):
+        self.expression = expression.strip()
+        fields = ALIASES.get(self.expression.lower(), self.expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 식은 5개 필드여야 합니다: {expression}")
+
+        try:
+            self.minutes = _parse_field(fields[0], 0, 59)
+            self.hours = _parse_field(fields[1], 0, 23)
+            self.days = set(_parse_field(fields[2], 1, 31))
+            self.months = set(_parse_field(fields[3], 1, 12, MONTH_NAMES))
+            # 일요일은 0과 7 모두 허용
+            self.weekdays = {day % 7 for day in _parse_field(fields[4], 0, 7, WEEKDAY_NAMES)}
+        except ValueError as e:
+            raise ValueError(f"잘못된 cron 식 '{expression}': {str(e)}")
+
+        # 일과 요일이 모두 지정되면 둘 중 하나만 맞아도 실행 (표준 cron 동작)
+        self.any_day = fields[2] not in ("*", "?") and fields[4] not in ("*", "?")
+
+    def matches_day(self, day):
+        if day.month not in self.months:
+            return False
+
+        in_days = day.day in self.days
+        in_weekdays = (day.weekday() + 1) % 7 in self.weekdays
+        return (in_days or in_weekdays) if self.any_day else (in_days and in_weekdays)
+
+    def next_after(self, moment, tz=None):
+        """moment 이후(같은 분 제외) 처음 실행할 시각. tz가 없으면 시스템 시간대 기준"""
+        local = moment.astimezone(tz).replace(tzinfo=None, second=0, microsecond=0)
+        day = local.date()
+        after = (local.hour, local.minute)
+
+        for _ in range(SEARCH_DAYS):
+            if self.matches_day(day):
+                for hour in self.hours:
+                    for minute in self.minutes:
+                        if after and (hour, minute) <= after:
+                            continue
+
+                        candidate = _localize(datetime.combine(day, dtime(hour, minute)), tz)
+                        # 건너뛴 시각이 밀려서 이미 지난 시각과 겹치면 다음 후보로 넘어감
+                        if candidate > moment:
+                            return candidate
+
+            day += timedelta(days=1)
+            after = None
+
+        raise ValueError(f"실행 시각을 찾을 수 없는 cron 식: {self.expression}")
+
+
+class Schedule:
+    def __init__(self, expression, timezone_name=None, limit=None):
+        self.cron = CronExpression(expression)
+        self.timezone_name = timezone_name or None
+        self.limit = limit or Config.POST_LIMIT
+
+        try:
+            self.tz = ZoneInfo(self.timezone_name) if self.timezone_name else None
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"알 수 없는 시간대: {self.timezone_name}")
+
+    @property
+    def name(self):
+        return f"{self.cron.expression} ({self.timezone_name or '시스템 시간대'})"
+
+    @property
+    def key(self):
+        return f"{self.cron.expression}|{self.timezone_name or ''}"
+
+    def next_after(self, moment):
+        return self.cron.next_after(moment, self.tz)
+
+
+def parse_schedules(text, default_timezone=None, default_limit=None):
+    """"cron 식 | 시간대 | 게시글 수" 항목을 ;로 구분한 문자열을 읽음 (시간대와 게시글 수는 생략 가능)"""
+    schedules = []
+
+    for item in text.split(";"):
+        if not item.strip():
+            continue
+
+        parts = [part.strip() for part in item.split("|")]
+        if len(parts) > 3:
+            raise ValueError(f"잘못된 스케줄 항목: {item.strip()}")
+
+        expression = parts[0]
+        timezone_name = parts[1] if len(parts) > 1 and parts[1] else default_timezone
+        try:
+            limit = int(parts[2]) if len(parts) > 2 and parts[2] else default_limit
+        except ValueError:
+            raise ValueError(f"게시글 수는 정수여야 합니다: {item.strip()}")
+
+        schedules.append(Schedule(expression, timezone_name, limit))
+
+    return schedules
+
+
+def load_schedules(config=None):
+    config = config or Config()
+    text = config.SCHEDULES
+
+    if not text.strip():
+        # SCHEDULES가 없으면 기존처럼 매일 SCHEDULE_TIME에 한 번 실행
+        try:
+            hour, minute = (int(value) for value in config.SCHEDULE_TIME.split(":"))
+        except ValueError:
+            raise ValueError(f"SCHEDULE_TIME은 HH:MM 형식이어야 합니다: {config.SCHEDULE_TIME}")
+        text = f"{minute} {hour} * * *"
+
+    schedules = parse_schedules(text, config.SCHEDULE_TIMEZONE, config.POST_LIMIT)
+    if not schedules:
+        raise ValueError("등록된 스케줄이 없습니다.")
+    return schedules
+
+
+class ScheduleState:
+    """스케줄별 마지막 실행 예정 시각을 저장해 프로세스가 꺼져 있던 동안 놓친 실행을 찾음"""
+
+    def __init__(self, path=None):
+        self.path = path or Config.SCHEDULE_STATE_PATH
+        self.data = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"스케줄 상태 파일을 읽지 못했습니다: {str(e)}")
+            return {}
+
+    def _save(self):
+        # 저장 중에 종료돼도 기존 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=2)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logger.warning(f"스케줄 상태 저장 실패: {str(e)}")
+
+    def last_run(self, schedule):
+        value = self.data.get(schedule.key)
+        if not value:
+            return None
+
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+
+    def record(self, schedule, due):
+        self.data[schedule.key] = due.astimezone(timezone.utc).isoformat()
+        self._save()
+
+
+def missed_run(schedule, last_run, now):
+    """last_run 이후 now까지 놓친 실행 중 가장 최근 시각 (없으면 None)"""
+    missed = None
+    due = schedule.next_after(last_run)
+
+    while due <= now:
+        missed = due
+        due = schedule.next_after(due)
+
+    return missed
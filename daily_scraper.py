@@ -1,5 +1,8 @@
+import json
 import logging
+import os
 import time
+from urllib.parse import urlparse
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -7,18 +10,181 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
+from chromedriver_cache import resolve_chromedriver_path
 from config import Config
+from metrics import get_metrics, instrument_driver
+from post_history import normalize_link, open_post_history
+import scraper_selectors
+from resource_blocker import ResourceBlocker
+from selector_stats import get_selector_stats
+from waits import WaitTracker
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 카드 목록 전체를 한 번의 execute_script 호출로 추출 (선택자 우선순위는 extract_card와 동일)
+CARD_EXTRACTION_SCRIPT = """
+const cards = arguments[0] || [];
+const selectors = arguments[1];
+const baseUrl = arguments[2];
+
+const safeQuery = (root, selector) => {
+    try {
+        return root.querySelector(selector);
+    } catch (e) {
+        return null;
+    }
+};
+const textOf = (element) => (element.innerText || element.textContent || '').trim();
+const absolute = (href) => href.startsWith('http') ? href : baseUrl + href;
+
+return cards.map((card) => {
+    const matched = {title: null, link: null, desc: null};
+
+    let title = '';
+    let titleElement = null;
+    for (const selector of selectors.title) {
+        const element = safeQuery(card, selector);
+        if (!element) continue;
+        titleElement = element;
+        title = element.getAttribute('title') || textOf(element);
+        if (title && title.length > 10) {
+            matched.title = selector;
+            break;
+        }
+    }
+
+    if (!title) return {matched: matched};
+
+    let link = '';
+    for (const selector of selectors.link) {
+        const element = safeQuery(card, selector);
+        if (!element) continue;
+        const href = element.href || element.getAttribute('href');
+        if (href && (href.includes('http') || href.includes('/posts/'))) {
+            link = absolute(href);
+            matched.link = selector;
+            break;
+        }
+    }
+
+    if (!link && titleElement && titleElement.parentElement) {
+        const parentLink = titleElement.parentElement.closest('a[href]');
+        if (parentLink) {
+            const href = parentLink.href || parentLink.getAttribute('href');
+            if (href) link = absolute(href);
+        }
+    }
+
+    let description = '';
+    for (const selector of selectors.desc) {
+        const element = safeQuery(card, selector);
+        if (!element) continue;
+        const text = textOf(element);
+        if (text && text.length > 20) {
+            description = text.slice(0, 300);
+            matched.desc = selector;
+            break;
+        }
+    }
+
+    let tags = [];
+    try {
+        tags = Array.from(card.querySelectorAll(selectors.tag)).slice(0, 3)
+            .map(textOf)
+            .filter((text) => text && text.length > 1);
+    } catch (e) {
+        tags = [];
+    }
+
+    return {title: title, link: link, description: description, tags: tags, matched: matched};
+});
+"""
+
+
+# 피드가 렌더링된 뒤 로그인 버튼 노출 여부로 세션 유효성을 판단
+LOGIN_STATE_SCRIPT = """
+if (document.readyState !== 'complete') return null;
+const loginVisible = Array.from(document.querySelectorAll('button, a')).some(
+    (element) => /^(log in|login|sign up)$/i.test((element.innerText || '').trim())
+);
+if (loginVisible) return 'logged_out';
+if (document.querySelector("[data-testid='feed'], article, .post")) return 'logged_in';
+return null;
+"""
+
+READ_LOCAL_STORAGE_SCRIPT = """
+const data = {};
+for (let i = 0; i < localStorage.length; i++) {
+    const key = localStorage.key(i);
+    data[key] = localStorage.getItem(key);
+}
+return data;
+"""
+
+WRITE_LOCAL_STORAGE_SCRIPT = """
+const data = arguments[0] || {};
+for (const key of Object.keys(data)) {
+    localStorage.setItem(key, data[key]);
+}
+"""
+
+OVERLAYS_CLOSED_SCRIPT = """
+return !Array.from(document.querySelectorAll("[role='dialog'], .modal, .overlay, .popup")).some((element) => {
+    const rect = element.getBoundingClientRect();
+    const style = window.getComputedStyle(element);
+    return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+});
+"""
+
+IN_VIEWPORT_SCRIPT = """
+const rect = arguments[0].getBoundingClientRect();
+return rect.top >= 0 && rect.bottom <= (window.innerHeight || document.documentElement.clientHeight);
+"""
+
+ANY_PRESENT_SCRIPT = """
+return arguments[0].some((selector) => {
+    try {
+        if (selector.startsWith('//')) {
+            return document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+        }
+        return document.querySelector(selector) !== null;
+    } catch (e) {
+        return false;
+    }
+});
+"""
+
+CARDS_PRESENT_SCRIPT = """
+return arguments[0].some((selector) => {
+    try {
+        return document.querySelectorAll(selector).length > 2;
+    } catch (e) {
+        return false;
+    }
+});
+"""
+
+SESSION_COOKIE_KEYS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
 
 class DailyDevScraper:
-    def __init__(self):
+    POST_SELECTORS = scraper_selectors.POST_SELECTORS
+    TITLE_SELECTORS = scraper_selectors.TITLE_SELECTORS
+    LINK_SELECTORS = scraper_selectors.LINK_SELECTORS
+    DESC_SELECTORS = scraper_selectors.DESC_SELECTORS
+    TAG_SELECTOR = scraper_selectors.TAG_SELECTOR
+    CONTENT_SELECTORS = scraper_selectors.CONTENT_SELECTORS
+
+    def __init__(self, driver_pool=None):
         self.config = Config()
         self.driver = None
+        self.driver_pool = driver_pool
+        self.waits = WaitTracker()
+        self.selector_stats = get_selector_stats() if self.config.ADAPTIVE_SELECTORS else None
+        self.resource_blocker = ResourceBlocker() if self.config.RESOURCE_BLOCKING else None
+        self.history = open_post_history()
 
     def setup_driver(self):
         chrome_options = Options()
@@ -29,17 +195,69 @@ class DailyDevScraper:
         chrome_options.add_argument("--window-size=1920,1080")
         chrome_options.add_argument("--disable-extensions")
         chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")
         chrome_options.add_argument("--disable-notifications")
         chrome_options.add_argument("--disable-popup-blocking")
         chrome_options.add_argument(
             "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        if self.config.CHROME_USER_DATA_DIR:
+            chrome_options.add_argument(f"--user-data-dir={self.config.CHROME_USER_DATA_DIR}")
+        if self.resource_blocker:
+            self.resource_blocker.configure_options(chrome_options)
+
+        service = Service(resolve_chromedriver_path(self.config))
+        with get_metrics().span("chrome_startup"):
+            self.driver = instrument_driver(webdriver.Chrome(service=service, options=chrome_options))
+        if self.resource_blocker:
+            self.resource_blocker.apply(self.driver, "feed")
         return self.driver
 
-    def dismiss_popups(self):
+    def _ordered(self, list_name, selectors, domain=None):
+        if not self.selector_stats:
+            return list(selectors)
+        return self.selector_stats.order(list_name, selectors, domain)
+
+    def _record_selector(self, list_name, ordered, matched, domain=None):
+        if self.selector_stats:
+            self.selector_stats.record_attempts(list_name, ordered, matched, domain)
+
+    def _collect_resource_stats(self):
+        if self.resource_blocker and self.driver:
+            self.resource_blocker.collect(self.driver)
+
+    def _save_selector_stats(self):
+        if self.selector_stats:
+            self.selector_stats.save()
+
+    def _document_ready(self):
+        return self.driver.execute_script("return document.readyState") == "complete"
+
+    def _overlays_closed(self):
+        return self.driver.execute_script(OVERLAYS_CLOSED_SCRIPT)
+
+    def _any_present(self, selectors):
+        return self.driver.execute_script(ANY_PRESENT_SCRIPT, selectors)
+
+    def _is_gone(self, element):
+        try:
+            return not element.is_displayed()
+        except Exception:
+            return True
+
+    def _dom_settled(self, quiet_period=0.5):
+        state = {"length": None, "since": time.monotonic()}
+
+        def condition():
+            length = self.driver.execute_script("return document.body.innerText.length;")
+            now = time.monotonic()
+            if length != state["length"]:
+                state["length"] = length
+                state["since"] = now
+                return False
+            return now - state["since"] >= quiet_period
+
+        return condition
+
+    def dismiss_popups(self, budget=3):
         try:
             close_selectors = [
                 "//button[contains(text(), 'Accept')]",
@@ -57,10 +275,13 @@ class DailyDevScraper:
             try:
                 from selenium.webdriver.common.keys import Keys
                 self.driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
-                time.sleep(1)
+                self.waits.until("popup_escape", self._overlays_closed, timeout=1)
             except:
                 pass
 
+            # 여러 요소가 매칭되어도 팝업 닫기 대기는 전체 budget 안에서만 수행
+            deadline = time.monotonic() + budget
+
             for selector in close_selectors:
                 try:
                     if selector.startswith("//"):
@@ -72,7 +293,10 @@ class DailyDevScraper:
                         try:
                             if element.is_displayed() and element.is_enabled():
                                 self.driver.execute_script("arguments[0].click();", element)
-                                time.sleep(1)
+                                remaining = deadline - time.monotonic()
+                                if remaining > 0:
+                                    self.waits.until("popup_close", lambda: self._is_gone(element),
+                                                     timeout=min(1, remaining))
                         except:
                             continue
                 except:
@@ -80,7 +304,7 @@ class DailyDevScraper:
 
             try:
                 self.driver.execute_script("document.body.click();")
-                time.sleep(1)
+                self.waits.until("popup_body_click", self._overlays_closed, timeout=1)
             except:
                 pass
 
@@ -95,12 +319,13 @@ class DailyDevScraper:
             )
 
             self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(1)
+            self.waits.until("click_scroll",
+                             lambda: self.driver.execute_script(IN_VIEWPORT_SCRIPT, element), timeout=1)
 
             self.dismiss_popups()
 
             self.driver.execute_script("arguments[0].click();", element)
-            time.sleep(2)
+            self.waits.until("click_settle", self._document_ready, timeout=2)
 
             return True
 
@@ -155,10 +380,15 @@ class DailyDevScraper:
                         try:
                             if element.is_displayed() and element.is_enabled():
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                                time.sleep(1)
+                                self.waits.until("show_more_scroll",
+                                                 lambda: self.driver.execute_script(IN_VIEWPORT_SCRIPT, element),
+                                                 timeout=1)
 
                                 self.driver.execute_script("arguments[0].click();", element)
-                                time.sleep(2)
+                                self.waits.until("show_more_expand",
+                                                 lambda: self._is_gone(element)
+                                                 or element.get_attribute("aria-expanded") == "true",
+                                                 timeout=2)
 
                                 logger.debug(f"Show more 버튼 클릭됨: {selector}")
                                 buttons_clicked += 1
@@ -176,7 +406,7 @@ class DailyDevScraper:
 
             if buttons_clicked > 0:
                 logger.info(f"{buttons_clicked}개의 'Show more' 버튼을 클릭했습니다.")
-                time.sleep(3)
+                self.waits.until("show_more_settle", self._dom_settled(), timeout=3)
             else:
                 logger.debug("클릭 가능한 'Show more' 버튼을 찾지 못했습니다.")
 
@@ -191,7 +421,8 @@ class DailyDevScraper:
             logger.info(f"본문 가져오기: {post_url[:50]}...")
 
             original_window = self.driver.current_window_handle
-            self.driver.execute_script(f"window.open('{post_url}', '_blank');")
+            # 차단 규칙은 탭마다 적용되므로 빈 탭을 먼저 열고 규칙 적용 후 이동
+            self.driver.execute_script("window.open('about:blank', '_blank');")
 
             new_window = None
             for window_handle in self.driver.window_handles:
@@ -204,35 +435,21 @@ class DailyDevScraper:
                 return ""
 
             self.driver.switch_to.window(new_window)
+            if self.resource_blocker:
+                self.resource_blocker.apply(self.driver, "article")
+            self.driver.get(post_url)
 
             WebDriverWait(self.driver, 10).until(
                 lambda driver: driver.execute_script("return document.readyState") == "complete"
             )
-            time.sleep(2)
+            self.waits.until("article_render",
+                             lambda: self._any_present(["article", "main p", "p"]), timeout=2)
 
             self.click_show_more_buttons()
 
-            content_selectors = [
-                "article",
-                "main article",
-                ".post-content",
-                ".article-content",
-                ".content",
-                ".entry-content",
-                ".post-body",
-                ".article-body",
-
-                "[data-testid='article-content']",
-                "[data-testid='post-content']",
-                ".text-content",
-                "main .prose",
-                ".markdown-body",
-
-                "div:has(> p)",
-                "section:has(> p)"
-            ]
-
             content_text = ""
+            domain = urlparse(post_url).netloc
+            content_selectors = self._ordered("content", self.CONTENT_SELECTORS, domain)
 
             for selector in content_selectors:
                 try:
@@ -245,11 +462,15 @@ class DailyDevScraper:
                             break
 
                     if content_text:
+                        self._record_selector("content", content_selectors, selector, domain)
                         break
 
                 except Exception as e:
                     continue
 
+            if not content_text:
+                self._record_selector("content", content_selectors, None, domain)
+
             if not content_text:
                 try:
                     paragraphs = self.driver.find_elements(By.CSS_SELECTOR, "p")
@@ -274,6 +495,7 @@ class DailyDevScraper:
             else:
                 logger.warning("본문 내용을 찾을 수 없습니다")
 
+            self._collect_resource_stats()
             self.driver.close()
             self.driver.switch_to.window(original_window)
 
@@ -289,59 +511,215 @@ class DailyDevScraper:
                 pass
             return ""
 
+    def fetch_contents(self, posts, max_length=1000, on_post=None):
+        """on_post(post)가 주어지면 본문이 준비되는 대로 게시글마다 호출"""
+        if not posts:
+            return posts
+
+        def on_result(url, content):
+            for post in posts:
+                if post["link"] == url and not post["content"]:
+                    post["content"] = content
+                    on_post(post)
+
+        contents = {}
+        try:
+            from content_fetcher import ArticleContentFetcher
+
+            fetcher = ArticleContentFetcher(self.CONTENT_SELECTORS, max_length=max_length,
+                                            selector_stats=self.selector_stats)
+            contents = fetcher.fetch_all([post["link"] for post in posts], on_result=on_result if on_post else None)
+        except Exception as e:
+            logger.warning(f"동시 본문 수집 실패, 브라우저로 수집합니다: {str(e)}")
+
+        for post in posts:
+            if on_post and post["content"]:
+                continue
+
+            content = contents.get(post["link"])
+            if content is None:
+                logger.info(f"정적 HTML에서 본문을 찾지 못해 브라우저로 가져옵니다: {post['link'][:50]}...")
+                try:
+                    with get_metrics().span("article_browser", post=post["link"]):
+                        content = self.get_article_content(post["link"], max_length=max_length)
+                except Exception as e:
+                    logger.warning(f"본문 가져오기 실패: {str(e)}")
+                    content = ""
+
+            post["content"] = content
+            if on_post:
+                on_post(post)
+
+        return posts
+
+    def save_session(self):
+        try:
+            session = {
+                "saved_at": time.time(),
+                "cookies": self.driver.get_cookies(),
+                "local_storage": self.driver.execute_script(READ_LOCAL_STORAGE_SCRIPT) or {}
+            }
+
+            with open(self.config.SESSION_FILE, "w", encoding="utf-8") as f:
+                json.dump(session, f)
+
+            try:
+                os.chmod(self.config.SESSION_FILE, 0o600)
+            except OSError:
+                pass
+
+            logger.info(f"로그인 세션 저장 완료 (쿠키 {len(session['cookies'])}개)")
+            return True
+
+        except Exception as e:
+            logger.warning(f"로그인 세션 저장 실패: {str(e)}")
+            return False
+
+    def restore_session(self):
+        if not os.path.exists(self.config.SESSION_FILE):
+            return False
+
+        try:
+            with open(self.config.SESSION_FILE, "r", encoding="utf-8") as f:
+                session = json.load(f)
+
+            now = time.time()
+            max_age = self.config.SESSION_MAX_AGE_HOURS * 3600
+            if max_age and now - session.get("saved_at", 0) > max_age:
+                logger.info("저장된 세션이 너무 오래되어 사용하지 않습니다.")
+                return False
+
+            # 쿠키는 같은 도메인에 있을 때만 추가할 수 있음
+            self.driver.get(self.config.DAILY_DEV_URL)
+
+            restored = 0
+            for cookie in session.get("cookies", []):
+                if cookie.get("expiry") and cookie["expiry"] < now:
+                    continue
+
+                cookie = {key: value for key, value in cookie.items() if key in SESSION_COOKIE_KEYS}
+                if "expiry" in cookie:
+                    cookie["expiry"] = int(cookie["expiry"])
+
+                try:
+                    self.driver.add_cookie(cookie)
+                    restored += 1
+                except Exception as e:
+                    logger.debug(f"쿠키 복원 실패 ({cookie.get('name')}): {str(e)}")
+
+            if not restored:
+                return False
+
+            self.driver.execute_script(WRITE_LOCAL_STORAGE_SCRIPT, session.get("local_storage", {}))
+            logger.info(f"저장된 세션 복원 (쿠키 {restored}개)")
+            return True
+
+        except Exception as e:
+            logger.warning(f"세션 복원 실패: {str(e)}")
+            return False
+
+    def clear_session(self):
+        try:
+            self.driver.delete_all_cookies()
+            self.driver.execute_script("localStorage.clear();")
+        except Exception as e:
+            logger.debug(f"세션 초기화 실패 (무시됨): {str(e)}")
+
+    def is_logged_in(self, timeout=10):
+        try:
+            self.driver.get(f"{self.config.DAILY_DEV_URL}/popular")
+            state = WebDriverWait(self.driver, timeout).until(
+                lambda driver: driver.execute_script(LOGIN_STATE_SCRIPT)
+            )
+            return state == "logged_in"
+        except Exception as e:
+            logger.debug(f"로그인 상태 확인 실패: {str(e)}")
+            return False
+
+    def ensure_logged_in(self):
+        with get_metrics().span("login"):
+            return self._ensure_logged_in()
+
+    def _ensure_logged_in(self):
+        if self.config.PERSIST_SESSION and self.restore_session():
+            if self.is_logged_in():
+                logger.info("저장된 세션으로 로그인 상태를 재사용합니다.")
+                return True
+
+            logger.info("저장된 세션이 만료되었습니다. 다시 로그인합니다.")
+            self.clear_session()
+
+        if not (self.config.DAILY_DEV_EMAIL and self.config.DAILY_DEV_PASSWORD):
+            logger.info("로그인 정보가 없습니다. 로그인 없이 시도합니다.")
+            return False
+
+        if not self.login_to_daily_dev():
+            logger.warning("로그인 실패. 로그인 없이 시도합니다.")
+            return False
+
+        if self.config.PERSIST_SESSION:
+            self.save_session()
+
+        return True
+
     def login_to_daily_dev(self):
         try:
             logger.info("daily.dev 로그인 시작")
             self.driver.get("https://app.daily.dev")
 
-            time.sleep(5)
+            self.waits.until("login_page_load",
+                             lambda: self.driver.execute_script(LOGIN_STATE_SCRIPT), timeout=5)
             self.dismiss_popups()
 
-            login_selectors = [
+            login_selectors = self._ordered("login", [
                 "//button[contains(text(), 'Log in')]",
                 "button:contains('Log in')",
                 "[data-testid='login-button']",
                 ".login-button",
                 "a[href*='login']"
-            ]
+            ])
 
-            login_clicked = False
+            login_clicked = None
             for selector in login_selectors:
                 by_type = By.XPATH if selector.startswith("//") else By.CSS_SELECTOR
                 if self.wait_and_click(selector, timeout=5, by_type=by_type):
-                    login_clicked = True
+                    login_clicked = selector
                     logger.info("로그인 버튼 클릭 성공")
                     break
+            self._record_selector("login", login_selectors, login_clicked)
 
             if not login_clicked:
                 logger.error("로그인 버튼을 찾을 수 없습니다")
                 return False
 
-            time.sleep(3)
-            email_login_selectors = [
+            email_login_selectors = self._ordered("email_login", [
                 "//button[contains(text(), 'Continue with email')]",
                 "button:contains('Continue with email')",
                 "[data-testid='email-login']"
-            ]
+            ])
+            self.waits.until("login_modal_open",
+                             lambda: self._any_present(email_login_selectors + ["input[type='email']"]),
+                             timeout=3)
 
-            email_clicked = False
+            email_clicked = None
             for selector in email_login_selectors:
                 by_type = By.XPATH if selector.startswith("//") else By.CSS_SELECTOR
                 if self.wait_and_click(selector, timeout=5, by_type=by_type):
-                    email_clicked = True
+                    email_clicked = selector
                     logger.info("이메일 로그인 버튼 클릭 성공")
                     break
+            self._record_selector("email_login", email_login_selectors, email_clicked)
 
             if not email_clicked:
                 logger.warning("이메일 로그인 버튼을 찾을 수 없습니다. 기본 로그인 폼을 찾아봅니다.")
 
-            time.sleep(3)
-            email_selectors = [
+            email_selectors = self._ordered("email_input", [
                 "input[type='email']",
                 "input[name='email']",
                 "input[placeholder*='email']",
                 "input[placeholder*='Email']"
-            ]
+            ])
+            self.waits.until("login_form_open", lambda: self._any_present(email_selectors), timeout=3)
 
             email_field = None
             for selector in email_selectors:
@@ -349,11 +727,13 @@ class DailyDevScraper:
                     email_field = WebDriverWait(self.driver, 5).until(
                         EC.presence_of_element_located((By.CSS_SELECTOR, selector))
                     )
+                    self._record_selector("email_input", email_selectors, selector)
                     break
                 except:
                     continue
 
             if not email_field:
+                self._record_selector("email_input", email_selectors, None)
                 logger.error("이메일 입력 필드를 찾을 수 없습니다")
                 return False
 
@@ -361,22 +741,24 @@ class DailyDevScraper:
             email_field.send_keys(self.config.DAILY_DEV_EMAIL)
             logger.info("이메일 입력 완료")
 
-            password_selectors = [
+            password_selectors = self._ordered("password_input", [
                 "input[type='password']",
                 "input[name='password']",
                 "input[placeholder*='password']",
                 "input[placeholder*='Password']"
-            ]
+            ])
 
             password_field = None
             for selector in password_selectors:
                 try:
                     password_field = self.driver.find_element(By.CSS_SELECTOR, selector)
+                    self._record_selector("password_input", password_selectors, selector)
                     break
                 except:
                     continue
 
             if not password_field:
+                self._record_selector("password_input", password_selectors, None)
                 logger.error("비밀번호 입력 필드를 찾을 수 없습니다")
                 return False
 
@@ -384,22 +766,23 @@ class DailyDevScraper:
             password_field.send_keys(self.config.DAILY_DEV_PASSWORD)
             logger.info("비밀번호 입력 완료")
 
-            submit_selectors = [
+            submit_selectors = self._ordered("submit", [
                 "button[type='submit']",
                 "//button[contains(text(), 'Sign in')]",
                 "//button[contains(text(), 'Log in')]",
                 "//button[contains(text(), 'Continue')]",
                 ".submit-button",
                 "[data-testid='submit-button']"
-            ]
+            ])
 
-            submit_clicked = False
+            submit_clicked = None
             for selector in submit_selectors:
                 by_type = By.XPATH if selector.startswith("//") else By.CSS_SELECTOR
                 if self.wait_and_click(selector, timeout=5, by_type=by_type):
-                    submit_clicked = True
+                    submit_clicked = selector
                     logger.info("로그인 제출 버튼 클릭 성공")
                     break
+            self._record_selector("submit", submit_selectors, submit_clicked)
 
             if not submit_clicked:
                 logger.error("로그인 제출 버튼을 찾을 수 없습니다")
@@ -427,203 +810,122 @@ class DailyDevScraper:
             logger.error(f"로그인 실패: {str(e)}")
             return False
 
-    def get_top_posts(self, limit=10):
+    def get_top_posts(self, limit=10, on_post=None):
+        """on_post(index, post)가 주어지면 본문까지 준비된 게시글을 순서와 관계없이 바로 넘김"""
         try:
             logger.info(f"상위 {limit}개 게시글 수집 시작")
 
             current_url = self.driver.current_url
             if "/feed" not in current_url and "/popular" not in current_url:
                 self.driver.get("https://app.daily.dev/popular")
-                time.sleep(5)
+                self.waits.until("feed_navigation", self._document_ready, timeout=5)
 
             self.dismiss_popups()
 
             logger.info("페이지 로딩 대기 중...")
-            try:
-                WebDriverWait(self.driver, 20).until(
-                    lambda driver: driver.execute_script("return document.readyState") == "complete"
-                )
-            except:
-                pass
+            feed_started = time.perf_counter()
+            self.waits.until("feed_ready", self._document_ready, timeout=20)
+            post_selectors = self._ordered("post", self.POST_SELECTORS)
 
-            time.sleep(5)
-            post_selectors = [
-                "article",
-                "[data-testid='post']",
-                "[data-testid='post-item']",
-                ".post",
-                ".post-item",
-                "[data-testid='feed-item']",
-                ".feed-item",
-                ".card",
-                "[role='article']",
-                ".Card_card__BFnUM",
-                "[class*='card']",
-                "[class*='post']"
-            ]
+            self.waits.until("feed_cards",
+                             lambda: self.driver.execute_script(CARDS_PRESENT_SCRIPT, post_selectors), timeout=5)
 
-            post_elements = []
-            for selector in post_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements and len(elements) > 2:
-                        post_elements = elements
-                        logger.info(f"게시글 요소 발견: {selector} ({len(elements)}개)")
-                        break
-                except:
-                    continue
+            harvested = {}
+            stagnant_rounds = 0
+            scroll_round = 0
+            harvest_started = time.perf_counter()
+            get_metrics().observe("feed_load", harvest_started - feed_started)
 
-            if not post_elements:
-                try:
-                    logger.info("JavaScript로 게시글 요소 검색 중...")
-                    js_elements = self.driver.execute_script("""
-                        // 다양한 선택자로 요소 찾기
-                        const selectors = ['article', '[data-testid*="post"]', '.card', '[class*="card"]', '[class*="post"]'];
-                        for (let selector of selectors) {
-                            const elements = document.querySelectorAll(selector);
-                            if (elements.length > 2) {
-                                console.log('Found elements with:', selector, elements.length);
-                                return Array.from(elements).slice(0, 20); // 최대 20개
-                            }
-                        }
-                        return [];
-                    """)
-
-                    if js_elements:
-                        post_elements = js_elements
-                        logger.info(f"JavaScript로 {len(post_elements)}개 게시글 요소 발견")
-                except Exception as e:
-                    logger.warning(f"JavaScript 검색 실패: {str(e)}")
+            while True:
+                post_elements = self._find_post_elements(post_selectors, record=scroll_round == 0)
+
+                if not post_elements and not harvested:
+                    with open("daily_dev_page_source_latest.html", "w", encoding="utf-8") as f:
+                        f.write(self.driver.page_source)
+                    logger.error("게시글 요소를 찾을 수 없습니다. 페이지 소스가 저장되었습니다.")
+
+                    logger.info(f"현재 URL: {self.driver.current_url}")
+                    logger.info(f"페이지 제목: {self.driver.title}")
 
-            if not post_elements:
-                with open("daily_dev_page_source_latest.html", "w", encoding="utf-8") as f:
-                    f.write(self.driver.page_source)
-                logger.error("게시글 요소를 찾을 수 없습니다. 페이지 소스가 저장되었습니다.")
+                    return []
 
-                logger.info(f"현재 URL: {self.driver.current_url}")
-                logger.info(f"페이지 제목: {self.driver.title}")
+                new_cards = 0
+                for card in self._extract_cards(post_elements):
+                    key = self._card_key(card)
+                    if key not in harvested:
+                        harvested[key] = card
+                        new_cards += 1
 
-                return []
+                logger.info(f"스크롤 {scroll_round}회차: 새 게시글 {new_cards}개 (누적 {len(harvested)}개)")
 
-            logger.info("페이지 스크롤로 더 많은 게시글 로딩 중...")
-            for i in range(3):
+                if len(harvested) >= limit:
+                    break
+
+                stagnant_rounds = stagnant_rounds + 1 if new_cards == 0 else 0
+                if stagnant_rounds >= 2 or scroll_round >= self.config.MAX_SCROLL_ROUNDS:
+                    logger.info("스크롤해도 새 게시글이 나오지 않아 수집을 마칩니다.")
+                    break
+
+                # 목표 개수에 못 미칠 때만 스크롤하고, 페이지가 더 이상 늘어나지 않으면 중단
+                previous_height = self.driver.execute_script("return document.body.scrollHeight;")
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+                grown = self.waits.until("feed_scroll",
+                                         lambda: self.driver.execute_script("return document.body.scrollHeight;")
+                                         > previous_height,
+                                         timeout=self.config.SCROLL_WAIT_TIMEOUT)
+                if not grown:
+                    logger.info("페이지가 더 이상 늘어나지 않아 수집을 마칩니다.")
+                    break
+
+                scroll_round += 1
 
+            get_metrics().observe("feed_harvest", time.perf_counter() - harvest_started)
             posts = []
-            logger.info(f"총 {len(post_elements)}개 요소에서 게시글 파싱 시작")
+            cards = list(harvested.values())
 
-            for i, post_element in enumerate(post_elements[:limit * 2]):
-                try:
-                    title_selectors = [
-                        "h1", "h2", "h3", "h4", "h5",
-                        "[data-testid*='title']",
-                        "[data-testid*='post-title']",
-                        ".title",
-                        ".post-title",
-                        "a[href*='/posts/']",
-                        "a[title]",
-                        "[class*='title']"
-                    ]
-
-                    title = ""
-                    title_element = None
-
-                    for title_selector in title_selectors:
-                        try:
-                            title_element = post_element.find_element(By.CSS_SELECTOR, title_selector)
-                            title = title_element.get_attribute("title") or title_element.text.strip()
-                            if title and len(title) > 10:
-                                break
-                        except:
-                            continue
+            for card in cards:
+                title = card["title"]
+                link = card["link"]
 
-                    if not title:
-                        continue
+                post_data = {
+                    "title": title,
+                    "link": link or f"https://app.daily.dev/search?q={title[:50]}",
+                    "description": card["description"],
+                    "content": "",
+                    "tags": card["tags"]
+                }
 
-                    link = ""
-                    link_selectors = [
-                        "a[href*='/posts/']",
-                        "a[href*='http']",
-                        "a[title]",
-                        "a"
-                    ]
+                posts.append(post_data)
+                logger.info(f"게시글 {len(posts)}/{limit} 수집: {title[:50]}...")
 
-                    for link_selector in link_selectors:
-                        try:
-                            link_element = post_element.find_element(By.CSS_SELECTOR, link_selector)
-                            href = link_element.get_attribute("href")
-                            if href and ("http" in href or "/posts/" in href):
-                                link = href if href.startswith("http") else f"https://app.daily.dev{href}"
-                                break
-                        except:
-                            continue
+                if len(posts) >= limit:
+                    break
 
-                    if not link and title_element:
-                        try:
-                            parent_link = title_element.find_element(By.XPATH, ".//ancestor::a[@href][1]")
-                            href = parent_link.get_attribute("href")
-                            if href:
-                                link = href if href.startswith("http") else f"https://app.daily.dev{href}"
-                        except:
-                            pass
-
-                    description = ""
-                    desc_selectors = [
-                        ".description",
-                        ".summary",
-                        "p",
-                        ".content",
-                        "[class*='description']",
-                        "[class*='summary']"
-                    ]
-
-                    for desc_selector in desc_selectors:
-                        try:
-                            desc_element = post_element.find_element(By.CSS_SELECTOR, desc_selector)
-                            desc_text = desc_element.text.strip()
-                            if desc_text and len(desc_text) > 20:
-                                description = desc_text[:300]
-                                break
-                        except:
-                            continue
+            # 본문을 열기 전에 기록을 확인해 이미 수집한 게시글은 저장된 본문을 사용
+            self._apply_history(posts)
+            skip_repeats = self.config.REPEAT_POST_POLICY == "skip"
+            content_targets = [
+                post for post in posts
+                if post["link"].startswith('http') and not post["content"] and not (skip_repeats and post.get("repeat"))
+            ]
 
-                    tags = []
-                    try:
-                        tag_elements = post_element.find_elements(By.CSS_SELECTOR,
-                                                                  ".tag, [data-testid*='tag'], .badge, [class*='tag'], [class*='badge']")
-                        tags = [tag.text.strip() for tag in tag_elements[:3]
-                                if tag.text.strip() and len(tag.text.strip()) > 1]
-                    except:
-                        pass
-
-                    if title and len(title) > 10:
-                        content = ""
-                        if self.config.FETCH_CONTENT and link and link.startswith('http'):
-                            try:
-                                content = self.get_article_content(link, max_length=800)
-                            except Exception as e:
-                                logger.warning(f"본문 가져오기 실패: {str(e)}")
-                        elif not self.config.FETCH_CONTENT:
-                            logger.info("본문 수집이 비활성화되어 있습니다.")
-
-                        post_data = {
-                            "title": title,
-                            "link": link or f"https://app.daily.dev/search?q={title[:50]}",
-                            "description": description,
-                            "content": content,
-                            "tags": tags
-                        }
-
-                        posts.append(post_data)
-                        logger.info(f"게시글 {len(posts)}/{limit} 수집: {title[:50]}...")
-
-                        if len(posts) >= limit:
-                            break
+            if not self.config.FETCH_CONTENT:
+                logger.info("본문 수집이 비활성화되어 있습니다.")
+                content_targets = []
 
-                except Exception as e:
-                    logger.warning(f"게시글 {i + 1} 처리 중 오류: {str(e)}")
-                    continue
+            emit = self._indexed_callback(on_post, posts) if on_post else None
+            if emit:
+                # 본문을 가져올 필요가 없는 게시글은 바로 다음 단계로 넘김
+                waiting = set(map(id, content_targets))
+                for post in posts:
+                    if id(post) not in waiting:
+                        emit(post)
+
+            if content_targets:
+                with get_metrics().span("article_fetch"):
+                    self.fetch_contents(content_targets, max_length=800, on_post=emit)
+
+            self._record_history(posts)
 
             logger.info(f"총 {len(posts)}개 게시글 수집 완료")
             return posts
@@ -632,25 +934,314 @@ class DailyDevScraper:
             logger.error(f"게시글 수집 실패: {str(e)}")
             return []
 
+    @staticmethod
+    def _indexed_callback(on_post, posts):
+        # 본문 수집은 게시글만 넘기므로 원래 순번을 붙여 on_post(index, post)로 전달
+        indices = {id(post): index for index, post in enumerate(posts)}
+        return lambda post: on_post(indices[id(post)], post)
+
+    def _apply_history(self, posts):
+        if not self.history:
+            return
+
+        known = 0
+        for post in posts:
+            try:
+                record = self.history.get(post["link"])
+            except Exception as e:
+                logger.debug(f"게시글 기록 조회 실패: {str(e)}")
+                continue
+
+            if not record:
+                continue
+
+            known += 1
+            post["first_seen"] = record["first_seen"]
+            post["repeat"] = record["delivered_at"] is not None
+            if record["content"]:
+                post["content"] = record["content"]
+
+        if known:
+            logger.info(f"이전에 수집한 게시글 {known}개는 저장된 본문을 재사용합니다.")
+
+    def _record_history(self, posts):
+        if not self.history:
+            return
+
+        try:
+            self.history.record_seen(posts)
+        except Exception as e:
+            logger.warning(f"게시글 기록 저장 실패: {str(e)}")
+
+    def _find_post_elements(self, post_selectors, record=False):
+        for selector in post_selectors:
+            try:
+                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                if elements and len(elements) > 2:
+                    if record:
+                        logger.info(f"게시글 요소 발견: {selector} ({len(elements)}개)")
+                        self._record_selector("post", post_selectors, selector)
+                    return elements
+            except:
+                continue
+
+        try:
+            logger.info("JavaScript로 게시글 요소 검색 중...")
+            js_elements = self.driver.execute_script("""
+                // 다양한 선택자로 요소 찾기
+                const selectors = ['article', '[data-testid*="post"]', '.card', '[class*="card"]', '[class*="post"]'];
+                for (let selector of selectors) {
+                    const elements = document.querySelectorAll(selector);
+                    if (elements.length > 2) {
+                        console.log('Found elements with:', selector, elements.length);
+                        return Array.from(elements);
+                    }
+                }
+                return [];
+            """)
+
+            if js_elements:
+                logger.info(f"JavaScript로 {len(js_elements)}개 게시글 요소 발견")
+                return js_elements
+        except Exception as e:
+            logger.warning(f"JavaScript 검색 실패: {str(e)}")
+
+        return []
+
+    def _extract_cards(self, post_elements):
+        cards = None
+        if self.config.CARD_EXTRACTION_MODE == "html":
+            cards = self.extract_cards_from_html(None)
+        elif self.config.CARD_EXTRACTION_MODE == "script":
+            cards = self.extract_cards_with_script(post_elements)
+
+        if cards is None:
+            cards = []
+            for i, post_element in enumerate(post_elements):
+                try:
+                    card = self.extract_card(post_element)
+                    if card:
+                        cards.append(card)
+                except Exception as e:
+                    logger.warning(f"게시글 {i + 1} 처리 중 오류: {str(e)}")
+                    continue
+
+        return cards
+
+    def _card_key(self, card):
+        if not card["link"]:
+            return f"title:{card['title']}"
+
+        return normalize_link(card["link"])
+
+    def extract_cards_with_script(self, post_elements):
+        selectors = {
+            "title": self._ordered("title", self.TITLE_SELECTORS),
+            "link": self._ordered("link", self.LINK_SELECTORS),
+            "desc": self._ordered("desc", self.DESC_SELECTORS),
+            "tag": self.TAG_SELECTOR
+        }
+
+        try:
+            cards = self.driver.execute_script(
+                CARD_EXTRACTION_SCRIPT,
+                post_elements,
+                selectors,
+                self.config.DAILY_DEV_URL
+            )
+        except Exception as e:
+            logger.warning(f"스크립트 카드 추출 실패, 요소별 추출로 전환: {str(e)}")
+            return None
+
+        if not isinstance(cards, list):
+            logger.warning("스크립트 카드 추출 결과가 올바르지 않습니다. 요소별 추출로 전환합니다.")
+            return None
+
+        extracted = []
+        for card in cards:
+            if not isinstance(card, dict):
+                continue
+
+            matched = card.get("matched") or {}
+            for field in ("title", "link", "desc"):
+                self._record_selector(field, selectors[field], matched.get(field))
+
+            title = (card.get("title") or "").strip()
+            if len(title) <= 10:
+                continue
+
+            extracted.append({
+                "title": title,
+                "link": card.get("link") or "",
+                "description": card.get("description") or "",
+                "tags": card.get("tags") or []
+            })
+
+        logger.info(f"스크립트로 {len(extracted)}개 카드 추출 ({len(post_elements)}개 요소)")
+        return extracted
+
+    def extract_cards_from_html(self, max_cards):
+        try:
+            from page_parser import DailyDevPageParser
+
+            # page_source는 한 번만 가져오고 이후 파싱은 브라우저 없이 수행
+            html = self.driver.page_source
+            cards = DailyDevPageParser(base_url=self.driver.current_url).extract_cards(html, max_cards)
+        except Exception as e:
+            logger.warning(f"HTML 카드 추출 실패, 요소별 추출로 전환: {str(e)}")
+            return None
+
+        if not cards:
+            logger.warning("페이지 HTML에서 카드를 찾지 못했습니다. 요소별 추출로 전환합니다.")
+            return None
+
+        logger.info(f"페이지 HTML에서 {len(cards)}개 카드 추출")
+        return cards
+
+    def extract_card(self, post_element):
+        title = ""
+        title_element = None
+        title_selectors = self._ordered("title", self.TITLE_SELECTORS)
+        matched = None
+
+        for title_selector in title_selectors:
+            try:
+                title_element = post_element.find_element(By.CSS_SELECTOR, title_selector)
+                title = title_element.get_attribute("title") or title_element.text.strip()
+                if title and len(title) > 10:
+                    matched = title_selector
+                    break
+            except:
+                continue
+
+        self._record_selector("title", title_selectors, matched)
+        if not title or len(title) <= 10:
+            return None
+
+        link = ""
+        link_selectors = self._ordered("link", self.LINK_SELECTORS)
+        matched = None
+        for link_selector in link_selectors:
+            try:
+                link_element = post_element.find_element(By.CSS_SELECTOR, link_selector)
+                href = link_element.get_attribute("href")
+                if href and ("http" in href or "/posts/" in href):
+                    link = href if href.startswith("http") else f"https://app.daily.dev{href}"
+                    matched = link_selector
+                    break
+            except:
+                continue
+        self._record_selector("link", link_selectors, matched)
+
+        if not link and title_element:
+            try:
+                parent_link = title_element.find_element(By.XPATH, ".//ancestor::a[@href][1]")
+                href = parent_link.get_attribute("href")
+                if href:
+                    link = href if href.startswith("http") else f"https://app.daily.dev{href}"
+            except:
+                pass
+
+        description = ""
+        desc_selectors = self._ordered("desc", self.DESC_SELECTORS)
+        matched = None
+        for desc_selector in desc_selectors:
+            try:
+                desc_element = post_element.find_element(By.CSS_SELECTOR, desc_selector)
+                desc_text = desc_element.text.strip()
+                if desc_text and len(desc_text) > 20:
+                    description = desc_text[:300]
+                    matched = desc_selector
+                    break
+            except:
+                continue
+        self._record_selector("desc", desc_selectors, matched)
+
+        tags = []
+        try:
+            tag_elements = post_element.find_elements(By.CSS_SELECTOR, self.TAG_SELECTOR)
+            tags = [tag.text.strip() for tag in tag_elements[:3]
+                    if tag.text.strip() and len(tag.text.strip()) > 1]
+        except:
+            pass
+
+        return {
+            "title": title,
+            "link": link,
+            "description": description,
+            "tags": tags
+        }
+
     def close_driver(self):
         if self.driver:
             self.driver.quit()
 
-    def scrape_posts(self, limit=10):
+    def scrape_posts(self, limit=10, on_post=None):
+        self.waits.reset()
+        if self.resource_blocker:
+            self.resource_blocker.reset()
+
+        if self.driver_pool:
+            try:
+                return self.scrape_posts_with_pool(limit, on_post)
+            finally:
+                self._log_run_summary()
+
         try:
             self.setup_driver()
+            self.ensure_logged_in()
 
-            if self.config.DAILY_DEV_EMAIL and self.config.DAILY_DEV_PASSWORD:
-                if not self.login_to_daily_dev():
-                    logger.warning("로그인 실패. 로그인 없이 시도합니다.")
-            else:
-                logger.info("로그인 정보가 없습니다. 로그인 없이 시도합니다.")
-
-            posts = self.get_top_posts(limit)
+            posts = self.get_top_posts(limit, on_post)
             return posts
 
         except Exception as e:
             logger.error(f"스크래핑 실패: {str(e)}")
             return []
         finally:
+            self._collect_resource_stats()
             self.close_driver()
+            self._log_run_summary()
+
+    def _log_run_summary(self):
+        self.waits.log_summary()
+        if self.resource_blocker:
+            self.resource_blocker.log_summary()
+        self._save_selector_stats()
+
+    def scrape_posts_with_pool(self, limit=10, on_post=None):
+        try:
+            with self.driver_pool.lease(timeout=self.config.DRIVER_POOL_LEASE_TIMEOUT) as driver:
+                self.driver = driver
+
+                # 풀에 있던 드라이버는 이전 페이지에 머물러 있으므로 피드를 새로 열면서 세션을 확인
+                if not self.is_logged_in():
+                    self.ensure_logged_in()
+
+                # 풀 드라이버는 이전 사용분 로그가 남아 있을 수 있으므로 시작 전에 비움
+                self._collect_resource_stats()
+                if self.resource_blocker:
+                    self.resource_blocker.reset()
+
+                try:
+                    return self.get_top_posts(limit, on_post)
+                finally:
+                    self._collect_resource_stats()
+
+        except Exception as e:
+            logger.error(f"스크래핑 실패: {str(e)}")
+            return []
+        finally:
+            self.driver = None
+
+
+def create_logged_in_driver():
+    scraper = DailyDevScraper()
+    driver = scraper.setup_driver()
+
+    try:
+        scraper.ensure_logged_in()
+    except Exception:
+        driver.quit()
+        raise
+
+    return driver
@@ -0,0 +1,114 @@
+import copy
+
+# https://discord.com/developers/docs/resources/message#embed-object-embed-limits
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_MESSAGE_EMBED_CHARS = 6000
+TITLE_LIMIT = 256
+DESCRIPTION_LIMIT = 4096
+FIELD_COUNT_LIMIT = 25
+FIELD_NAME_LIMIT = 256
+FIELD_VALUE_LIMIT = 1024
+FOOTER_TEXT_LIMIT = 2048
+AUTHOR_NAME_LIMIT = 256
+
+# 줄일 수 없는 항목만 남았을 때 설명/필드 값의 최소 길이
+MIN_TRIMMED_LENGTH = 200
+ELLIPSIS = "…"
+
+
+def _truncate(text, limit):
+    if len(text) <= limit:
+        return text
+    return text[:max(0, limit - len(ELLIPSIS))].rstrip() + ELLIPSIS
+
+
+def embed_length(embed):
+    """Discord가 메시지당 6000자 제한에 합산하는 글자 수"""
+    length = len(embed.get("title", "")) + len(embed.get("description", ""))
+    length += len(embed.get("footer", {}).get("text", ""))
+    length += len(embed.get("author", {}).get("name", ""))
+    for field in embed.get("fields", []):
+        length += len(field.get("name", "")) + len(field.get("value", ""))
+    return length
+
+
+def clamp_embed(embed):
+    # 항목별 제한을 넘는 부분을 잘라냄
+    embed = copy.deepcopy(embed)
+
+    if "title" in embed:
+        embed["title"] = _truncate(embed["title"], TITLE_LIMIT)
+    if "description" in embed:
+        embed["description"] = _truncate(embed["description"], DESCRIPTION_LIMIT)
+    if "footer" in embed and "text" in embed["footer"]:
+        embed["footer"]["text"] = _truncate(embed["footer"]["text"], FOOTER_TEXT_LIMIT)
+    if "author" in embed and "name" in embed["author"]:
+        embed["author"]["name"] = _truncate(embed["author"]["name"], AUTHOR_NAME_LIMIT)
+
+    if "fields" in embed:
+        embed["fields"] = [
+            dict(field, name=_truncate(field.get("name", ""), FIELD_NAME_LIMIT),
+                 value=_truncate(field.get("value", ""), FIELD_VALUE_LIMIT))
+            for field in embed["fields"][:FIELD_COUNT_LIMIT]
+        ]
+
+    return embed
+
+
+def trim_embed(embed, budget):
+    """embed_length가 budget 이하가 되도록 설명, 필드 값 순으로 줄임"""
+    embed = copy.deepcopy(embed)
+    excess = embed_length(embed) - budget
+    if excess <= 0:
+        return embed
+
+    description = embed.get("description", "")
+    if description:
+        keep = max(MIN_TRIMMED_LENGTH, len(description) - excess)
+        embed["description"] = _truncate(description, keep)
+        excess = embed_length(embed) - budget
+
+    for field in reversed(embed.get("fields", [])):
+        if excess <= 0:
+            break
+        keep = max(MIN_TRIMMED_LENGTH, len(field["value"]) - excess)
+        field["value"] = _truncate(field["value"], keep)
+        excess = embed_length(embed) - budget
+
+    return embed
+
+
+def pack_embeds(embeds):
+    """표시 순서를 유지하면서 메시지당 10개 / 6000자 제한 안에서 가능한 적은 메시지로 묶음"""
+    messages = []
+    current = []
+    current_length = 0
+
+    for embed in map(clamp_embed, embeds):
+        length = embed_length(embed)
+
+        # 임베드 하나가 메시지 제한보다 크면 단독 메시지에 들어가도록 줄임
+        if length > MAX_MESSAGE_EMBED_CHARS:
+            embed = trim_embed(embed, MAX_MESSAGE_EMBED_CHARS)
+            length = embed_length(embed)
+
+        if current and (len(current) >= MAX_EMBEDS_PER_MESSAGE or current_length + length > MAX_MESSAGE_EMBED_CHARS):
+            # 남은 자리에 맞게 조금만 줄이면 들어가는 경우는 줄여서 현재 메시지에 넣음
+            remaining = MAX_MESSAGE_EMBED_CHARS - current_length
+            trimmed = trim_embed(embed, remaining) if len(current) < MAX_EMBEDS_PER_MESSAGE else None
+            if trimmed is not None and embed_length(trimmed) <= remaining and embed_length(trimmed) >= length * 0.8:
+                current.append(trimmed)
+                current_length += embed_length(trimmed)
+                continue
+
+            messages.append(current)
+            current = []
+            current_length = 0
+
+        current.append(embed)
+        current_length += length
+
+    if current:
+        messages.append(current)
+
+    return messages
@@ -0,0 +1,153 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+
+from config import Config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class OutboxEntry:
+    def __init__(self, id, batch, webhook_url, payload, attempts):
+        self.id = id
+        self.batch = batch
+        self.webhook_url = webhook_url
+        self.payload = payload
+        self.attempts = attempts
+
+
+class DiscordOutbox:
+    """전송 전에 렌더링된 웹훅 메시지를 저장해 두는 SQLite 보관함.
+
+    여러 스레드/프로세스가 함께 비워도 같은 메시지를 두 번 보내지 않도록 claim()으로 가져간 메시지만 전송한다.
+    전송 성공 후 표시하기 전에 프로세스가 죽으면 해당 메시지는 다시 전송될 수 있다 (최소 1회 전송).
+    """
+
+    def __init__(self, path=None, retention_days=None, claim_timeout=None):
+        self.config = Config()
+        self.path = path or self.config.DISCORD_OUTBOX_PATH
+        retention_days = retention_days if retention_days is not None else self.config.DISCORD_OUTBOX_RETENTION_DAYS
+        self.claim_timeout = claim_timeout if claim_timeout is not None else self.config.DISCORD_OUTBOX_CLAIM_TIMEOUT
+        self.lock = threading.Lock()
+
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS outbox ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, batch TEXT NOT NULL, webhook_url TEXT NOT NULL, "
+                "payload TEXT NOT NULL, status TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0, "
+                "last_error TEXT, created_at REAL NOT NULL, sent_at REAL, claimed_at REAL)"
+            )
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(outbox)")}
+            if "claimed_at" not in columns:
+                self.conn.execute("ALTER TABLE outbox ADD COLUMN claimed_at REAL")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_outbox_status ON outbox (status, id)")
+
+        if retention_days:
+            self.purge(retention_days)
+
+    def enqueue(self, webhook_urls, payloads):
+        batch = uuid.uuid4().hex
+        now = time.time()
+
+        # 한 다이제스트의 메시지는 모든 대상에 대해 한 트랜잭션으로 저장해 일부만 남는 일이 없게 함
+        with self.lock:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT INTO outbox (batch, webhook_url, payload, created_at) VALUES (?, ?, ?, ?)",
+                    [
+                        (batch, webhook_url, json.dumps(payload, ensure_ascii=False), now)
+                        for webhook_url in webhook_urls
+                        for payload in payloads
+                    ]
+                )
+
+        return batch
+
+    def pending(self, batch=None):
+        query = "SELECT id, batch, webhook_url, payload, attempts FROM outbox WHERE status = 'pending'"
+        params = ()
+        if batch:
+            query += " AND batch = ?"
+            params = (batch,)
+
+        with self.lock:
+            rows = self.conn.execute(query + " ORDER BY id", params).fetchall()
+
+        return [OutboxEntry(id, batch, url, json.loads(payload), attempts) for id, batch, url, payload, attempts in rows]
+
+    def claim(self):
+        """보낼 메시지를 전송 중으로 표시하고 가져감.
+
+        다른 곳에서 전송 중인 웹훅의 메시지는 순서가 바뀌지 않도록 남겨 두고,
+        claim_timeout이 지나도록 끝나지 않은 전송은 중단된 것으로 보고 다시 가져간다.
+        """
+        now = time.time()
+        stale = now - self.claim_timeout
+
+        with self.lock:
+            with self.conn:
+                # 쓰기 잠금을 먼저 잡아 다른 프로세스와 같은 메시지를 동시에 가져가지 않게 함
+                self.conn.execute("BEGIN IMMEDIATE")
+                rows = self.conn.execute(
+                    "SELECT id, batch, webhook_url, payload, attempts FROM outbox "
+                    "WHERE (status = 'pending' OR (status = 'sending' AND claimed_at < ?)) "
+                    "AND webhook_url NOT IN ("
+                    "SELECT webhook_url FROM outbox WHERE status = 'sending' AND claimed_at >= ?) "
+                    "ORDER BY id",
+                    (stale, stale)
+                ).fetchall()
+                self.conn.executemany(
+                    "UPDATE outbox SET status = 'sending', claimed_at = ? WHERE id = ?",
+                    [(now, row[0]) for row in rows]
+                )
+
+        return [OutboxEntry(id, batch, url, json.loads(payload), attempts) for id, batch, url, payload, attempts in rows]
+
+    def release(self, entry_ids):
+        # 가져갔지만 보내지 않은 메시지를 다음 전송에서 다시 가져갈 수 있게 되돌림
+        with self.lock:
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE outbox SET status = 'pending', claimed_at = NULL WHERE id = ? AND status = 'sending'",
+                    [(entry_id,) for entry_id in entry_ids]
+                )
+
+    def mark_sent(self, entry_id):
+        with self.lock:
+            with self.conn:
+                self.conn.execute(
+                    "UPDATE outbox SET status = 'sent', attempts = attempts + 1, sent_at = ? WHERE id = ?",
+                    (time.time(), entry_id)
+                )
+
+    def mark_failed(self, entry_id, error, permanent=False):
+        with self.lock:
+            with self.conn:
+                self.conn.execute(
+                    "UPDATE outbox SET status = ?, attempts = attempts + 1, last_error = ?, claimed_at = NULL "
+                    "WHERE id = ?",
+                    ("failed" if permanent else "pending", error, entry_id)
+                )
+
+    def purge(self, retention_days):
+        cutoff = time.time() - retention_days * 86400
+        with self.lock:
+            with self.conn:
+                deleted = self.conn.execute(
+                    "DELETE FROM outbox WHERE status IN ('sent', 'failed') AND created_at < ?", (cutoff,)
+                ).rowcount
+        if deleted:
+            logger.debug(f"Discord 보관함에서 오래된 메시지 {deleted}개 삭제")
+
+    def stats(self):
+        with self.lock:
+            rows = self.conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+
+        stats = {"pending": 0, "sending": 0, "sent": 0, "failed": 0}
+        stats.update(dict(rows))
+        return stats
@@ -0,0 +1,165 @@
+import logging
+import threading
+import time
+from urllib.parse import urlparse
+
+from config import Config
+from metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+def _float_header(headers, name):
+    try:
+        return float(headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+def webhook_id(url):
+    # /api/webhooks/{id}/{token} 형식에서 웹훅 ID만 꺼냄 (형식이 다르면 경로 전체를 사용)
+    parts = urlparse(url).path.strip("/").split("/")
+    if "webhooks" in parts[:-1]:
+        return parts[parts.index("webhooks") + 1]
+    return urlparse(url).path
+
+
+class WebhookBucket:
+    """X-RateLimit-* 헤더로 알려진 Discord 버킷 상태"""
+
+    def __init__(self):
+        self.remaining = None
+        self.reset_at = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        # 보내도 되면 0, 아니면 기다릴 시간을 반환. 보낼 수 있으면 남은 횟수를 미리 차감
+        with self.lock:
+            now = time.monotonic()
+            if now >= self.reset_at:
+                self.remaining = None
+
+            if self.remaining is not None and self.remaining <= 0:
+                return self.reset_at - now
+
+            if self.remaining is not None:
+                self.remaining -= 1
+            return 0.0
+
+    def update(self, remaining, reset_after):
+        with self.lock:
+            if remaining is not None:
+                self.remaining = int(remaining)
+            if reset_after is not None:
+                self.reset_at = time.monotonic() + reset_after
+
+    def block(self, retry_after):
+        with self.lock:
+            self.remaining = 0
+            self.reset_at = max(self.reset_at, time.monotonic() + retry_after)
+
+
+class DiscordRateLimiter:
+    def __init__(self):
+        self.routes = {}
+        self.buckets = {}
+        self.global_until = 0.0
+        self.lock = threading.Lock()
+        self.rate_limited = 0
+
+    def _key(self, url):
+        # X-RateLimit-Bucket 값에는 웹훅 ID 같은 주요 파라미터가 빠져 있어 여러 웹훅이 같은 값을 받으므로,
+        # 실제 제한 단위인 (버킷 값, 웹훅 ID)로 구분
+        return self.routes.get(url), webhook_id(url)
+
+    def bucket(self, url):
+        with self.lock:
+            return self.buckets.setdefault(self._key(url), WebhookBucket())
+
+    def wait(self, url):
+        while True:
+            delay = self.global_until - time.monotonic()
+            if delay <= 0:
+                # 전역 제한이 풀린 뒤에 한 번만 차감해 한 요청이 여러 자리를 쓰지 않게 함
+                delay = self.bucket(url).reserve()
+                if delay <= 0:
+                    return
+
+            logger.debug(f"Discord 버킷 대기 {delay:.2f}초")
+            time.sleep(delay)
+
+    def update(self, url, response):
+        headers = response.headers
+        bucket_hash = headers.get("X-RateLimit-Bucket")
+        if bucket_hash:
+            with self.lock:
+                if self.routes.get(url) != bucket_hash:
+                    previous = self.buckets.pop(self._key(url), None)
+                    self.routes[url] = bucket_hash
+                    self.buckets.setdefault(self._key(url), previous or WebhookBucket())
+
+        self.bucket(url).update(
+            _float_header(headers, "X-RateLimit-Remaining"),
+            _float_header(headers, "X-RateLimit-Reset-After"),
+        )
+
+    def retry_after(self, url, response):
+        # 429 응답이 요청한 만큼 정확히 기다리도록 본문의 retry_after를 우선 사용
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+
+        retry_after = body.get("retry_after")
+        if retry_after is None:
+            retry_after = _float_header(response.headers, "Retry-After")
+        if retry_after is None:
+            retry_after = _float_header(response.headers, "X-RateLimit-Reset-After") or 1.0
+
+        self.rate_limited += 1
+        get_metrics().incr("discord_rate_limited", scope="global" if body.get("global") else "webhook")
+        if body.get("global") or response.headers.get("X-RateLimit-Global"):
+            with self.lock:
+                self.global_until = max(self.global_until, time.monotonic() + retry_after)
+        else:
+            self.bucket(url).block(retry_after)
+
+        return retry_after
+
+    def post(self, http, url, max_retries=None, **kwargs):
+        """버킷이 허용할 때 보내고, 429면 Discord가 요청한 시간만큼 기다린 뒤 다시 보냄.
+
+        429는 메시지가 처리되지 않았다는 뜻이라 다시 보내도 중복되지 않지만,
+        응답 시간 초과는 전송 여부를 알 수 없으므로 재시도하지 않는다.
+        """
+        max_retries = max_retries if max_retries is not None else Config.DISCORD_MAX_RETRIES
+
+        for attempt in range(max_retries + 1):
+            self.wait(url)
+            response = http.post(url, **kwargs)
+            self.update(url, response)
+
+            if response.status_code != 429:
+                return response
+
+            retry_after = self.retry_after(url, response)
+            if attempt == max_retries:
+                logger.warning(f"Discord 요청 제한 (429)이 계속되어 재시도를 중단합니다 ({max_retries}회 재시도)")
+            else:
+                logger.info(f"Discord 요청 제한 (429), {retry_after:.2f}초 후 재시도 ({attempt + 1}/{max_retries})")
+
+        return response
+
+
+_discord_rate_limiter = None
+_discord_rate_limiter_lock = threading.Lock()
+
+
+def get_discord_rate_limiter():
+    global _discord_rate_limiter
+
+    with _discord_rate_limiter_lock:
+        if _discord_rate_limiter is None:
+            _discord_rate_limiter = DiscordRateLimiter()
+
+    return _discord_rate_limiter
@@ -1,7 +1,15 @@
-import requests
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from config import Config
+from discord_embeds import pack_embeds
+from discord_outbox import DiscordOutbox, OutboxEntry
+from discord_ratelimit import get_discord_rate_limiter
+from http_client import get_http_client
+from metrics import get_metrics, in_current_run
+from post_history import open_post_history
+from rate_limiter import backoff_delay
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -11,7 +19,146 @@ logger = logging.getLogger(__name__)
 class DiscordSender:
     def __init__(self):
         self.config = Config()
-        self.webhook_url = self.config.DISCORD_WEBHOOK_URL
+        self.webhook_urls = self.config.DISCORD_WEBHOOK_URLS
+        self.webhook_url = self.webhook_urls[0] if self.webhook_urls else None
+        self.last_results = {}
+        self.http = get_http_client()
+        self.rate_limiter = get_discord_rate_limiter()
+        self.outbox = None
+
+        if self.config.DISCORD_OUTBOX:
+            try:
+                self.outbox = DiscordOutbox()
+            except Exception as e:
+                logger.warning(f"Discord 보관함 초기화 실패, 바로 전송합니다: {str(e)}")
+
+    def _post(self, payload, webhook_url=None):
+        return self.rate_limiter.post(
+            self.http,
+            webhook_url or self.webhook_url,
+            data=json.dumps(payload),
+            headers={'Content-Type': 'application/json'}
+        )
+
+    def _deliver(self, entry):
+        # (전송 여부, 재시도해도 소용없는 실패인지, 에러 내용)을 반환
+        for attempt in range(self.config.DISCORD_DELIVERY_RETRIES + 1):
+            try:
+                response = self._post(entry.payload, entry.webhook_url)
+            except Exception as e:
+                # 응답을 받지 못한 경우 전송 여부를 알 수 없으므로 보관함에 남겨 다음에 다시 보냄
+                return False, False, str(e)
+
+            if response.status_code in (200, 204):
+                return True, False, None
+
+            error = f"{response.status_code} - {response.text[:200]}"
+            if response.status_code < 500:
+                return False, response.status_code != 429, error
+
+            # Discord 서버 오류는 메시지가 처리되지 않은 것이므로 잠시 후 다시 보냄
+            if attempt < self.config.DISCORD_DELIVERY_RETRIES:
+                time.sleep(backoff_delay(attempt, base=self.config.DISCORD_BACKOFF_BASE,
+                                         maximum=self.config.DISCORD_BACKOFF_MAX))
+
+        return False, False, error
+
+    @staticmethod
+    def target_name(webhook_url):
+        # 로그에 웹훅 토큰이 남지 않도록 ID까지만 표시
+        parts = webhook_url.rstrip("/").split("/")
+        return f"webhook {parts[-2]}" if len(parts) >= 2 else "webhook"
+
+    def _drain(self, entries):
+        """한 웹훅의 메시지를 순서대로 전송. 모두 전송되면 True"""
+        done = 0
+        try:
+            success, done = self._drain_entries(entries)
+            return success
+        finally:
+            # 중간에 멈춘 경우 보내지 않은 메시지는 다음 전송에서 다시 가져가도록 되돌림
+            unsent = [entry.id for entry in entries[done:] if entry.id is not None]
+            if self.outbox and unsent:
+                self.outbox.release(unsent)
+
+    def _drain_entries(self, entries):
+        # (모두 전송했는지, 처리한 메시지 수)를 반환
+        success = True
+
+        for n, entry in enumerate(entries):
+            delivered, permanent, error = self._deliver(entry)
+            name = self.target_name(entry.webhook_url)
+
+            get_metrics().incr("discord_messages", result="sent" if delivered else "failed")
+            if delivered:
+                if self.outbox and entry.id is not None:
+                    self.outbox.mark_sent(entry.id)
+                logger.info(f"[{name}] 메시지 {n + 1}/{len(entries)} 전송 완료 (임베드 {len(entry.payload.get('embeds', []))}개)")
+                continue
+
+            permanent = permanent or entry.attempts + 1 >= self.config.DISCORD_OUTBOX_MAX_ATTEMPTS
+            if self.outbox and entry.id is not None:
+                self.outbox.mark_failed(entry.id, error, permanent)
+            success = False
+
+            if permanent:
+                logger.error(f"[{name}] 메시지 {n + 1} 전송 실패: {error} (재시도 중단)")
+                continue
+
+            # 앞 메시지가 실패하면 순서가 바뀌지 않도록 뒤 메시지도 미룸
+            logger.error(f"[{name}] 메시지 {n + 1} 전송 실패: {error} (보관함에 남겨 다음에 다시 보냄)")
+            return False, n + 1
+
+        return success, len(entries)
+
+    def _drain_all(self, entries):
+        # 웹훅마다 버킷이 따로 있으므로 대상별로 동시에 전송하고 결과도 대상별로 기록
+        targets = {}
+        for entry in entries:
+            targets.setdefault(entry.webhook_url, []).append(entry)
+
+        if not targets:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            futures = {
+                url: executor.submit(in_current_run(self._drain), target_entries)
+                for url, target_entries in targets.items()
+            }
+            results = {url: future.result() for url, future in futures.items()}
+
+        self.last_results.update(results)
+        return results
+
+    def _send_payloads(self, webhook_urls, payloads):
+        if not self.outbox:
+            return self._drain_all([
+                OutboxEntry(None, None, webhook_url, payload, 0)
+                for webhook_url in webhook_urls
+                for payload in payloads
+            ])
+
+        # 전송 전에 먼저 보관함에 저장해, 중간에 실패해도 재시작 시 남은 메시지만 다시 보냄.
+        # 앞서 전송하지 못한 메시지가 있으면 순서가 바뀌지 않도록 함께 보냄
+        batch = self.outbox.enqueue(webhook_urls, payloads)
+        results = self._drain_all(self.outbox.claim())
+
+        # 다른 곳에서 같은 웹훅으로 전송 중이면 가져가지 못함. 그 전송이 중단됐을 수도 있으므로
+        # 기다리지 않고 보관함에 남겨 두면, 다음 보관함 전송에서 보내거나 만료된 전송을 이어받음
+        blocked = {entry.webhook_url for entry in self.outbox.pending(batch)} - set(results)
+        if blocked:
+            logger.info(f"다른 전송이 진행 중인 웹훅 {len(blocked)}개의 메시지는 보관함에 남겨 다음 전송에서 보냅니다.")
+
+        return results
+
+    def flush_outbox(self):
+        if not self.outbox:
+            return True
+
+        entries = self.outbox.claim()
+        if entries:
+            logger.info(f"Discord 보관함에 남은 메시지 {len(entries)}개를 전송합니다.")
+        return all(self._drain_all(entries).values())
 
     def create_embed(self, post, index):
         description_text = ""
@@ -21,14 +168,18 @@ class DiscordSender:
         elif post.get('description'):
             description_text = post.get('description', '')[:2000]
 
+        footer_text = "Daily.dev Bot • 본문 번역됨" if post.get('content') else "Daily.dev Bot"
+        if post.get('repeat'):
+            footer_text += " • 이전에 소개된 게시글"
+
         embed = {
-            "title": f"🔥 [{index + 1}] {post.get('title', 'Unknown Title')[:256]}",
+            "title": f"{'🔁' if post.get('repeat') else '🔥'} [{index + 1}] {post.get('title', 'Unknown Title')[:256]}",
             "url": post.get('link', ''),
             "description": description_text,
             "color": 0x7289da,
             "timestamp": datetime.utcnow().isoformat(),
             "footer": {
-                "text": "Daily.dev Bot • 본문 번역됨" if post.get('content') else "Daily.dev Bot",
+                "text": footer_text,
                 "icon_url": "https://daily.dev/favicon.ico"
             }
         }
@@ -54,89 +205,88 @@ class DiscordSender:
 
         return embed
 
-    def send_daily_posts(self, posts):
-        try:
-            if not self.webhook_url:
-                logger.error("Discord 웹훅 URL이 설정되지 않았습니다.")
-                return False
+    def create_header_embed(self, count=None):
+        # 스트리밍 전송에서는 헤더를 보낼 때 전체 게시글 수를 알 수 없으므로 개수를 생략
+        summary = f"상위 {count}개 게시글을 가져왔습니다!" if count is not None else "인기 게시글을 가져왔습니다!"
+        return {
+            "title": "📰 오늘의 Daily.dev 인기 게시글",
+            "description": f"**{datetime.now().strftime('%Y년 %m월 %d일')}** 기준 {summary} 🚀",
+            "color": 0x3498db,
+            "timestamp": datetime.utcnow().isoformat(),
+            "thumbnail": {
+                "url": "https://daily.dev/favicon.ico"
+            }
+        }
 
-            if not posts:
-                logger.warning("전송할 게시글이 없습니다.")
-                return False
+    def create_footer_embed(self):
+        return {
+            "description": "---\n✅ **모든 게시글 전송 완료!**\n더 많은 개발 소식은 [Daily.dev](https://daily.dev)에서 확인하세요!",
+            "color": 0x27ae60,
+            "timestamp": datetime.utcnow().isoformat()
+        }
 
-            header_embed = {
-                "title": "📰 오늘의 Daily.dev 인기 게시글",
-                "description": f"**{datetime.now().strftime('%Y년 %m월 %d일')}** 기준 상위 {len(posts)}개 게시글을 가져왔습니다! 🚀",
-                "color": 0x3498db,
-                "timestamp": datetime.utcnow().isoformat(),
-                "thumbnail": {
-                    "url": "https://daily.dev/favicon.ico"
-                }
-            }
+    def send_embeds(self, embeds, posts=()):
+        """임베드를 메시지로 묶어 모든 대상에 전송하고 대상별 성공 여부를 반환"""
+        messages = pack_embeds(embeds)
+        logger.info(f"임베드 {len(embeds)}개를 메시지 {len(messages)}개로 묶어 전송합니다.")
 
-            header_payload = {
-                "embeds": [header_embed],
+        payloads = [
+            {
+                "embeds": message_embeds,
                 "username": "Daily.dev Bot",
                 "avatar_url": "https://daily.dev/favicon.ico"
             }
+            for message_embeds in messages
+        ]
 
-            response = requests.post(
-                self.webhook_url,
-                data=json.dumps(header_payload),
-                headers={'Content-Type': 'application/json'}
-            )
+        with get_metrics().span("discord_send"):
+            results = self._send_payloads(self.webhook_urls, payloads)
 
-            if response.status_code != 204:
-                logger.error(f"헤더 메시지 전송 실패: {response.status_code}")
+        # 보관함에 남은 메시지는 이후에 전송되므로 전송한 게시글로 기록
+        if posts and (self.outbox or all(results.values())):
+            self._record_delivered(posts)
 
-            for i, post in enumerate(posts):
-                embed = self.create_embed(post, i)
+        return results
 
-                payload = {
-                    "embeds": [embed],
-                    "username": "Daily.dev Bot",
-                    "avatar_url": "https://daily.dev/favicon.ico"
-                }
+    def send_daily_posts(self, posts):
+        try:
+            if not self.webhook_urls:
+                logger.error("Discord 웹훅 URL이 설정되지 않았습니다.")
+                return False
 
-                response = requests.post(
-                    self.webhook_url,
-                    data=json.dumps(payload),
-                    headers={'Content-Type': 'application/json'}
-                )
+            if not posts:
+                logger.warning("전송할 게시글이 없습니다.")
+                return False
 
-                if response.status_code == 204:
-                    logger.info(f"게시글 {i + 1}/{len(posts)} 전송 완료")
-                else:
-                    logger.error(f"게시글 {i + 1} 전송 실패: {response.status_code} - {response.text}")
+            embeds = [self.create_header_embed(len(posts))]
+            embeds += [self.create_embed(post, i) for i, post in enumerate(posts)]
+            embeds.append(self.create_footer_embed())
 
-                import time
-                time.sleep(1)
+            self.last_results = {}
+            results = self.send_embeds(embeds, posts)
 
-            footer_embed = {
-                "description": "---\n✅ **모든 게시글 전송 완료!**\n더 많은 개발 소식은 [Daily.dev](https://daily.dev)에서 확인하세요!",
-                "color": 0x27ae60,
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            delivered = sum(1 for success in results.values() if success)
+            logger.info(f"총 {len(posts)}개 게시글 Discord 전송: 대상 {len(results)}곳 중 {delivered}곳 완료")
+            for webhook_url, success in results.items():
+                if not success:
+                    logger.error(f"[{self.target_name(webhook_url)}] 일부 메시지 전송 실패")
 
-            footer_payload = {
-                "embeds": [footer_embed],
-                "username": "Daily.dev Bot",
-                "avatar_url": "https://daily.dev/favicon.ico"
-            }
-
-            requests.post(
-                self.webhook_url,
-                data=json.dumps(footer_payload),
-                headers={'Content-Type': 'application/json'}
-            )
-
-            logger.info(f"총 {len(posts)}개 게시글 Discord 전송 완료")
-            return True
+            return delivered == len(results)
 
         except Exception as e:
             logger.error(f"Discord 전송 실패: {str(e)}")
             return False
 
+    def _record_delivered(self, posts):
+        history = open_post_history()
+        if not history:
+            return
+
+        try:
+            history.record_delivered([post for post in posts if post.get('link')])
+        except Exception as e:
+            logger.warning(f"전송 기록 저장 실패: {str(e)}")
+
     def send_error_notification(self, error_message):
         try:
             embed = {
@@ -155,13 +305,14 @@ class DiscordSender:
                 "avatar_url": "https://daily.dev/favicon.ico"
             }
 
-            response = requests.post(
-                self.webhook_url,
-                data=json.dumps(payload),
-                headers={'Content-Type': 'application/json'}
-            )
+            delivered = False
+            for webhook_url in self.webhook_urls:
+                try:
+                    delivered = self._post(payload, webhook_url).status_code == 204 or delivered
+                except Exception as e:
+                    logger.error(f"[{self.target_name(webhook_url)}] 에러 알림 전송 실패: {str(e)}")
 
-            return response.status_code == 204
+            return delivered
 
         except Exception as e:
             logger.error(f"에러 알림 전송 실패: {str(e)}")
@@ -0,0 +1,210 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from config import Config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MEMORY_USAGE_SCRIPT = "return performance.memory ? performance.memory.usedJSHeapSize : 0;"
+
+
+class DriverPool:
+    def __init__(self, factory, size=2, max_uses=20, max_memory_mb=0):
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.max_memory_mb = max_memory_mb
+
+        self._idle = []
+        self._uses = {}
+        self._created = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def warm_up(self):
+        with self._condition:
+            missing = self.size - self._created
+            self._created += missing
+
+        for _ in range(missing):
+            try:
+                driver = self.factory()
+            except Exception as e:
+                logger.error(f"드라이버 사전 실행 실패: {str(e)}")
+                with self._condition:
+                    self._created -= 1
+                    self._condition.notify()
+                continue
+
+            with self._condition:
+                self._uses[id(driver)] = 0
+                self._idle.append(driver)
+                self._condition.notify()
+
+        logger.info(f"드라이버 풀 준비 완료 ({len(self._idle)}/{self.size}개 대기 중)")
+
+    def acquire(self, timeout=None):
+        deadline = time.monotonic() + timeout if timeout else None
+
+        while True:
+            driver = None
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("드라이버 풀이 종료되었습니다.")
+
+                    if self._idle:
+                        driver = self._idle.pop()
+                        break
+
+                    if self._created < self.size:
+                        self._created += 1
+                        break
+
+                    remaining = deadline - time.monotonic() if deadline else None
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("사용 가능한 드라이버가 없습니다.")
+                    self._condition.wait(remaining)
+
+            if driver is None:
+                try:
+                    driver = self.factory()
+                except Exception:
+                    with self._condition:
+                        self._created -= 1
+                        self._condition.notify()
+                    raise
+
+                self._uses[id(driver)] = 0
+                logger.info("드라이버 풀에 새 드라이버를 추가했습니다.")
+                return driver
+
+            if self._is_healthy(driver):
+                return driver
+
+            logger.warning("응답하지 않는 드라이버를 폐기합니다.")
+            self._discard(driver)
+
+    def release(self, driver, broken=False):
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+
+        if broken or not self._is_healthy(driver):
+            logger.warning("비정상 드라이버를 폐기합니다.")
+            self._discard(driver)
+            return
+
+        if self.max_uses and self._uses[id(driver)] >= self.max_uses:
+            logger.info(f"드라이버 사용 횟수 {self._uses[id(driver)]}회 도달, 재생성합니다.")
+            self._discard(driver)
+            return
+
+        memory_mb = self._memory_usage_mb(driver)
+        if self.max_memory_mb and memory_mb > self.max_memory_mb:
+            logger.info(f"드라이버 메모리 {memory_mb:.0f}MB 초과, 재생성합니다.")
+            self._discard(driver)
+            return
+
+        self._reset_windows(driver)
+
+        with self._condition:
+            if self._closed:
+                self._quit(driver)
+                return
+            self._idle.append(driver)
+            self._condition.notify()
+
+    @contextmanager
+    def lease(self, timeout=None):
+        driver = self.acquire(timeout)
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            broken = True
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+
+        for driver in idle:
+            self._quit(driver)
+            with self._condition:
+                self._created -= 1
+
+        logger.info("드라이버 풀 종료")
+
+    def stats(self):
+        with self._condition:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "idle": len(self._idle),
+                "in_use": self._created - len(self._idle)
+            }
+
+    def _discard(self, driver):
+        self._quit(driver)
+        with self._condition:
+            self._created -= 1
+            self._condition.notify()
+
+    def _quit(self, driver):
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"드라이버 종료 실패 (무시됨): {str(e)}")
+
+    def _is_healthy(self, driver):
+        try:
+            return driver.execute_script("return 1;") == 1 and bool(driver.window_handles)
+        except Exception:
+            return False
+
+    def _memory_usage_mb(self, driver):
+        try:
+            return (driver.execute_script(MEMORY_USAGE_SCRIPT) or 0) / (1024 * 1024)
+        except Exception:
+            return 0
+
+    def _reset_windows(self, driver):
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+        except Exception as e:
+            logger.debug(f"탭 정리 실패 (무시됨): {str(e)}")
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool():
+    global _pool
+
+    if Config.DRIVER_POOL_SIZE <= 0:
+        return None
+
+    with _pool_lock:
+        if _pool is None:
+            from daily_scraper import create_logged_in_driver
+
+            _pool = DriverPool(
+                create_logged_in_driver,
+                size=Config.DRIVER_POOL_SIZE,
+                max_uses=Config.DRIVER_POOL_MAX_USES,
+                max_memory_mb=Config.DRIVER_POOL_MAX_MEMORY_MB
+            )
+
+    return _pool
@@ -0,0 +1,108 @@
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def parse_host_pool_sizes(value):
+    # "translate.googleapis.com=8,discord.com=2" 형식
+    sizes = {}
+    for item in (value or "").split(","):
+        host, _, size = item.partition("=")
+        if host.strip() and size.strip().isdigit():
+            sizes[host.strip().lower()] = int(size)
+    return sizes
+
+
+class HttpClient:
+    """프로세스 전체에서 공유하는 keep-alive HTTP 세션"""
+
+    def __init__(self, config=None):
+        self.config = config or Config()
+        self.timeout = (self.config.HTTP_CONNECT_TIMEOUT, self.config.HTTP_READ_TIMEOUT)
+        self.session = requests.Session()
+        self.adapters = {}
+
+        self._mount("https://", self.config.HTTP_POOL_MAXSIZE)
+        self._mount("http://", self.config.HTTP_POOL_MAXSIZE)
+        for host, size in parse_host_pool_sizes(self.config.HTTP_HOST_POOL_SIZES).items():
+            self._mount(f"https://{host}/", size)
+
+    def _retry(self):
+        # 응답 코드에 따른 재시도(429 등)는 호출하는 쪽에서 처리하고,
+        # 여기서는 요청이 서버에 닿기 전의 연결 실패만 재시도 (POST 중복 전송 방지)
+        return Retry(
+            total=self.config.HTTP_MAX_RETRIES,
+            connect=self.config.HTTP_MAX_RETRIES,
+            read=0,
+            status=0,
+            backoff_factor=self.config.HTTP_RETRY_BACKOFF,
+            raise_on_status=False,
+        )
+
+    def _mount(self, prefix, pool_size):
+        adapter = HTTPAdapter(
+            pool_connections=self.config.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=pool_size,
+            max_retries=self._retry(),
+        )
+        self.session.mount(prefix, adapter)
+        self.adapters[prefix] = adapter
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def stats(self):
+        stats = {}
+        for adapter in self.adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+
+                host = stats.setdefault(pool.host, {"connections": 0, "requests": 0, "reused": 0})
+                host["connections"] += pool.num_connections
+                host["requests"] += pool.num_requests
+                host["reused"] += max(0, pool.num_requests - pool.num_connections)
+
+        return stats
+
+    def log_summary(self):
+        for host, stats in sorted(self.stats().items()):
+            if not stats["requests"]:
+                continue
+            logger.info(
+                f"HTTP 연결 재사용 - {host}: 요청 {stats['requests']}회, "
+                f"새 연결 {stats['connections']}개, 재사용 {stats['reused']}회"
+            )
+
+    def close(self):
+        self.session.close()
+
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client():
+    global _http_client
+
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = HttpClient()
+
+    return _http_client
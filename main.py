@@ -1,8 +1,11 @@
+import time
+
+STARTUP_STARTED = time.perf_counter()
+
 import sys
 import argparse
 import logging
 from config import Config
-from scheduler import DailyBotScheduler
 
 logging.basicConfig(
     level=logging.INFO,
@@ -20,8 +23,8 @@ def validate_config():
     config = Config()
     errors = []
 
-    if not config.DISCORD_WEBHOOK_URL:
-        errors.append("DISCORD_WEBHOOK_URL이 설정되지 않았습니다.")
+    if not config.DISCORD_WEBHOOK_URLS:
+        errors.append("DISCORD_WEBHOOK_URL 또는 DISCORD_WEBHOOK_URLS가 설정되지 않았습니다.")
 
     if not config.DAILY_DEV_EMAIL:
         errors.append("DAILY_DEV_EMAIL이 설정되지 않았습니다.")
@@ -29,6 +32,13 @@ def validate_config():
     if not config.DAILY_DEV_PASSWORD:
         errors.append("DAILY_DEV_PASSWORD가 설정되지 않았습니다.")
 
+    from cron_schedule import load_schedules
+
+    try:
+        load_schedules(config)
+    except ValueError as e:
+        errors.append(f"스케줄 설정 오류: {str(e)}")
+
     if errors:
         logger.error("설정 오류:")
         for error in errors:
@@ -39,6 +49,10 @@ def validate_config():
     return True
 
 
+def log_startup_time(mode):
+    logger.info(f"시작 소요 시간 ({mode}): {time.perf_counter() - STARTUP_STARTED:.3f}초")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Daily.dev Bot")
     parser.add_argument("--run-once", action="store_true", help="즉시 한 번 실행")
@@ -50,6 +64,7 @@ def main():
     if args.validate:
         if validate_config():
             logger.info("모든 설정이 올바르게 구성되었습니다.")
+        log_startup_time("validate")
         sys.exit(0)
 
     if not validate_config():
@@ -64,6 +79,7 @@ def main():
             import uvicorn
             from web_api import app
 
+            log_startup_time("api")
             uvicorn.run(
                 app,
                 host="0.0.0.0",
@@ -91,12 +107,18 @@ def main():
 
         elif args.run_once:
             logger.info("즉시 실행 모드")
+            from scheduler import DailyBotScheduler
+
             scheduler = DailyBotScheduler()
+            log_startup_time("run-once")
             scheduler.run_once()
 
         else:
             logger.info("스케줄러 모드로 시작")
+            from scheduler import DailyBotScheduler
+
             scheduler = DailyBotScheduler()
+            log_startup_time("scheduler")
             scheduler.start_scheduler()
 
     except KeyboardInterrupt:
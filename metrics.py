@@ -0,0 +1,230 @@
+import contextvars
+import functools
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_PREFIX = "dailybot"
+
+# 스케줄러와 API 요청이 동시에 실행될 수 있으므로 진행 중인 실행은 컨텍스트마다 따로 둠
+_current_run = contextvars.ContextVar("current_run", default=None)
+
+
+def _label_key(labels):
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key):
+    if not key:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in key) + "}"
+
+
+class RunMetrics:
+    """한 번의 실행 동안의 단계별/게시글별 시간과 카운터"""
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.started_at = time.time()
+        self.started = time.perf_counter()
+        self.finished_at = None
+        self.duration = None
+        self.status = "running"
+        self.stages = {}
+        self.posts = []
+        self.counters = {}
+
+    def to_dict(self):
+        return {
+            "kind": self.kind,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration_seconds": self.duration,
+            "status": self.status,
+            "stages": {stage: dict(stats) for stage, stats in self.stages.items()},
+            "posts": [dict(post) for post in self.posts],
+            "counters": {
+                name + _format_labels(key): value for (name, key), value in sorted(self.counters.items())
+            },
+        }
+
+
+class MetricsRegistry:
+    def __init__(self, history_size=None):
+        self.lock = threading.Lock()
+        self.runs = deque(maxlen=history_size or Config.METRICS_HISTORY_RUNS)
+        self.run_totals = {}
+        self.counters = {}
+        self.stage_totals = {}
+
+    def start_run(self, kind):
+        run = RunMetrics(kind)
+        with self.lock:
+            self.runs.append(run)
+        _current_run.set(run)
+        return run
+
+    def finish_run(self, status="success"):
+        run = _current_run.get()
+        if run is None:
+            return None
+
+        with self.lock:
+            run.finished_at = time.time()
+            run.duration = time.perf_counter() - run.started
+            run.status = status
+            self.run_totals[status] = self.run_totals.get(status, 0) + 1
+        _current_run.set(None)
+
+        logger.info(
+            f"실행 시간 요약: 총 {run.duration:.1f}초 - "
+            + ", ".join(f"{name} {stats['seconds']:.1f}초" for name, stats in
+                        sorted(run.stages.items(), key=lambda item: item[1]["seconds"], reverse=True))
+        )
+        return run
+
+    def observe(self, stage, seconds, post=None):
+        with self.lock:
+            totals = self.stage_totals.setdefault(stage, {"seconds": 0.0, "count": 0})
+            totals["seconds"] += seconds
+            totals["count"] += 1
+
+            run = _current_run.get()
+            if run is None:
+                return
+
+            stats = run.stages.setdefault(stage, {"seconds": 0.0, "count": 0})
+            stats["seconds"] += seconds
+            stats["count"] += 1
+
+            if post:
+                run.posts.append({
+                    "post": post,
+                    "stage": stage,
+                    "offset_seconds": time.perf_counter() - run.started - seconds,
+                    "seconds": seconds,
+                })
+
+    def mark_post(self, stage, post):
+        # 단계 시간에 더하지 않고 실행 시작 후 게시글이 해당 단계에 도달한 시점만 기록
+        with self.lock:
+            run = _current_run.get()
+            if run is None:
+                return
+
+            run.posts.append({
+                "post": post,
+                "stage": stage,
+                "offset_seconds": time.perf_counter() - run.started,
+                "seconds": 0.0,
+            })
+
+    @contextmanager
+    def span(self, stage, post=None):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started, post)
+
+    def incr(self, name, value=1, **labels):
+        key = (name, _label_key(labels))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+            run = _current_run.get()
+            if run is not None:
+                run.counters[key] = run.counters.get(key, 0) + value
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "runs": [run.to_dict() for run in self.runs],
+                "run_totals": dict(self.run_totals),
+                "stages": {stage: dict(totals) for stage, totals in self.stage_totals.items()},
+                "counters": {
+                    name + _format_labels(key): value for (name, key), value in sorted(self.counters.items())
+                },
+            }
+
+    def to_prometheus(self):
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            full_name = f"{PROMETHEUS_PREFIX}_{name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            for suffix, key, value in samples:
+                lines.append(f"{full_name}{suffix}{_format_labels(key)} {value}")
+
+        with self.lock:
+            metric("runs_total", "counter", "Completed runs by status.",
+                   [("", _label_key({"status": status}), count) for status, count in sorted(self.run_totals.items())])
+
+            stage_samples = []
+            for stage, totals in sorted(self.stage_totals.items()):
+                key = _label_key({"stage": stage})
+                stage_samples.append(("_sum", key, round(totals["seconds"], 6)))
+                stage_samples.append(("_count", key, totals["count"]))
+            metric("stage_seconds", "summary", "Time spent per pipeline stage.", stage_samples)
+
+            counter_names = sorted({name for name, _ in self.counters})
+            for name in counter_names:
+                metric(f"{name}_total", "counter", f"Total {name.replace('_', ' ')}.",
+                       [("", key, value) for (counter, key), value in sorted(self.counters.items()) if counter == name])
+
+            finished = [run for run in self.runs if run.finished_at is not None]
+            if finished:
+                last = finished[-1]
+                metric("last_run_duration_seconds", "gauge", "Duration of the last finished run.",
+                       [("", (), round(last.duration, 6))])
+                metric("last_run_timestamp_seconds", "gauge", "Finish time of the last run.",
+                       [("", (), round(last.finished_at, 3))])
+                metric("last_run_stage_seconds", "gauge", "Per-stage time in the last finished run.",
+                       [("", _label_key({"stage": stage}), round(stats["seconds"], 6))
+                        for stage, stats in sorted(last.stages.items())])
+
+        return "\n".join(lines) + "\n"
+
+
+def in_current_run(func):
+    """다른 스레드에서 실행할 함수가 지금 진행 중인 실행에 기록하도록 컨텍스트를 복사해 묶음.
+
+    컨텍스트는 한 번에 한 스레드에서만 쓸 수 있으므로 스레드마다 따로 호출해야 한다.
+    """
+    return functools.partial(contextvars.copy_context().run, func)
+
+
+def instrument_driver(driver):
+    # 모든 WebDriver 명령은 execute를 거치므로 여기서 명령 종류별로 셈
+    original_execute = driver.execute
+
+    def execute(driver_command, params=None):
+        get_metrics().incr("webdriver_commands", command=driver_command)
+        return original_execute(driver_command, params)
+
+    driver.execute = execute
+    return driver
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics():
+    global _metrics
+
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = MetricsRegistry()
+
+    return _metrics
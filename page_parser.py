@@ -0,0 +1,159 @@
+import argparse
+import json
+import logging
+import time
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+import scraper_selectors
+from config import Config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class DailyDevPageParser:
+    def __init__(self, base_url=None):
+        self.config = Config()
+        self.base_url = base_url or self.config.DAILY_DEV_URL
+
+    def _text(self, element, separator=" "):
+        return element.get_text(separator, strip=True)
+
+    def _select_one(self, root, selector):
+        try:
+            return root.select_one(selector)
+        except Exception:
+            return None
+
+    def _resolve(self, href):
+        return href if href.startswith("http") else urljoin(self.base_url, href)
+
+    def find_cards(self, soup):
+        for selector in scraper_selectors.POST_SELECTORS:
+            try:
+                elements = soup.select(selector)
+            except Exception:
+                continue
+
+            if len(elements) > 2:
+                logger.info(f"게시글 요소 발견: {selector} ({len(elements)}개)")
+                return elements
+
+        return []
+
+    def extract_card(self, element):
+        title = ""
+        title_element = None
+
+        for selector in scraper_selectors.TITLE_SELECTORS:
+            found = self._select_one(element, selector)
+            if found is None:
+                continue
+
+            title_element = found
+            title = found.get("title") or self._text(found)
+            if title and len(title) > 10:
+                break
+
+        if not title or len(title) <= 10:
+            return None
+
+        link = ""
+        for selector in scraper_selectors.LINK_SELECTORS:
+            found = self._select_one(element, selector)
+            if found is None:
+                continue
+
+            href = found.get("href")
+            if href and ("http" in href or "/posts/" in href):
+                link = self._resolve(href)
+                break
+
+        if not link and title_element is not None:
+            parent_link = title_element.find_parent("a", href=True)
+            if parent_link is not None:
+                link = self._resolve(parent_link["href"])
+
+        description = ""
+        for selector in scraper_selectors.DESC_SELECTORS:
+            found = self._select_one(element, selector)
+            if found is None:
+                continue
+
+            desc_text = self._text(found, "\n")
+            if desc_text and len(desc_text) > 20:
+                description = desc_text[:300]
+                break
+
+        tags = []
+        try:
+            tag_texts = [self._text(tag) for tag in element.select(scraper_selectors.TAG_SELECTOR)[:3]]
+            tags = [text for text in tag_texts if text and len(text) > 1]
+        except Exception:
+            pass
+
+        return {
+            "title": title,
+            "link": link,
+            "description": description,
+            "tags": tags
+        }
+
+    def extract_cards(self, html, max_cards=None):
+        """게시글 요소를 찾지 못하면 None (호출한 쪽이 다른 추출 방식으로 전환할 수 있도록)"""
+        soup = BeautifulSoup(html, "lxml")
+        elements = self.find_cards(soup)
+        if not elements:
+            return None
+
+        if max_cards:
+            elements = elements[:max_cards]
+
+        cards = []
+        for i, element in enumerate(elements):
+            try:
+                card = self.extract_card(element)
+                if card:
+                    cards.append(card)
+            except Exception as e:
+                logger.warning(f"게시글 {i + 1} 처리 중 오류: {str(e)}")
+
+        return cards
+
+    def parse(self, html, limit=10):
+        posts = []
+
+        for card in self.extract_cards(html, max_cards=limit * 2) or []:
+            posts.append({
+                "title": card["title"],
+                "link": card["link"] or f"https://app.daily.dev/search?q={card['title'][:50]}",
+                "description": card["description"],
+                "content": "",
+                "tags": card["tags"]
+            })
+
+            if len(posts) >= limit:
+                break
+
+        return posts
+
+    def parse_file(self, path, limit=10):
+        with open(path, "r", encoding="utf-8") as f:
+            return self.parse(f.read(), limit)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="저장된 daily.dev HTML에서 게시글 추출")
+    parser.add_argument("path", nargs="?", default="daily_dev_page_source_latest.html", help="HTML 파일 경로")
+    parser.add_argument("--limit", type=int, default=Config.POST_LIMIT, help="추출할 게시글 수")
+
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    posts = DailyDevPageParser().parse_file(args.path, args.limit)
+    elapsed = time.perf_counter() - started
+
+    print(json.dumps(posts, ensure_ascii=False, indent=2))
+    logger.info(f"{len(posts)}개 게시글 추출 ({elapsed * 1000:.1f}ms)")
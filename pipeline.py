@@ -0,0 +1,256 @@
+import logging
+import queue
+import threading
+import time
+
+from config import Config
+from discord_embeds import MAX_EMBEDS_PER_MESSAGE
+from metrics import get_metrics, in_current_run
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 단계 사이 큐에서 입력이 끝났음을 알리는 값
+END = object()
+
+# 취소 여부를 확인하기 위해 큐에서 한 번에 기다리는 최대 시간 (초)
+QUEUE_POLL_SECONDS = 0.5
+
+
+class PipelineCancelled(Exception):
+    pass
+
+
+class DigestPipeline:
+    """크롤링 → 번역 → 전송을 제한된 큐로 연결해 게시글마다 준비되는 대로 다음 단계로 넘김.
+
+    게시글은 본문 수집이 끝나는 순서대로 번역되지만, Discord에는 원래 순위 순서대로 전송된다.
+    """
+
+    def __init__(self, scraper, translator, discord_sender, config=None):
+        self.config = config or Config()
+        self.scraper = scraper
+        self.translator = translator
+        self.discord_sender = discord_sender
+
+        queue_size = max(1, self.config.PIPELINE_QUEUE_SIZE)
+        self.translate_queue = queue.Queue(maxsize=queue_size)
+        self.send_queue = queue.Queue(maxsize=queue_size)
+
+        self.started = None
+        self.first_delivery = None
+        self.scraped = 0
+        self.skipped = 0
+        self.sent_posts = []
+        self.results = {}
+        self.failed = False
+        # 전송 단계가 실패하면 앞 단계가 가득 찬 큐에서 멈추지 않고 끝나도록 알림
+        self.cancelled = threading.Event()
+
+    def _put(self, target_queue, item):
+        while not self.cancelled.is_set():
+            try:
+                target_queue.put(item, timeout=QUEUE_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+        raise PipelineCancelled()
+
+    def _get(self, source_queue):
+        while not self.cancelled.is_set():
+            try:
+                return source_queue.get(timeout=QUEUE_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        raise PipelineCancelled()
+
+    def _drain_queues(self):
+        for pending_queue in (self.translate_queue, self.send_queue):
+            while True:
+                try:
+                    pending_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+    def _scrape(self, limit):
+        def on_post(index, post):
+            self.scraped += 1
+            self._put(self.translate_queue, (index, post))
+
+        try:
+            self.scraper.scrape_posts(limit, on_post=on_post)
+        except PipelineCancelled:
+            return
+        except Exception as e:
+            logger.error(f"파이프라인 크롤링 단계 실패: {str(e)}")
+
+        try:
+            self._put(self.translate_queue, END)
+        except PipelineCancelled:
+            pass
+
+    def _next_translation_batch(self):
+        # 대기 중인 게시글을 함께 번역해 배치 번역의 이점을 살림
+        batch = [self._get(self.translate_queue)]
+        while batch[-1] is not END and len(batch) < self.config.PIPELINE_TRANSLATE_BATCH:
+            try:
+                batch.append(self.translate_queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _translate(self):
+        policy = self.config.REPEAT_POST_POLICY
+        finished = False
+
+        try:
+            while not finished:
+                batch = self._next_translation_batch()
+                finished = batch[-1] is END
+                items = [item for item in batch if item is not END]
+
+                # skip 정책이면 이미 전송한 게시글은 번역하지 않되, 순서를 맞추도록 자리만 넘김
+                to_translate = [(index, post) for index, post in items if not (policy == "skip" and post.get("repeat"))]
+                for index, post in items:
+                    if policy == "skip" and post.get("repeat"):
+                        self.skipped += 1
+                        self._put(self.send_queue, (index, None))
+
+                if not to_translate:
+                    continue
+
+                try:
+                    translated = self.translator.translate_posts([post for _, post in to_translate])
+                except Exception as e:
+                    logger.error(f"파이프라인 번역 단계 실패, 원문으로 전송합니다: {str(e)}")
+                    translated = [post for _, post in to_translate]
+
+                for (index, _), post in zip(to_translate, translated):
+                    if policy == "send":
+                        post["repeat"] = False
+                    self._put(self.send_queue, (index, post))
+        except PipelineCancelled:
+            return
+        except Exception as e:
+            logger.error(f"파이프라인 번역 단계 실패: {str(e)}")
+
+        try:
+            self._put(self.send_queue, END)
+        except PipelineCancelled:
+            pass
+
+    def _flush(self, embeds, posts):
+        if not embeds:
+            return
+
+        try:
+            results = self.discord_sender.send_embeds(embeds, posts)
+        except Exception as e:
+            # 앞 단계가 큐에서 멈추지 않도록 전송 실패는 기록만 하고 계속 진행
+            logger.error(f"파이프라인 전송 단계 실패: {str(e)}")
+            results = {webhook_url: False for webhook_url in self.discord_sender.webhook_urls}
+
+        for webhook_url, success in results.items():
+            self.results[webhook_url] = self.results.get(webhook_url, True) and success
+
+        self.sent_posts.extend(posts)
+
+        for post in posts:
+            get_metrics().mark_post("delivered", post.get("link"))
+
+        if self.first_delivery is None and posts:
+            self.first_delivery = time.perf_counter() - self.started
+            logger.info(f"첫 게시글 전송까지 {self.first_delivery:.1f}초")
+
+    def _send(self):
+        waiting = {}
+        next_index = 0
+        embeds = []
+        posts = []
+        header_pending = self.config.PIPELINE_HEADER_POLICY == "first"
+
+        while True:
+            try:
+                # 보낼 게시글이 쌓여 있으면 잠시만 더 기다렸다가 함께 묶어 전송
+                item = self.send_queue.get(timeout=self.config.PIPELINE_SEND_LINGER if posts else None)
+            except queue.Empty:
+                self._flush(embeds, posts)
+                embeds, posts = [], []
+                continue
+
+            finished = item is END
+            if not finished:
+                index, post = item
+                waiting[index] = post
+
+            ready = []
+            while next_index in waiting:
+                ready.append(waiting.pop(next_index))
+                next_index += 1
+
+            # 크롤링이 중간에 끝나 빠진 순번이 있으면 남은 게시글을 순서대로 보냄
+            if finished:
+                ready.extend(waiting.pop(index) for index in sorted(waiting))
+
+            for post in ready:
+                if post is None:
+                    continue
+
+                if header_pending:
+                    embeds.append(self.discord_sender.create_header_embed())
+                    header_pending = False
+
+                embeds.append(self.discord_sender.create_embed(post, len(self.sent_posts) + len(posts)))
+                posts.append(post)
+
+            if finished:
+                break
+
+            if len(embeds) >= MAX_EMBEDS_PER_MESSAGE:
+                self._flush(embeds, posts)
+                embeds, posts = [], []
+
+        if self.config.PIPELINE_FOOTER and (self.sent_posts or posts):
+            embeds.append(self.discord_sender.create_footer_embed())
+        self._flush(embeds, posts)
+
+    def run(self, limit):
+        self.started = time.perf_counter()
+
+        threads = [
+            threading.Thread(target=in_current_run(self._scrape), args=(limit,), name="pipeline-scrape", daemon=True),
+            threading.Thread(target=in_current_run(self._translate), name="pipeline-translate", daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            self._send()
+        except Exception as e:
+            # 전송 단계가 멈추면 앞 단계가 가득 찬 큐에서 영원히 기다리므로 취소하고 큐를 비움
+            logger.error(f"파이프라인 전송 단계 실패, 남은 작업을 취소합니다: {str(e)}")
+            self.failed = True
+            self.cancelled.set()
+            self._drain_queues()
+        finally:
+            for thread in threads:
+                thread.join(timeout=self.config.PIPELINE_SHUTDOWN_TIMEOUT)
+                if thread.is_alive():
+                    logger.warning(f"{thread.name} 단계가 {self.config.PIPELINE_SHUTDOWN_TIMEOUT}초 안에 끝나지 않았습니다.")
+
+        elapsed = time.perf_counter() - self.started
+        logger.info(
+            f"파이프라인 완료: 수집 {self.scraped}개, 전송 {len(self.sent_posts)}개, 제외 {self.skipped}개 "
+            f"({elapsed:.1f}초)"
+        )
+
+        return {
+            "scraped": self.scraped,
+            "sent": len(self.sent_posts),
+            "skipped": self.skipped,
+            # 모두 이미 전송한 게시글이라 제외된 경우도 성공으로 봄
+            "success": not self.failed and (all(self.results.values()) if self.results else self.scraped > 0),
+            "results": self.results,
+            "first_delivery_seconds": self.first_delivery,
+            "elapsed_seconds": elapsed,
+        }
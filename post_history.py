@@ -0,0 +1,164 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+from config import Config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TRACKING_PARAMS = ("utm_", "ref", "source", "fbclid", "gclid")
+TRANSLATED_FIELDS = ("title", "description", "content")
+
+
+def normalize_link(link):
+    parsed = urlparse(link)
+    netloc = parsed.netloc.lower()
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+
+    # 추적용 파라미터는 같은 글에 대해서도 매번 달라지므로 키에서 제외
+    query = sorted(
+        (name, value) for name, value in parse_qsl(parsed.query)
+        if not name.lower().startswith(TRACKING_PARAMS)
+    )
+    key = f"{netloc}{parsed.path.rstrip('/')}"
+    return f"{key}?{urlencode(query)}" if query else key
+
+
+class PostHistory:
+    """정규화한 링크를 키로 게시글 원문/번역과 처음·마지막으로 본 시각을 저장"""
+
+    def __init__(self, path=None, retention_days=None):
+        self.config = Config()
+        self.path = path or self.config.POST_HISTORY_PATH
+        retention_days = retention_days if retention_days is not None else self.config.POST_HISTORY_RETENTION_DAYS
+        self.lock = threading.Lock()
+
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS posts ("
+                "key TEXT PRIMARY KEY, link TEXT NOT NULL, title TEXT, description TEXT, content TEXT, tags TEXT, "
+                "translated TEXT, first_seen REAL NOT NULL, last_seen REAL NOT NULL, "
+                "seen_count INTEGER NOT NULL DEFAULT 1, delivered_at REAL)"
+            )
+
+        if retention_days:
+            self.purge(retention_days)
+
+    def get(self, link):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT link, title, description, content, tags, translated, first_seen, last_seen, seen_count, "
+                "delivered_at FROM posts WHERE key = ?",
+                (normalize_link(link),)
+            ).fetchone()
+
+        if not row:
+            return None
+
+        return {
+            "link": row[0],
+            "title": row[1],
+            "description": row[2],
+            "content": row[3],
+            "tags": json.loads(row[4]) if row[4] else [],
+            "translated": json.loads(row[5]) if row[5] else {},
+            "first_seen": row[6],
+            "last_seen": row[7],
+            "seen_count": row[8],
+            "delivered_at": row[9],
+        }
+
+    def record_seen(self, posts):
+        now = time.time()
+        with self.lock:
+            with self.conn:
+                for post in posts:
+                    self.conn.execute(
+                        "INSERT INTO posts (key, link, title, description, content, tags, first_seen, last_seen) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET link = excluded.link, title = excluded.title, "
+                        "description = excluded.description, "
+                        "content = COALESCE(NULLIF(excluded.content, ''), posts.content), "
+                        "tags = excluded.tags, last_seen = excluded.last_seen, seen_count = posts.seen_count + 1",
+                        (normalize_link(post["link"]), post["link"], post.get("title"), post.get("description"),
+                         post.get("content"), json.dumps(post.get("tags", []), ensure_ascii=False), now, now)
+                    )
+
+    def record_translation(self, post, translated_post):
+        # 원문과 번역을 함께 저장해, 원문이 바뀌지 않았을 때만 번역을 재사용
+        translated = {
+            field: {"source": post[field], "translated": translated_post[field]}
+            for field in TRANSLATED_FIELDS
+            if post.get(field) and translated_post.get(field) and translated_post[field] != post[field]
+        }
+        if not translated:
+            return
+
+        with self.lock:
+            with self.conn:
+                self.conn.execute(
+                    "UPDATE posts SET translated = ? WHERE key = ?",
+                    (json.dumps(translated, ensure_ascii=False), normalize_link(post["link"]))
+                )
+
+    def translation(self, post, field):
+        record = self.get(post["link"])
+        if not record:
+            return None
+
+        stored = record["translated"].get(field)
+        if stored and stored["source"] == post.get(field):
+            return stored["translated"]
+        return None
+
+    def record_delivered(self, posts):
+        now = time.time()
+        with self.lock:
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE posts SET delivered_at = ? WHERE key = ?",
+                    [(now, normalize_link(post["link"])) for post in posts]
+                )
+
+    def purge(self, retention_days):
+        cutoff = time.time() - retention_days * 86400
+        with self.lock:
+            with self.conn:
+                deleted = self.conn.execute("DELETE FROM posts WHERE last_seen < ?", (cutoff,)).rowcount
+        if deleted:
+            logger.debug(f"게시글 기록 {deleted}개 삭제")
+
+
+def open_post_history():
+    if not Config.POST_HISTORY:
+        return None
+
+    try:
+        return PostHistory()
+    except Exception as e:
+        logger.warning(f"게시글 기록 초기화 실패, 기록 없이 진행합니다: {str(e)}")
+        return None
+
+
+def apply_repeat_policy(posts, policy=None):
+    """이미 전송한 게시글을 REPEAT_POST_POLICY에 따라 제외(skip)하거나 표시(mark)함"""
+    policy = policy or Config.REPEAT_POST_POLICY
+    repeats = [post for post in posts if post.get("repeat")]
+    if not repeats:
+        return posts
+
+    if policy == "skip":
+        logger.info(f"이미 전송한 게시글 {len(repeats)}개를 제외합니다.")
+        return [post for post in posts if not post.get("repeat")]
+
+    if policy == "send":
+        for post in repeats:
+            post["repeat"] = False
+
+    return posts
@@ -0,0 +1,73 @@
+import asyncio
+import random
+import threading
+import time
+
+from config import Config
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity, min_rate=None):
+        self.base_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate or rate / 8
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        # 여러 이벤트 루프/스레드에서 함께 쓰이므로 asyncio.Lock 대신 threading.Lock 사용
+        self.lock = threading.Lock()
+
+    def _reserve(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            # 토큰이 부족하면 미리 차감해 두고 채워질 때까지 기다릴 시간을 돌려줌
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.blocked_until - now)
+
+    async def acquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self):
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def penalize(self, delay):
+        # 429/503 응답을 받으면 속도를 절반으로 줄이고 delay 동안 요청을 멈춤
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+
+    def reward(self):
+        with self.lock:
+            self.rate = min(self.base_rate, self.rate + self.base_rate / 10)
+
+
+def backoff_delay(attempt, base=None, maximum=None, retry_after=None):
+    if retry_after:
+        return retry_after
+
+    base = base if base is not None else Config.TRANSLATION_BACKOFF_BASE
+    maximum = maximum if maximum is not None else Config.TRANSLATION_BACKOFF_MAX
+    return min(maximum, base * (2 ** attempt)) * random.uniform(0.8, 1.2)
+
+
+_translation_bucket = None
+_translation_bucket_lock = threading.Lock()
+
+
+def get_translation_rate_limiter():
+    global _translation_bucket
+
+    with _translation_bucket_lock:
+        if _translation_bucket is None:
+            _translation_bucket = TokenBucket(Config.TRANSLATION_RATE_PER_SEC, Config.TRANSLATION_BURST)
+
+    return _translation_bucket
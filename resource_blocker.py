@@ -0,0 +1,89 @@
+import json
+import logging
+
+from config import Config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Network.setBlockedURLs는 URL 패턴만 받으므로 리소스 유형은 확장자 패턴으로 변환
+RESOURCE_TYPE_PATTERNS = {
+    "image": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*", "*.bmp*"],
+    "font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"],
+    "media": ["*.mp4*", "*.webm*", "*.ogg*", "*.mp3*", "*.wav*", "*.m4a*", "*.mov*"],
+    "stylesheet": ["*.css*"]
+}
+
+
+class ResourceBlocker:
+    def __init__(self):
+        self.config = Config()
+        domain_patterns = [f"*{domain}*" for domain in self.config.BLOCKED_DOMAINS]
+        self.rules = {
+            "feed": self._patterns(self.config.FEED_BLOCKED_RESOURCE_TYPES) + domain_patterns,
+            "article": self._patterns(self.config.ARTICLE_BLOCKED_RESOURCE_TYPES) + domain_patterns
+        }
+        self.reset()
+
+    def _patterns(self, resource_types):
+        patterns = []
+        for resource_type in resource_types:
+            patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+        return patterns
+
+    def reset(self):
+        self.stats = {"requests": 0, "finished": 0, "bytes": 0, "blocked": 0, "blocked_by_type": {}}
+
+    def configure_options(self, chrome_options):
+        # 차단/전송량 집계를 위해 CDP Network 이벤트를 performance 로그로 수집
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    def apply(self, driver, page):
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.rules.get(page, [])})
+            return True
+        except Exception as e:
+            logger.debug(f"리소스 차단 규칙 적용 실패 ({page}): {str(e)}")
+            return False
+
+    def collect(self, driver):
+        try:
+            entries = driver.get_log("performance")
+        except Exception as e:
+            logger.debug(f"performance 로그 수집 실패: {str(e)}")
+            return
+
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except Exception:
+                continue
+
+            method = message.get("method")
+            params = message.get("params", {})
+
+            if method == "Network.requestWillBeSent":
+                self.stats["requests"] += 1
+            elif method == "Network.loadingFinished":
+                self.stats["finished"] += 1
+                self.stats["bytes"] += params.get("encodedDataLength", 0)
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                resource_type = params.get("type", "Other")
+                self.stats["blocked"] += 1
+                self.stats["blocked_by_type"][resource_type] = self.stats["blocked_by_type"].get(resource_type, 0) + 1
+
+    def log_summary(self):
+        stats = self.stats
+        if not stats["requests"]:
+            return
+
+        # 차단된 요청은 전송되지 않으므로 절감량은 완료된 요청의 평균 크기로 추정
+        average = stats["bytes"] / stats["finished"] if stats["finished"] else 0
+        by_type = ", ".join(f"{name} {count}" for name, count in sorted(stats["blocked_by_type"].items()))
+
+        logger.info(
+            f"리소스 차단: {stats['blocked']}/{stats['requests']}개 요청 차단"
+            f"{f' ({by_type})' if by_type else ''}, "
+            f"전송 {stats['bytes'] / 1024:.0f}KB, 절감 추정 {stats['blocked'] * average / 1024:.0f}KB"
+        )
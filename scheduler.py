@@ -1,12 +1,13 @@
 import logging
+import os
 import time
-
-import schedule
+from datetime import datetime, timedelta, timezone
 
 from config import Config
-from daily_scraper import DailyDevScraper
-from discord_sender import DiscordSender
-from translator import KoreanTranslator
+from cron_schedule import ScheduleState, load_schedules, missed_run
+from driver_pool import get_driver_pool
+from metrics import get_metrics
+from post_history import apply_repeat_policy
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -15,16 +16,51 @@ logger = logging.getLogger(__name__)
 class DailyBotScheduler:
     def __init__(self):
         self.config = Config()
-        self.scraper = DailyDevScraper()
-        self.translator = KoreanTranslator()
-        self.discord_sender = DiscordSender()
+        self._scraper = None
+        self._translator = None
+        self._discord_sender = None
+
+    # 스케줄러 모드에서는 첫 작업이 실행될 때까지 selenium 등 무거운 모듈을 가져오지 않음
+    @property
+    def scraper(self):
+        if self._scraper is None:
+            from daily_scraper import DailyDevScraper
+
+            self._scraper = DailyDevScraper(driver_pool=get_driver_pool())
+        return self._scraper
+
+    @property
+    def translator(self):
+        if self._translator is None:
+            from translator import KoreanTranslator
+
+            self._translator = KoreanTranslator()
+        return self._translator
 
-    def run_daily_job(self):
+    @property
+    def discord_sender(self):
+        if self._discord_sender is None:
+            from discord_sender import DiscordSender
+
+            self._discord_sender = DiscordSender()
+        return self._discord_sender
+
+    def run_daily_job(self, limit=None):
+        limit = limit or self.config.POST_LIMIT
         logger.info("Daily.dev Bot 작업 시작")
+        get_metrics().start_run("scheduled")
+        status = "failed"
 
         try:
+            # 이전 실행에서 전송하지 못한 메시지를 먼저 보내 순서를 유지
+            self.flush_outbox()
+
+            if self.config.PIPELINE_STREAMING:
+                status = self.run_pipeline(limit)
+                return
+
             logger.info("게시글 크롤링 시작...")
-            posts = self.scraper.scrape_posts(limit=self.config.POST_LIMIT)
+            posts = self.scraper.scrape_posts(limit=limit)
 
             if not posts:
                 error_msg = "게시글을 가져올 수 없습니다."
@@ -34,6 +70,12 @@ class DailyBotScheduler:
 
             logger.info(f"{len(posts)}개 게시글 크롤링 완료")
 
+            posts = apply_repeat_policy(posts)
+            if not posts:
+                logger.info("새 게시글이 없어 전송을 건너뜁니다.")
+                status = "skipped"
+                return
+
             logger.info("게시글 번역 시작...")
             translated_posts = self.translator.translate_posts(posts)
 
@@ -42,6 +84,7 @@ class DailyBotScheduler:
 
             if success:
                 logger.info("Daily.dev Bot 작업 완료!")
+                status = "success"
             else:
                 error_msg = "Discord 전송 실패"
                 logger.error(error_msg)
@@ -52,21 +95,130 @@ class DailyBotScheduler:
             logger.error(error_msg)
             self.discord_sender.send_error_notification(error_msg)
 
-    def start_scheduler(self):
-        logger.info(f"Daily.dev Bot 스케줄러 시작 - 매일 {self.config.SCHEDULE_TIME}에 실행")
+        finally:
+            from http_client import get_http_client
+
+            get_http_client().log_summary()
+            get_metrics().finish_run(status)
 
-        schedule.every().day.at(self.config.SCHEDULE_TIME).do(self.run_daily_job)
+    def run_pipeline(self, limit=None):
+        from pipeline import DigestPipeline
 
-        next_run = schedule.next_run()
-        logger.info(f"다음 실행 예정 시간: {next_run}")
+        logger.info("크롤링 → 번역 → 전송 파이프라인 시작...")
+        result = DigestPipeline(self.scraper, self.translator, self.discord_sender).run(
+            limit or self.config.POST_LIMIT)
 
+        if not result["scraped"]:
+            error_msg = "게시글을 가져올 수 없습니다."
+            logger.error(error_msg)
+            self.discord_sender.send_error_notification(error_msg)
+            return "failed"
+
+        if not result["success"]:
+            error_msg = "Discord 전송 실패"
+            logger.error(error_msg)
+            self.discord_sender.send_error_notification(error_msg)
+            return "failed"
+
+        if not result["sent"]:
+            logger.info("새 게시글이 없어 전송을 건너뜁니다.")
+            return "skipped"
+
+        logger.info("Daily.dev Bot 작업 완료!")
+        return "success"
+
+    def flush_outbox(self):
+        # 보관함 파일이 없으면 남은 메시지도 없으므로 전송 모듈을 불러오지 않음
+        if not self.config.DISCORD_OUTBOX or not os.path.exists(self.config.DISCORD_OUTBOX_PATH):
+            return
+
+        try:
+            self.discord_sender.flush_outbox()
+        except Exception as e:
+            logger.error(f"Discord 보관함 전송 실패: {str(e)}")
+
+    def run_scheduled(self, schedule, due, state):
+        # 실행 전에 기록해 작업 도중 종료돼도 다시 시작할 때 같은 회차를 반복하지 않음.
+        # 전송하지 못한 메시지는 Discord 보관함에서 이어서 보냄
+        state.record(schedule, due)
+        logger.info(f"스케줄 실행: {schedule.name}, 예정 시각 {due.isoformat()} (게시글 {schedule.limit}개)")
+        self.run_daily_job(limit=schedule.limit)
+
+    def catch_up(self, schedules, state):
+        now = datetime.now(timezone.utc)
+        grace = timedelta(minutes=self.config.SCHEDULE_CATCHUP_GRACE_MINUTES)
+
+        for schedule in schedules:
+            last_run = state.last_run(schedule)
+            if last_run is None:
+                # 처음 등록된 스케줄은 지금부터 놓친 실행을 셈
+                state.record(schedule, now)
+                continue
+
+            missed = missed_run(schedule, last_run, now)
+            if missed is None:
+                continue
+
+            if now - missed <= grace:
+                logger.info(f"꺼져 있는 동안 놓친 실행을 따라잡습니다: {schedule.name}, 예정 시각 {missed.isoformat()}")
+                self.run_scheduled(schedule, missed, state)
+            else:
+                logger.warning(
+                    f"놓친 실행이 허용 시간({self.config.SCHEDULE_CATCHUP_GRACE_MINUTES}분)을 지나 건너뜁니다: "
+                    f"{schedule.name}, 예정 시각 {missed.isoformat()}"
+                )
+                state.record(schedule, missed)
+
+    def sleep_until(self, due):
+        # 절전이나 시계 변경에도 늦지 않도록 최대 1분씩 나눠 자면서 남은 시간을 다시 계산
         while True:
-            schedule.run_pending()
-            time.sleep(60)
+            remaining = due.timestamp() - time.time()
+            if remaining <= 0:
+                return
+
+            time.sleep(min(remaining, 60))
+            if due.timestamp() - time.time() > 60:
+                self.flush_outbox()
+
+    def start_scheduler(self):
+        schedules = load_schedules(self.config)
+        state = ScheduleState(self.config.SCHEDULE_STATE_PATH)
+
+        logger.info(f"Daily.dev Bot 스케줄러 시작 - 스케줄 {len(schedules)}개")
+        for schedule in schedules:
+            logger.info(f"  - {schedule.name}: 게시글 {schedule.limit}개")
+
+        try:
+            self.flush_outbox()
+            self.catch_up(schedules, state)
+
+            now = datetime.now(timezone.utc)
+            next_runs = {schedule.key: schedule.next_after(now) for schedule in schedules}
+
+            while True:
+                schedule = min(schedules, key=lambda item: next_runs[item.key])
+                due = next_runs[schedule.key]
+                logger.info(f"다음 실행 예정 시간: {due.isoformat()} ({schedule.name})")
+
+                self.sleep_until(due)
+                self.run_scheduled(schedule, due, state)
+
+                # 작업이 길어져 지난 회차는 건너뛰고 지금 이후의 회차로 넘어감
+                next_runs[schedule.key] = schedule.next_after(max(due, datetime.now(timezone.utc)))
+        finally:
+            self.close()
 
     def run_once(self):
         logger.info("즉시 실행 모드")
-        self.run_daily_job()
+        try:
+            self.run_daily_job()
+        finally:
+            self.close()
+
+    def close(self):
+        # 드라이버 풀을 쓴 경우 미리 실행해 둔 Chrome이 남지 않도록 종료
+        if self._scraper is not None and self._scraper.driver_pool:
+            self._scraper.driver_pool.close()
 
 
 if __name__ == "__main__":
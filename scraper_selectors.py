@@ -0,0 +1,63 @@
+POST_SELECTORS = [
+    "article",
+    "[data-testid='post']",
+    "[data-testid='post-item']",
+    ".post",
+    ".post-item",
+    "[data-testid='feed-item']",
+    ".feed-item",
+    ".card",
+    "[role='article']",
+    ".Card_card__BFnUM",
+    "[class*='card']",
+    "[class*='post']"
+]
+
+TITLE_SELECTORS = [
+    "h1", "h2", "h3", "h4", "h5",
+    "[data-testid*='title']",
+    "[data-testid*='post-title']",
+    ".title",
+    ".post-title",
+    "a[href*='/posts/']",
+    "a[title]",
+    "[class*='title']"
+]
+
+LINK_SELECTORS = [
+    "a[href*='/posts/']",
+    "a[href*='http']",
+    "a[title]",
+    "a"
+]
+
+DESC_SELECTORS = [
+    ".description",
+    ".summary",
+    "p",
+    ".content",
+    "[class*='description']",
+    "[class*='summary']"
+]
+
+TAG_SELECTOR = ".tag, [data-testid*='tag'], .badge, [class*='tag'], [class*='badge']"
+
+CONTENT_SELECTORS = [
+    "article",
+    "main article",
+    ".post-content",
+    ".article-content",
+    ".content",
+    ".entry-content",
+    ".post-body",
+    ".article-body",
+
+    "[data-testid='article-content']",
+    "[data-testid='post-content']",
+    ".text-content",
+    "main .prose",
+    ".markdown-body",
+
+    "div:has(> p)",
+    "section:has(> p)"
+]
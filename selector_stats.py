@@ -0,0 +1,115 @@
+import json
+import logging
+import os
+import threading
+import time
+
+from config import Config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SelectorStats:
+    def __init__(self, path=None, half_life_days=None):
+        self.config = Config()
+        self.path = path or self.config.SELECTOR_STATS_FILE
+        self.half_life = (half_life_days or self.config.SELECTOR_STATS_HALF_LIFE_DAYS) * 86400
+        self.data = {}
+        self.dirty = False
+        self.lock = threading.Lock()
+        # 같은 임시 파일에 동시에 쓰지 않도록 저장은 한 번에 하나씩
+        self.save_lock = threading.Lock()
+        self.load()
+
+    def _key(self, list_name, domain=None):
+        return f"{list_name}@{domain}" if domain else list_name
+
+    def _decayed(self, entry, now):
+        # 오래된 기록일수록 가중치를 줄여 사이트 구조가 바뀌면 이전 승자가 밀려나도록 함
+        factor = 0.5 ** (max(0.0, now - entry["updated"]) / self.half_life) if self.half_life else 1.0
+        return entry["hits"] * factor, entry["misses"] * factor
+
+    def _score(self, entry, now):
+        hits, misses = self._decayed(entry, now)
+        return hits / (hits + misses + 1)
+
+    def order(self, list_name, selectors, domain=None):
+        now = time.time()
+        with self.lock:
+            entries = self.data.get(self._key(list_name, domain), {})
+            scores = {selector: self._score(entries[selector], now) for selector in selectors if selector in entries}
+
+        if not any(scores.values()):
+            return list(selectors)
+
+        # 점수가 같으면 기존 우선순위를 유지 (sorted는 안정 정렬)
+        return sorted(selectors, key=lambda selector: -scores.get(selector, 0.0))
+
+    def record(self, list_name, selector, hit, domain=None):
+        now = time.time()
+        with self.lock:
+            entries = self.data.setdefault(self._key(list_name, domain), {})
+            entry = entries.get(selector)
+            if entry:
+                entry["hits"], entry["misses"] = self._decayed(entry, now)
+            else:
+                entry = entries[selector] = {"hits": 0.0, "misses": 0.0}
+
+            if hit:
+                entry["hits"] += 1
+            else:
+                entry["misses"] += 1
+            entry["updated"] = now
+            self.dirty = True
+
+    def record_attempts(self, list_name, ordered, matched, domain=None):
+        # ordered 순서대로 시도했다고 보고, matched 이전 선택자는 모두 실패로 기록
+        for selector in ordered:
+            if selector == matched:
+                self.record(list_name, selector, True, domain)
+                return
+            self.record(list_name, selector, False, domain)
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.data = json.load(f)
+        except Exception as e:
+            logger.warning(f"선택자 통계 로드 실패: {str(e)}")
+            self.data = {}
+
+    def save(self):
+        with self.save_lock:
+            with self.lock:
+                if not self.dirty:
+                    return
+                snapshot = json.dumps(self.data)
+                self.dirty = False
+
+            try:
+                temp_path = f"{self.path}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    f.write(snapshot)
+                os.replace(temp_path, self.path)
+                logger.debug(f"선택자 통계 저장 완료: {self.path}")
+            except Exception as e:
+                logger.warning(f"선택자 통계 저장 실패: {str(e)}")
+
+
+_selector_stats = None
+_selector_stats_lock = threading.Lock()
+
+
+def get_selector_stats():
+    # 스크래퍼마다 파일을 따로 읽고 덮어쓰면 서로의 기록이 사라지므로 프로세스 전체에서 하나만 사용
+    global _selector_stats
+
+    with _selector_stats_lock:
+        if _selector_stats is None:
+            _selector_stats = SelectorStats()
+
+    return _selector_stats
@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from config import Config
+from discord_outbox import DiscordOutbox
+from discord_sender import DiscordSender
+
+WEBHOOKS = ["https://discord.com/api/webhooks/111/token-a", "https://discord.com/api/webhooks/222/token-b"]
+
+
+@pytest.fixture
+def outbox_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "outbox.db")
+    monkeypatch.setattr(Config, "DISCORD_OUTBOX", True)
+    monkeypatch.setattr(Config, "DISCORD_OUTBOX_PATH", path)
+    monkeypatch.setattr(Config, "DISCORD_WEBHOOK_URLS", WEBHOOKS)
+    return path
+
+
+def test_two_drainers_send_each_message_once(outbox_path):
+    DiscordOutbox(outbox_path).enqueue(WEBHOOKS, [{"content": str(i)} for i in range(20)])
+
+    sent = Counter()
+    lock = threading.Lock()
+
+    def post(self, payload, webhook_url=None):
+        time.sleep(0.005)
+        with lock:
+            sent[(webhook_url, payload["content"])] += 1
+        return SimpleNamespace(status_code=204, text="")
+
+    senders = [DiscordSender(), DiscordSender()]
+    for sender in senders:
+        sender._post = post.__get__(sender)
+
+    start = threading.Barrier(len(senders))
+
+    def drain(sender):
+        start.wait()
+        sender.flush_outbox()
+
+    threads = [threading.Thread(target=drain, args=(sender,)) for sender in senders]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 한 번씩만 가져갔으면 남은 메시지를 마저 보냄
+    for sender in senders:
+        sender.flush_outbox()
+
+    assert len(sent) == 40
+    assert set(sent.values()) == {1}
+    assert DiscordOutbox(outbox_path).stats()["sent"] == 40
+
+
+def test_claim_skips_claimed_rows_until_timeout(outbox_path):
+    first = DiscordOutbox(outbox_path, claim_timeout=60)
+    second = DiscordOutbox(outbox_path, claim_timeout=60)
+    first.enqueue(WEBHOOKS[:1], [{"content": "a"}, {"content": "b"}])
+
+    claimed = first.claim()
+    assert [entry.payload["content"] for entry in claimed] == ["a", "b"]
+    assert second.claim() == []
+
+    first.release([claimed[1].id])
+    first.mark_sent(claimed[0].id)
+    assert [entry.payload["content"] for entry in second.claim()] == ["b"]
+
+    # 전송 중에 멈춘 메시지는 claim_timeout이 지나면 다시 가져감
+    stale = DiscordOutbox(outbox_path, claim_timeout=0)
+    time.sleep(0.01)
+    assert [entry.payload["content"] for entry in stale.claim()] == ["b"]
+
+
+def test_send_does_not_wait_for_rows_claimed_elsewhere(outbox_path, monkeypatch):
+    # 전송 도중 종료된 프로세스가 첫 번째 웹훅의 메시지를 가져간 채로 남아 있음
+    crashed = DiscordOutbox(outbox_path, claim_timeout=600)
+    crashed.enqueue(WEBHOOKS[:1], [{"content": "old"}])
+    assert len(crashed.claim()) == 1
+
+    sent = []
+
+    def post(self, payload, webhook_url=None):
+        sent.append((webhook_url, payload["content"]))
+        return SimpleNamespace(status_code=204, text="")
+
+    sender = DiscordSender()
+    sender._post = post.__get__(sender)
+
+    started = time.monotonic()
+    results = sender._send_payloads(WEBHOOKS, [{"content": "new"}])
+
+    assert time.monotonic() - started < 1
+    assert results == {WEBHOOKS[1]: True}
+    assert sent == [(WEBHOOKS[1], "new")]
+    assert [entry.payload["content"] for entry in DiscordOutbox(outbox_path).pending()] == ["new"]
+
+    # 가져간 전송이 만료되면 다음 보관함 전송에서 순서대로 이어서 보냄
+    monkeypatch.setattr(Config, "DISCORD_OUTBOX_CLAIM_TIMEOUT", 0)
+    sender = DiscordSender()
+    sender._post = post.__get__(sender)
+    sender.flush_outbox()
+
+    assert sent[1:] == [(WEBHOOKS[0], "old"), (WEBHOOKS[0], "new")]
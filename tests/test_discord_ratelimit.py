@@ -0,0 +1,77 @@
+import time
+
+from discord_ratelimit import DiscordRateLimiter, webhook_id
+
+WEBHOOK_A = "https://discord.com/api/webhooks/111/token-a"
+WEBHOOK_B = "https://discord.com/api/webhooks/222/token-b"
+
+
+class FakeResponse:
+    def __init__(self, status_code=204, headers=None, body=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.body = body or {}
+
+    def json(self):
+        return self.body
+
+
+class FakeHttp:
+    def __init__(self, headers):
+        self.headers = headers
+        self.calls = []
+
+    def post(self, url, **kwargs):
+        self.calls.append(url)
+        return FakeResponse(headers=self.headers)
+
+
+def test_webhook_id():
+    assert webhook_id(WEBHOOK_A) == "111"
+    assert webhook_id("https://example.com/hook") == "/hook"
+
+
+def test_webhooks_with_same_bucket_hash_do_not_block_each_other():
+    limiter = DiscordRateLimiter()
+    # 두 웹훅 모두 같은 버킷 값을 돌려주고, 한 번 보내면 10초 동안 더 보낼 수 없음
+    http = FakeHttp({"X-RateLimit-Bucket": "shared", "X-RateLimit-Remaining": "0",
+                     "X-RateLimit-Reset-After": "10"})
+
+    started = time.monotonic()
+    limiter.post(http, WEBHOOK_A)
+    limiter.post(http, WEBHOOK_B)
+
+    assert time.monotonic() - started < 1
+    assert http.calls == [WEBHOOK_A, WEBHOOK_B]
+    assert limiter.bucket(WEBHOOK_A) is not limiter.bucket(WEBHOOK_B)
+    assert limiter.bucket(WEBHOOK_A).remaining == 0
+    assert limiter.bucket(WEBHOOK_B).remaining == 0
+
+
+def test_global_wait_reserves_bucket_once():
+    limiter = DiscordRateLimiter()
+    limiter.bucket(WEBHOOK_A).update(remaining=1, reset_after=5)
+    limiter.global_until = time.monotonic() + 0.1
+
+    started = time.monotonic()
+    limiter.wait(WEBHOOK_A)
+
+    # 전역 대기 동안 남은 횟수를 두 번 쓰면 버킷 초기화까지 기다리게 됨
+    assert time.monotonic() - started < 1
+    assert limiter.bucket(WEBHOOK_A).remaining == 0
+
+
+def test_last_429_logs_give_up_instead_of_retry(caplog):
+    limiter = DiscordRateLimiter()
+
+    class LimitedHttp:
+        def post(self, url, **kwargs):
+            return FakeResponse(429, headers={"Retry-After": "0.01"}, body={"retry_after": 0.01})
+
+    with caplog.at_level("INFO", logger="discord_ratelimit"):
+        response = limiter.post(LimitedHttp(), WEBHOOK_A, max_retries=1)
+
+    assert response.status_code == 429
+    messages = [record.getMessage() for record in caplog.records]
+    assert sum("후 재시도" in message for message in messages) == 1
+    assert "재시도를 중단" in messages[-1]
@@ -0,0 +1,42 @@
+import threading
+
+from metrics import MetricsRegistry, in_current_run
+
+
+def test_overlapping_runs_keep_their_own_timings():
+    metrics = MetricsRegistry(history_size=5)
+    both_started = threading.Barrier(2, timeout=5)
+    runs = {}
+
+    def run(kind, stage, post):
+        runs[kind] = metrics.start_run(kind)
+        both_started.wait()
+        metrics.observe(stage, 1.0, post=post)
+        metrics.incr("webdriver_commands", command=kind)
+
+        # 실행이 띄운 작업 스레드의 기록도 같은 실행으로 들어가야 함
+        worker = threading.Thread(target=in_current_run(metrics.incr), args=("discord_messages",))
+        worker.start()
+        worker.join()
+
+        both_started.wait()
+        metrics.finish_run("success")
+
+    threads = [
+        threading.Thread(target=run, args=("scheduled", "login", "https://example.com/a")),
+        threading.Thread(target=run, args=("api", "translation", "https://example.com/b")),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    scheduled, api = runs["scheduled"].to_dict(), runs["api"].to_dict()
+    assert list(scheduled["stages"]) == ["login"]
+    assert list(api["stages"]) == ["translation"]
+    assert [post["post"] for post in scheduled["posts"]] == ["https://example.com/a"]
+    assert [post["post"] for post in api["posts"]] == ["https://example.com/b"]
+    assert scheduled["counters"] == {'webdriver_commands{command="scheduled"}': 1, "discord_messages": 1}
+    assert api["counters"] == {'webdriver_commands{command="api"}': 1, "discord_messages": 1}
+    assert scheduled["status"] == api["status"] == "success"
+    assert metrics.snapshot()["run_totals"] == {"success": 2}
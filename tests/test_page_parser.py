@@ -0,0 +1,24 @@
+from page_parser import DailyDevPageParser
+
+FEED_HTML = """
+<html><body>
+  <article><h3>First post about Python packaging</h3><a href="/posts/first">read</a></article>
+  <article><h3>Second post about async Rust runtimes</h3><a href="/posts/second">read</a></article>
+  <article><h3>Third post about database indexing</h3><a href="/posts/third">read</a></article>
+</body></html>
+"""
+
+
+def test_extract_cards_returns_none_when_no_cards_found():
+    # 빈 목록이 아니라 None이어야 요소별 추출로 전환됨
+    assert DailyDevPageParser(base_url="https://app.daily.dev").extract_cards("<html><body></body></html>") is None
+
+
+def test_parse_resolves_relative_links():
+    posts = DailyDevPageParser(base_url="https://app.daily.dev").parse(FEED_HTML, limit=2)
+
+    assert [post["link"] for post in posts] == [
+        "https://app.daily.dev/posts/first",
+        "https://app.daily.dev/posts/second",
+    ]
+    assert DailyDevPageParser(base_url="https://app.daily.dev").parse("<html></html>") == []
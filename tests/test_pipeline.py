@@ -0,0 +1,77 @@
+import time
+
+from config import Config
+from discord_sender import DiscordSender
+from pipeline import DigestPipeline
+
+
+class FakeScraper:
+    def scrape_posts(self, limit, on_post=None):
+        # 요청한 개수보다 적은 게시글만 나옴
+        for index in range(2):
+            on_post(index, {"title": f"post {index}", "link": f"https://example.com/{index}", "content": ""})
+
+
+class FakeTranslator:
+    def translate_posts(self, posts):
+        return [dict(post) for post in posts]
+
+
+class RecordingSender(DiscordSender):
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+
+    def send_embeds(self, embeds, posts=()):
+        self.sent.append((embeds, list(posts)))
+        return {"https://discord.com/api/webhooks/111/token": True}
+
+
+def test_streaming_header_does_not_claim_requested_count(monkeypatch):
+    monkeypatch.setattr(Config, "DISCORD_OUTBOX", False)
+    monkeypatch.setattr(Config, "POST_HISTORY", False)
+    monkeypatch.setattr(Config, "PIPELINE_SEND_LINGER", 0.01)
+
+    sender = RecordingSender()
+    result = DigestPipeline(FakeScraper(), FakeTranslator(), sender).run(limit=10)
+
+    assert result["sent"] == 2
+    header = sender.sent[0][0][0]
+    assert "10개" not in header["description"]
+    assert [post["title"] for _, posts in sender.sent for post in posts] == ["post 0", "post 1"]
+
+
+class ManyPostsScraper:
+    def __init__(self):
+        self.finished = False
+
+    def scrape_posts(self, limit, on_post=None):
+        try:
+            for index in range(limit):
+                on_post(index, {"title": f"post {index}", "link": f"https://example.com/{index}", "content": ""})
+        finally:
+            self.finished = True
+
+
+class BrokenSender(RecordingSender):
+    def create_embed(self, post, index):
+        raise ValueError("broken embed")
+
+
+def test_send_failure_cancels_other_stages(monkeypatch):
+    monkeypatch.setattr(Config, "DISCORD_OUTBOX", False)
+    monkeypatch.setattr(Config, "POST_HISTORY", False)
+    monkeypatch.setattr(Config, "PIPELINE_QUEUE_SIZE", 1)
+    monkeypatch.setattr(Config, "PIPELINE_SHUTDOWN_TIMEOUT", 5)
+
+    scraper = ManyPostsScraper()
+    pipeline = DigestPipeline(scraper, FakeTranslator(), BrokenSender())
+
+    started = time.monotonic()
+    result = pipeline.run(limit=50)
+
+    # 가득 찬 큐에서 멈추지 않고 앞 단계까지 모두 끝나야 함
+    assert time.monotonic() - started < 5
+    assert result["success"] is False
+    assert result["sent"] == 0
+    assert scraper.finished
@@ -0,0 +1,31 @@
+import json
+
+import selector_stats
+from selector_stats import SelectorStats, get_selector_stats
+
+
+def test_scrapers_share_one_stats_instance(monkeypatch, tmp_path):
+    monkeypatch.setattr(selector_stats, "_selector_stats", None)
+    monkeypatch.setattr(selector_stats.Config, "SELECTOR_STATS_FILE", str(tmp_path / "stats.json"))
+
+    first, second = get_selector_stats(), get_selector_stats()
+    assert first is second
+
+    # 두 스크래퍼가 각각 기록하고 저장해도 서로의 기록이 남아야 함
+    first.record_attempts("post", ["article", ".card"], "article")
+    first.save()
+    second.record_attempts("title", ["h1", "h2"], "h2")
+    second.save()
+
+    with open(tmp_path / "stats.json", encoding="utf-8") as f:
+        saved = json.load(f)
+    assert set(saved) == {"post", "title"}
+
+
+def test_no_match_records_every_selector_as_miss(tmp_path):
+    stats = SelectorStats(path=str(tmp_path / "stats.json"))
+    stats.record_attempts("email_input", ["input[type='email']", "input[name='email']"], None)
+
+    entries = stats.data["email_input"]
+    assert all(entry["hits"] == 0 and entry["misses"] == 1 for entry in entries.values())
+    assert len(entries) == 2
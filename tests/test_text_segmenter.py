@@ -0,0 +1,33 @@
+import pytest
+
+from text_segmenter import is_code_line, segment_text
+
+PROSE_LINES = [
+    "This is great (really),",
+    "First, install the tool;",
+    "We need it => now",
+    "Return to the main menu when you are done.",
+    "The function of this module is caching.",
+]
+
+CODE_LINES = [
+    "foo(bar, baz);",
+    "if (ready) {",
+    "};",
+    "const total = items.length;",
+    "items.map(x => x * 2);",
+    'print("hello world this is");',
+    "return result;",
+    "function render(props) {",
+]
+
+
+@pytest.mark.parametrize("line", PROSE_LINES)
+def test_prose_lines_are_not_code(line):
+    assert not is_code_line(line)
+    assert all(segment.translatable for segment in segment_text(line))
+
+
+@pytest.mark.parametrize("line", CODE_LINES)
+def test_code_lines_are_kept(line):
+    assert is_code_line(line)
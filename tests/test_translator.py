@@ -0,0 +1,52 @@
+import pytest
+
+from config import Config
+from text_chunker import encoded_size
+from translation_backends import CircuitBreaker
+from translator import KoreanTranslator
+
+
+class EchoBackend:
+    name = "echo"
+    rate_limiter = None
+
+    def __init__(self):
+        self.breaker = CircuitBreaker()
+        self.requests = []
+
+    def request(self, text, target="ko"):
+        self.requests.append(text)
+        return 200, text, None
+
+
+@pytest.fixture
+def translator(monkeypatch):
+    monkeypatch.setattr(Config, "TRANSLATION_CACHE", False)
+    monkeypatch.setattr(Config, "POST_HISTORY", False)
+    monkeypatch.setattr(Config, "TRANSLATION_REQUEST_MAX_BYTES", 1800)
+
+    translator = KoreanTranslator()
+    translator.backends = [EchoBackend()]
+    return translator
+
+
+def test_requests_stay_within_byte_budget(translator):
+    paragraph = " ".join(f"Sentence number {n} talks about performance." for n in range(12))
+    text = "\n\n".join([paragraph] * 20)
+    assert encoded_size(text) > 11000
+
+    assert translator.translate_texts([text]) == [text]
+
+    requests = translator.backends[0].requests
+    assert len(requests) > 1
+    assert max(encoded_size(request) for request in requests) <= 1800
+
+
+def test_short_texts_are_batched_within_budget(translator):
+    texts = [f"Short sentence {n}." for n in range(200)]
+
+    assert translator.translate_texts(texts) == texts
+
+    requests = translator.backends[0].requests
+    assert len(requests) < len(texts)
+    assert max(encoded_size(request) for request in requests) <= 1800
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from urllib.parse import urlencode
+
+import daily_scraper
+import web_api
+from driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.window_handles = ["main"]
+        self.switch_to = SimpleNamespace(window=lambda handle: None)
+
+    def execute_script(self, script, *args):
+        return 1 if script == "return 1;" else 0
+
+    def quit(self):
+        pass
+
+
+async def call(path, **params):
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+    response = {}
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": urlencode(params).encode(), "headers": [],
+        "client": ("test", 1), "server": ("test", 80),
+    }
+    await web_api.app(scope, receive, send)
+    return response["status"]
+
+
+def test_overlapping_scrape_requests_lease_separate_drivers(monkeypatch):
+    pool = DriverPool(FakeDriver, size=2, max_uses=0)
+    leased = []
+    both_leased = threading.Barrier(2, timeout=5)
+
+    def scrape_posts(self, limit=10, on_post=None):
+        with self.driver_pool.lease(timeout=5) as driver:
+            leased.append(driver)
+            # 두 요청이 동시에 드라이버를 빌려야만 통과 (이벤트 루프에서 차례로 실행되면 시간 초과)
+            both_leased.wait()
+        return [{"title": "post", "link": "https://example.com"}]
+
+    monkeypatch.setattr(web_api, "get_driver_pool", lambda: pool)
+    monkeypatch.setattr(daily_scraper.DailyDevScraper, "__init__",
+                        lambda self, driver_pool=None: setattr(self, "driver_pool", driver_pool))
+    monkeypatch.setattr(daily_scraper.DailyDevScraper, "scrape_posts", scrape_posts)
+
+    async def run():
+        return await asyncio.gather(call("/scrape-sync", limit=1), call("/scrape-sync", limit=1))
+
+    assert asyncio.run(run()) == [200, 200]
+    assert len(leased) == 2
+    assert leased[0] is not leased[1]
+
+
+def test_health_responds_during_scrape(monkeypatch):
+    def scrape_posts(self, limit=10, on_post=None):
+        time.sleep(1)
+        return [{"title": "post", "link": "https://example.com"}]
+
+    monkeypatch.setattr(web_api, "get_driver_pool", lambda: None)
+    monkeypatch.setattr(daily_scraper.DailyDevScraper, "__init__", lambda self, driver_pool=None: None)
+    monkeypatch.setattr(daily_scraper.DailyDevScraper, "scrape_posts", scrape_posts)
+
+    async def timed(path, **params):
+        status = await call(path, **params)
+        return status, time.monotonic()
+
+    async def run():
+        started = time.monotonic()
+        (scrape_status, _), (health_status, health_done) = await asyncio.gather(
+            timed("/scrape-sync", limit=1), timed("/health"))
+        return scrape_status, health_status, health_done - started
+
+    scrape_status, health_status, health_elapsed = asyncio.run(run())
+    assert scrape_status == 200
+    assert health_status == 200
+    assert health_elapsed < 0.5
@@ -0,0 +1,85 @@
+import re
+from urllib.parse import quote
+
+PARAGRAPH_PATTERN = re.compile(r"(\n\s*\n)")
+SENTENCE_PATTERN = re.compile(r"(?<=[.!?。！？])(\s+)")
+WORD_PATTERN = re.compile(r"(\s+)")
+
+
+def encoded_size(text):
+    return len(quote(text, safe=""))
+
+
+def _split_with_separators(text, pattern):
+    # re.split 결과를 (조각, 뒤따르는 구분자) 쌍으로 변환
+    parts = pattern.split(text)
+    return [(parts[i], parts[i + 1] if i + 1 < len(parts) else "") for i in range(0, len(parts), 2)]
+
+
+def _split_oversized(text, separator, max_bytes):
+    # 단어 하나가 한도를 넘는 경우 문자 단위로 자름
+    pieces = []
+    current = ""
+    for char in text:
+        if current and encoded_size(current + char) > max_bytes:
+            pieces.append((current, ""))
+            current = ""
+        current += char
+    pieces.append((current, separator))
+    return pieces
+
+
+def _units(text, max_bytes):
+    units = []
+    for paragraph, paragraph_separator in _split_with_separators(text, PARAGRAPH_PATTERN):
+        if encoded_size(paragraph) <= max_bytes:
+            units.append((paragraph, paragraph_separator))
+            continue
+
+        sentences = _split_with_separators(paragraph, SENTENCE_PATTERN)
+        for n, (sentence, sentence_separator) in enumerate(sentences):
+            separator = paragraph_separator if n == len(sentences) - 1 else sentence_separator
+            if encoded_size(sentence) <= max_bytes:
+                units.append((sentence, separator))
+                continue
+
+            words = _split_with_separators(sentence, WORD_PATTERN)
+            for m, (word, word_separator) in enumerate(words):
+                word_separator = separator if m == len(words) - 1 else word_separator
+                if encoded_size(word) <= max_bytes:
+                    units.append((word, word_separator))
+                else:
+                    units.extend(_split_oversized(word, word_separator, max_bytes))
+
+    return units
+
+
+def split_text(text, max_bytes):
+    """문단 > 문장 > 단어 경계 순으로 max_bytes 이하 조각으로 나눔.
+
+    (조각, 뒤따르는 구분자) 목록을 반환하며, 순서대로 이어 붙이면 원문이 복원된다.
+    """
+    if encoded_size(text) <= max_bytes:
+        return [(text, "")]
+
+    chunks = []
+    current = ""
+    current_separator = ""
+
+    for unit, separator in _units(text, max_bytes):
+        candidate = current + current_separator + unit if current else unit
+        if current and encoded_size(candidate) > max_bytes:
+            chunks.append((current, current_separator))
+            candidate = unit
+
+        current = candidate
+        current_separator = separator
+
+    if current:
+        chunks.append((current, current_separator))
+
+    return chunks
+
+
+def join_chunks(chunks):
+    return "".join(chunk + separator for chunk, separator in chunks)
@@ -0,0 +1,163 @@
+import re
+
+from config import Config
+
+FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+CODE_LINE_PATTERN = re.compile(
+    r"^(?:\s{4,}\S|\t|\$ |>>> |#include\b|import \w|from \S+ import |def \w|class \w+[(:]|function\s*\w*\s*\(|"
+    r"const \w|let \w|var \w|return(?:\s+[^\s.!?]+)?;?\s*$|[{}\]);]+\s*$)"
+)
+CODE_LINE_ENDINGS = (";", "{", "}", "};", "),", "=>")
+CODE_SYMBOLS = set("{}[]();=<>$&|\\")
+CODE_SYMBOL_RATIO = 0.15
+# 따옴표 밖에서 일반 단어가 세 개 이상 이어지면 문장으로 봄
+WORD_RUN_PATTERN = re.compile(r"[A-Za-z]{2,}[,.]?(?:\s+[A-Za-z]{2,}[,.]?){2,}")
+QUOTED_PATTERN = re.compile(r"\"[^\"]*\"|'[^']*'")
+
+# 번역하지 않고 그대로 둘 문장 안의 조각 (먼저 나온 패턴이 우선)
+INLINE_KEEP_PATTERN = re.compile("|".join([
+    r"`[^`\n]+`",                                             # 인라인 코드
+    r"\{\{[^{}\n]*\}\}",                                      # 템플릿 / 자리표시자와 겹치는 문자열
+    r"https?://[^\s<>\"'`]+[^\s<>\"'`.,;:!?)\]]",             # URL
+    r"\bwww\.[^\s<>\"'`]+[^\s<>\"'`.,;:!?)\]]",
+    r"\b[\w.+-]+@[\w-]+(?:\.[\w-]+)+\b",                      # 이메일
+    r"(?<![\w/])(?:~|\.{1,2})?/[\w.-]+(?:/[\w.-]+)*/?",       # 유닉스 경로
+    r"\b[A-Za-z]:\\[\w\\.-]+",                                # 윈도우 경로
+    r"\b[\w-]+(?:/[\w.-]+)+\.\w+\b",                          # 상대 경로 (src/app.py)
+    r"(?<![\w-])--[a-zA-Z][\w-]*",                            # CLI 옵션
+    r"\b[A-Za-z_]\w+(?:\.[A-Za-z_]\w+)+(?:\(\))?",            # 모듈/속성 (os.path.join)
+    r"\b\w+\(\)",                                             # 함수 호출
+    r"\b[a-zA-Z0-9]+(?:_[a-zA-Z0-9]+)+\b",                    # snake_case / SNAKE_CASE
+    r"\b[a-z]+[A-Z][a-zA-Z0-9]*\b",                           # camelCase
+]))
+
+PLACEHOLDER = "{{{{{index}}}}}"
+PLACEHOLDER_PATTERN = re.compile(r"\{\{\s*(\d+)\s*\}\}")
+
+
+def korean_ratio(text):
+    letters = [char for char in text if char.isalpha()]
+    if not letters:
+        return 0.0
+    return sum(1 for char in letters if '가' <= char <= '힣') / len(letters)
+
+
+def is_korean(text, threshold=None):
+    # 한글이 한 글자라도 있으면 건너뛰던 방식 대신, 글자 중 한글 비율로 판단
+    threshold = threshold if threshold is not None else Config.KOREAN_RATIO_THRESHOLD
+    return korean_ratio(text) >= threshold
+
+
+def has_letters(text):
+    return any(char.isalpha() for char in text)
+
+
+def is_code_line(line):
+    stripped = line.strip()
+    if not stripped:
+        return False
+
+    if CODE_LINE_PATTERN.match(line):
+        return True
+
+    # 줄 끝 기호나 기호 비율 하나만으로는 일반 문장도 걸리므로 둘 다 해당하고 문장처럼 보이지 않을 때만 코드로 봄
+    if not stripped.endswith(CODE_LINE_ENDINGS):
+        return False
+
+    # 문자열 리터럴 안의 문장은 판단에서 제외
+    unquoted = QUOTED_PATTERN.sub('""', stripped)
+    non_space = [char for char in unquoted if not char.isspace()]
+    symbol_ratio = sum(1 for char in non_space if char in CODE_SYMBOLS) / len(non_space)
+    return symbol_ratio > CODE_SYMBOL_RATIO and not WORD_RUN_PATTERN.search(unquoted)
+
+
+class Segment:
+    """원문 조각 하나. translatable이면 masked를 번역한 뒤 tokens를 다시 끼워 넣음"""
+
+    def __init__(self, text, translatable=False):
+        self.text = text
+        self.translatable = translatable
+        self.tokens = []
+        self.masked = text
+
+        if translatable:
+            self.masked = INLINE_KEEP_PATTERN.sub(self._mask, text)
+            # URL이나 코드만 있는 줄은 번역할 내용이 없음
+            self.translatable = has_letters(PLACEHOLDER_PATTERN.sub("", self.masked))
+
+    def _mask(self, match):
+        self.tokens.append(match.group(0))
+        return PLACEHOLDER.format(index=len(self.tokens) - 1)
+
+    def restore(self, translated):
+        # 자리표시자가 하나라도 빠지거나 중복되면 None
+        indices = [int(index) for index in PLACEHOLDER_PATTERN.findall(translated)]
+        if sorted(indices) != list(range(len(self.tokens))):
+            return None
+
+        return PLACEHOLDER_PATTERN.sub(lambda match: self.tokens[int(match.group(1))], translated)
+
+    def fragments(self):
+        # 자리표시자 사이의 문장 조각 (자리표시자가 손상될 때 따로 번역)
+        return PLACEHOLDER_PATTERN.split(self.masked)[::2]
+
+    def rebuild(self, translated_fragments):
+        parts = []
+        for n, (fragment, translated) in enumerate(zip(self.fragments(), translated_fragments)):
+            core = fragment.strip()
+            if core and translated:
+                start = fragment.index(core)
+                fragment = fragment[:start] + translated.strip() + fragment[start + len(core):]
+
+            parts.append(fragment)
+            if n < len(self.tokens):
+                parts.append(self.tokens[n])
+
+        return "".join(parts)
+
+
+def _prose_segments(text):
+    # 앞뒤 공백은 번역 결과에서 사라지므로 따로 떼어 그대로 둠
+    core = text.strip()
+    if not core:
+        return [Segment(text)]
+
+    start = text.index(core)
+    segments = []
+    if start:
+        segments.append(Segment(text[:start]))
+    segments.append(Segment(core, translatable=has_letters(core) and not is_korean(core)))
+    if start + len(core) < len(text):
+        segments.append(Segment(text[start + len(core):]))
+    return segments
+
+
+def segment_text(text):
+    """코드 블록/코드 줄은 그대로 두고, 이어진 문장 줄은 하나의 번역 대상으로 묶음"""
+    segments = []
+    prose = []
+    code = []
+    in_fence = False
+
+    def flush(lines, translatable):
+        if not lines:
+            return
+        joined = "".join(lines)
+        segments.extend(_prose_segments(joined) if translatable else [Segment(joined)])
+        lines.clear()
+
+    for line in text.splitlines(keepends=True):
+        fence = bool(FENCE_PATTERN.match(line))
+        if in_fence or fence or is_code_line(line):
+            flush(prose, True)
+            code.append(line)
+            if fence:
+                in_fence = not in_fence
+            continue
+
+        flush(code, False)
+        prose.append(line)
+
+    flush(prose, True)
+    flush(code, False)
+    return segments
@@ -0,0 +1,169 @@
+import logging
+import threading
+import time
+
+from config import Config
+from http_client import get_http_client
+from rate_limiter import get_translation_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_WEB_URL = "https://translate.googleapis.com/translate_a/single"
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+RETRYABLE_STATUS_CODES = (429, 503)
+
+
+class CircuitBreaker:
+    """연속으로 실패한 백엔드를 일정 시간 동안 건너뛰게 함"""
+
+    def __init__(self, failure_threshold=None, cooldown=None):
+        self.failure_threshold = failure_threshold or Config.TRANSLATION_BREAKER_THRESHOLD
+        self.cooldown = cooldown if cooldown is not None else Config.TRANSLATION_BREAKER_COOLDOWN
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+        self.lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return "open"
+        return "half_open"
+
+    def allow(self):
+        with self.lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "open" or self.trial_in_flight:
+                return False
+
+            # 대기 시간이 지나면 한 번만 시험 요청을 보내 회복 여부를 확인
+            self.trial_in_flight = True
+            return True
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_flight = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self.trial_in_flight = False
+
+
+def parse_gtx_response(data):
+    translated_parts = []
+    if isinstance(data, list) and len(data) > 0 and isinstance(data[0], list):
+        for item in data[0]:
+            if isinstance(item, list) and len(item) >= 1 and item[0]:
+                translated_parts.append(item[0])
+
+    return ''.join(translated_parts) if translated_parts else None
+
+
+class GtxBackend:
+    """translate_a/single(gtx) 형식의 HTTP 엔드포인트"""
+
+    def __init__(self, name, url, rate_limiter=None):
+        self.name = name
+        self.url = url
+        self.rate_limiter = rate_limiter
+        self.http = get_http_client()
+        self.breaker = CircuitBreaker()
+
+    def request(self, text, target="ko"):
+        # (상태 코드, 번역 결과, Retry-After 초)를 반환
+        try:
+            params = {
+                'client': 'gtx',
+                'sl': 'auto',  # 자동 언어 감지
+                'tl': target,
+                'dt': 't',
+                'q': text
+            }
+
+            response = self.http.get(self.url, params=params, headers={'User-Agent': USER_AGENT})
+
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                retry_after = response.headers.get("Retry-After")
+                return response.status_code, None, float(retry_after) if retry_after and retry_after.isdigit() else None
+
+            if response.status_code == 200:
+                data = response.json()
+                translated_text = parse_gtx_response(data)
+                if translated_text:
+                    detected_lang = data[2] if len(data) > 2 else 'unknown'
+                    logger.debug(f"{self.name} 번역 성공: {detected_lang} -> {target}")
+                    return response.status_code, translated_text, None
+
+            return response.status_code, None, None
+
+        except Exception as e:
+            logger.debug(f"{self.name} 번역 실패: {str(e)}")
+
+        return None, None, None
+
+
+class GoogletransBackend:
+    name = "googletrans"
+    rate_limiter = None
+
+    def __init__(self):
+        self.client = None
+        self.breaker = CircuitBreaker()
+
+    def request(self, text, target="ko"):
+        try:
+            # googletrans는 가져오는 데 시간이 걸리므로 처음 사용할 때 초기화하고 이후 재사용
+            if self.client is None:
+                from googletrans import Translator
+
+                self.client = Translator()
+
+            result = self.client.translate(text, src='auto', dest=target)
+            if hasattr(result, 'text') and result.text:
+                return 200, result.text, None
+
+            logger.debug(f"번역 결과에 text 속성이 없거나 비어있음: {type(result)}")
+            return 200, None, None
+
+        except Exception as e:
+            logger.debug(f"googletrans 번역 실패: {str(e)}")
+            # 세션 문제일 수 있으므로 다음 요청에서 클라이언트를 새로 만듦
+            self.client = None
+
+        return None, None, None
+
+
+def create_backend(name):
+    if name == "google":
+        return GtxBackend("google", GOOGLE_WEB_URL, get_translation_rate_limiter())
+    if name == "googletrans":
+        return GoogletransBackend()
+    if name == "local":
+        return GtxBackend("local", Config.TRANSLATION_STANDIN_URL)
+
+    logger.warning(f"알 수 없는 번역 백엔드: {name}")
+    return None
+
+
+_backends = None
+_backends_lock = threading.Lock()
+
+
+def get_translation_backends():
+    global _backends
+
+    with _backends_lock:
+        if _backends is None:
+            _backends = [backend for backend in map(create_backend, Config.TRANSLATION_BACKENDS) if backend]
+
+    return _backends
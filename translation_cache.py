@@ -0,0 +1,109 @@
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+
+from config import Config
+from metrics import get_metrics
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class TranslationCache:
+    def __init__(self, path=None, max_entries=None, ttl_hours=None):
+        self.config = Config()
+        self.path = path or self.config.TRANSLATION_CACHE_PATH
+        self.max_entries = max_entries if max_entries is not None else self.config.TRANSLATION_CACHE_MAX_ENTRIES
+        ttl_hours = ttl_hours if ttl_hours is not None else self.config.TRANSLATION_CACHE_TTL_HOURS
+        self.ttl = ttl_hours * 3600 if ttl_hours else 0
+
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "key TEXT PRIMARY KEY, target TEXT NOT NULL, translated TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_translations_accessed ON translations (accessed_at)")
+
+    @staticmethod
+    def normalize(text):
+        text = text.replace("\r\n", "\n").strip()
+        return re.sub(r"[ \t]+", " ", text)
+
+    def key(self, text, target="ko"):
+        return hashlib.sha256(f"{target}\0{self.normalize(text)}".encode("utf-8")).hexdigest()
+
+    def get(self, text, target="ko"):
+        key = self.key(text, target)
+        now = time.time()
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT translated, created_at FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row and self.ttl and now - row[1] > self.ttl:
+                with self.conn:
+                    self.conn.execute("DELETE FROM translations WHERE key = ?", (key,))
+                row = None
+
+            if not row:
+                self.misses += 1
+                get_metrics().incr("translation_cache", result="miss")
+                return None
+
+            with self.conn:
+                self.conn.execute("UPDATE translations SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            get_metrics().incr("translation_cache", result="hit")
+            return row[0]
+
+    def set(self, text, translated, target="ko"):
+        now = time.time()
+
+        with self.lock:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO translations (key, target, translated, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (self.key(text, target), target, translated, now, now)
+                )
+            self._evict()
+
+    def _evict(self):
+        if not self.max_entries:
+            return
+
+        count = self.conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return
+
+        # 가장 오래 사용되지 않은 항목부터 삭제 (LRU)
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM translations WHERE key IN "
+                "(SELECT key FROM translations ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,)
+            )
+        logger.debug(f"번역 캐시 {overflow}개 항목 제거")
+
+    def stats(self):
+        with self.lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": entries
+        }
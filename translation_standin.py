@@ -0,0 +1,107 @@
+import argparse
+import json
+import logging
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from config import Config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 배치 구분자 줄은 실제 번역기처럼 그대로 돌려줌
+MARKER_LINE_PATTERN = re.compile(r"^\s*\[\[#\d+\]\]\s*$")
+
+
+def fake_translate(text):
+    return "\n".join(
+        line if not line.strip() or MARKER_LINE_PATTERN.match(line) else f"{line} (번역됨)"
+        for line in text.split("\n")
+    )
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """네트워크 없이 번역 경로를 시험하기 위한 gtx 형식 응답 서버"""
+
+    latency = 0.0
+    failure_rate = 0.0
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path != "/translate_a/single":
+            self.send_error(404)
+            return
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if random.random() < self.failure_rate:
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            self.end_headers()
+            return
+
+        query = parse_qs(parts.query)
+        text = query.get("q", [""])[0]
+        body = json.dumps([[[fake_translate(text), text, None, None]], None, "en"], ensure_ascii=False).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def start_standin(host="127.0.0.1", port=8765, latency=0.0, failure_rate=0.0):
+    handler = type("ConfiguredStandInHandler", (StandInHandler,), {"latency": latency, "failure_rate": failure_rate})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_benchmark(count, port):
+    # 대역 서버만 사용하도록 설정한 뒤 번역기를 생성해야 함
+    Config.TRANSLATION_BACKENDS = ["local"]
+    Config.TRANSLATION_STANDIN_URL = f"http://127.0.0.1:{port}/translate_a/single"
+    Config.TRANSLATION_CACHE = False
+
+    from translator import KoreanTranslator
+
+    texts = [f"Benchmark sentence number {i}. It has a second sentence too." for i in range(count)]
+
+    started = time.perf_counter()
+    results = KoreanTranslator().translate_texts(texts)
+    elapsed = time.perf_counter() - started
+
+    translated = sum(1 for text, result in zip(texts, results) if result and result != text)
+    logger.info(f"{count}개 문장 중 {translated}개 번역 ({elapsed * 1000:.1f}ms)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 번역 대역 서버")
+    parser.add_argument("--port", type=int, default=8765, help="대기할 포트")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="429로 응답할 비율 (0~1)")
+    parser.add_argument("--benchmark", type=int, metavar="N", help="서버를 띄운 뒤 N개 문장 번역 시간을 측정")
+
+    args = parser.parse_args()
+
+    server = start_standin(port=args.port, latency=args.latency, failure_rate=args.failure_rate)
+    logger.info(f"번역 대역 서버 시작: http://127.0.0.1:{args.port}/translate_a/single")
+
+    try:
+        if args.benchmark:
+            run_benchmark(args.benchmark, args.port)
+        else:
+            threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
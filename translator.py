@@ -1,136 +1,343 @@
+import asyncio
 import logging
-import random
-import time
-
-import requests
-from googletrans import Translator
+import re
+
+from async_utils import run_sync
+from config import Config
+from metrics import get_metrics
+from post_history import open_post_history
+from rate_limiter import backoff_delay
+from text_chunker import encoded_size, join_chunks, split_text
+from text_segmenter import has_letters, is_korean, segment_text
+from translation_backends import RETRYABLE_STATUS_CODES, get_translation_backends
+from translation_cache import TranslationCache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+TRANSLATABLE_FIELDS = ("title", "description", "content")
+
+# 여러 문장을 한 요청에 묶을 때 각 문장 앞에 붙이는 구분자 (번역 후에도 유지되는 형태)
+BATCH_MARKER = "[[#{index}]]"
+BATCH_MARKER_PATTERN = re.compile(r"\[\s*\[\s*#\s*(\d+)\s*\]\s*\]")
+
 
 class KoreanTranslator:
     def __init__(self):
-        self.translator = None
-        self._initialize_translator()
+        self.config = Config()
+        self.backends = get_translation_backends()
+        self.cache = None
+        self.history = open_post_history()
 
-    def _initialize_translator(self):
-        try:
-            self.translator = Translator()
-        except Exception as e:
-            logger.error(f"번역기 초기화 실패: {str(e)}")
+        if self.config.TRANSLATION_CACHE:
+            try:
+                self.cache = TranslationCache()
+            except Exception as e:
+                logger.warning(f"번역 캐시 초기화 실패, 캐시 없이 진행합니다: {str(e)}")
 
-    def _translate_with_requests(self, text):
-        try:
-            url = "https://translate.googleapis.com/translate_a/single"
-            params = {
-                'client': 'gtx',
-                'sl': 'auto',  # 자동 언어 감지
-                'tl': 'ko',
-                'dt': 't',
-                'q': text
-            }
+    async def _call_backend_async(self, backend, text):
+        loop = asyncio.get_running_loop()
 
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
+        for attempt in range(self.config.TRANSLATION_MAX_RETRIES + 1):
+            if backend.rate_limiter:
+                await backend.rate_limiter.acquire()
+            status, translated_text, retry_after = await loop.run_in_executor(None, backend.request, text)
+            get_metrics().incr("translation_requests", backend=backend.name, status=status or "error")
 
-            response = requests.get(url, params=params, headers=headers, timeout=15)
+            if status not in RETRYABLE_STATUS_CODES:
+                if translated_text and backend.rate_limiter:
+                    backend.rate_limiter.reward()
+                return translated_text
 
-            if response.status_code == 200:
-                data = response.json()
+            delay = backoff_delay(attempt, retry_after=retry_after)
+            logger.info(f"{backend.name} 번역 요청 제한 ({status}), {delay:.1f}초 후 재시도")
+            if backend.rate_limiter:
+                backend.rate_limiter.penalize(delay)
+            else:
+                await asyncio.sleep(delay)
 
-                translated_parts = []
-                if isinstance(data, list) and len(data) > 0 and isinstance(data[0], list):
-                    for item in data[0]:
-                        if isinstance(item, list) and len(item) >= 1 and item[0]:
-                            translated_parts.append(item[0])
+        return None
 
-                if translated_parts:
-                    translated_text = ''.join(translated_parts)
+    def _record_result(self, backend, translated_text):
+        if translated_text:
+            backend.breaker.record_success()
+            return
 
-                    detected_lang = data[2] if len(data) > 2 else 'unknown'
-                    confidence = data[6] if len(data) > 6 else 0.0
+        was_closed = backend.breaker.state == "closed"
+        backend.breaker.record_failure()
+        if backend.breaker.state == "open" and was_closed:
+            logger.warning(f"번역 백엔드 {backend.name} 연속 실패, {backend.breaker.cooldown:.0f}초 동안 건너뜁니다.")
 
-                    logger.debug(f"Google API 번역 성공: {detected_lang} -> ko (신뢰도: {confidence:.2f})")
-                    return translated_text
+    async def _translate_with_backends_async(self, text):
+        for backend in self.backends:
+            if not backend.breaker.allow():
+                continue
 
-        except Exception as e:
-            logger.debug(f"Google API 번역 실패: {str(e)}")
+            translated_text = await self._call_backend_async(backend, text)
+            self._record_result(backend, translated_text)
+            if translated_text:
+                return translated_text
 
         return None
 
-    def translate_to_korean(self, text, max_retries=3):
+    def _is_korean(self, text):
+        return is_korean(text)
+
+    def _cached(self, text):
+        if not self.cache:
+            return None
+        return self.cache.get(text)
+
+    def translate_to_korean(self, text):
         if not text or text.strip() == "":
             return ""
 
-        if any('\uac00' <= char <= '\ud7a3' for char in text):
+        if self._is_korean(text):
             logger.debug("이미 한국어로 된 텍스트입니다.")
             return text
 
-        logger.debug("Google API 직접 호출로 번역 시도...")
-        api_result = self._translate_with_requests(text)
-        if api_result:
-            logger.debug(f"Google API 번역 성공: {text[:30]}... -> {api_result[:30]}...")
-            return api_result
-
-        logger.debug("Google API 실패, googletrans 라이브러리 시도 중...")
-        for attempt in range(max_retries):
-            try:
-                if not self.translator:
-                    self._initialize_translator()
+        return self.translate_texts([text])[0]
 
-                result = self.translator.translate(text, src='auto', dest='ko')
+    def _store(self, text, translated_text):
+        if not self.cache:
+            return
 
-                if hasattr(result, 'text') and result.text:
-                    translated_text = result.text
-                    logger.debug(f"googletrans 번역 완료: {text[:30]}... -> {translated_text[:30]}...")
-                    return translated_text
-                else:
-                    logger.debug(f"번역 결과에 text 속성이 없거나 비어있음: {type(result)}")
+        try:
+            self.cache.set(text, translated_text)
+        except Exception as e:
+            logger.debug(f"번역 캐시 저장 실패: {str(e)}")
+
+    def _build_batches(self, texts):
+        max_bytes = self.config.TRANSLATION_REQUEST_MAX_BYTES
+        batches = []
+        current = []
+        current_size = 0
+
+        for i, text in enumerate(texts):
+            size = encoded_size(BATCH_MARKER.format(index=len(current)) + "\n" + text + "\n")
+            if current and current_size + size > max_bytes:
+                batches.append(current)
+                current = []
+                current_size = 0
+
+            current.append(i)
+            current_size += size
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    async def _translate_batch(self, texts):
+        joined = "".join(f"{BATCH_MARKER.format(index=n)}\n{text}\n" for n, text in enumerate(texts))
+        translated = await self._translate_with_backends_async(joined)
+        if not translated:
+            return None
+
+        # split 결과: [구분자 앞 텍스트, 번호0, 번역0, 번호1, 번역1, ...]
+        parts = BATCH_MARKER_PATTERN.split(translated)
+        indices = parts[1::2]
+        segments = [segment.strip() for segment in parts[2::2]]
+
+        if parts[0].strip() or [int(index) for index in indices] != list(range(len(texts))):
+            return None
+
+        if any(not segment for segment in segments):
+            return None
+
+        return segments
+
+    async def _translate_one(self, text):
+        translated_text = await self._translate_with_backends_async(text)
+        if translated_text:
+            self._store(text, translated_text)
+        return translated_text
+
+    async def _translate_batch_group(self, semaphore, texts, batch, results, number, total):
+        async with semaphore:
+            if len(batch) == 1:
+                results[batch[0]] = await self._translate_one(texts[batch[0]])
+                return
+
+            logger.info(f"배치 번역 {number}/{total} ({len(batch)}개 문장)")
+            translated = await self._translate_batch([texts[i] for i in batch])
+
+        if translated is None:
+            logger.info("배치 번역 결과가 어긋나 개별 번역으로 전환합니다.")
+            translated = await asyncio.gather(*(self._translate_one_limited(semaphore, texts[i]) for i in batch))
+            for i, translated_text in zip(batch, translated):
+                results[i] = translated_text
+            return
+
+        for i, translated_text in zip(batch, translated):
+            results[i] = translated_text
+            self._store(texts[i], translated_text)
+
+    async def _translate_one_limited(self, semaphore, text):
+        async with semaphore:
+            return await self._translate_one(text)
+
+    def _split_texts(self, texts):
+        # 긴 텍스트는 조각으로 나눠 다른 문장들과 같은 배치 경로로 번역
+        plans = [split_text(text, self.config.TRANSLATION_REQUEST_MAX_BYTES) for text in texts]
+        segments = [chunk for plan in plans for chunk, _ in plan]
+
+        chunked = sum(1 for plan in plans if len(plan) > 1)
+        if chunked:
+            logger.info(f"긴 텍스트 {chunked}개를 {sum(len(plan) for plan in plans if len(plan) > 1)}개 조각으로 나눠 번역합니다.")
+
+        return plans, segments
+
+    def _join_texts(self, texts, plans, translated_segments):
+        results = []
+        offset = 0
+
+        for text, plan in zip(texts, plans):
+            translated = translated_segments[offset:offset + len(plan)]
+            offset += len(plan)
+
+            if len(plan) == 1:
+                results.append(translated[0] or text)
+                continue
+
+            # 실패한 조각은 원문을 그대로 두고 나머지 번역 결과와 합침
+            result = join_chunks([
+                ((translated_text or chunk).strip(), separator)
+                for (chunk, separator), translated_text in zip(plan, translated)
+            ])
+
+            if all(translated):
+                self._store(text, result)
+            results.append(result)
+
+        return results
+
+    async def _translate_chunks_async(self, texts):
+        results = [self._cached(text) for text in texts]
+        pending = [i for i, cached in enumerate(results) if cached is None]
+        if not pending:
+            return results
+
+        pending_texts = [texts[i] for i in pending]
+        plans, segments = self._split_texts(pending_texts)
+        translated_segments = [None] * len(segments)
+        batches = self._build_batches(segments)
+        semaphore = asyncio.Semaphore(max(1, self.config.TRANSLATION_CONCURRENCY))
+
+        await asyncio.gather(*(
+            self._translate_batch_group(semaphore, segments, batch, translated_segments, n + 1, len(batches))
+            for n, batch in enumerate(batches)
+        ))
+
+        for i, translated_text in zip(pending, self._join_texts(pending_texts, plans, translated_segments)):
+            results[i] = translated_text
+        return results
+
+    async def _restore_segments(self, segments, translated):
+        results = [segment.restore(translated_text) for segment, translated_text in zip(segments, translated)]
+        broken = [n for n, result in enumerate(results) if result is None]
+        if not broken:
+            return results
+
+        # 자리표시자가 번역 중에 손상된 경우, 자리표시자 사이 문장 조각만 따로 번역해 끼워 넣음
+        logger.info(f"자리표시자가 손상된 {len(broken)}개 항목을 조각별로 다시 번역합니다.")
+        fragments = [
+            (n, f, fragment.strip())
+            for n in broken
+            for f, fragment in enumerate(segments[n].fragments())
+            if has_letters(fragment)
+        ]
+        translated_fragments = await self._translate_chunks_async([fragment for _, _, fragment in fragments])
+
+        rebuilt = {n: [None] * len(segments[n].fragments()) for n in broken}
+        for (n, f, _), translated_text in zip(fragments, translated_fragments):
+            rebuilt[n][f] = translated_text
+        for n in broken:
+            results[n] = segments[n].rebuild(rebuilt[n])
+
+        return results
+
+    async def translate_texts_async(self, texts):
+        # 코드/URL/식별자는 그대로 두고 문장 부분만 번역 요청에 보냄
+        documents = [segment_text(text) for text in texts]
+        segments = [segment for document in documents for segment in document if segment.translatable]
+
+        kept_bytes = sum(encoded_size(text) for text in texts) - sum(encoded_size(segment.masked) for segment in segments)
+        if kept_bytes > 0:
+            logger.info(f"코드/URL 등 번역이 필요 없는 {kept_bytes}바이트를 요청에서 제외합니다.")
+
+        translated = await self._translate_chunks_async([segment.masked for segment in segments])
+        restored = dict(zip(map(id, segments), await self._restore_segments(segments, translated)))
+
+        return [
+            "".join(restored.get(id(segment), segment.text) for segment in document)
+            for document in documents
+        ]
+
+    def translate_texts(self, texts):
+        if not texts:
+            return []
+        return run_sync(self.translate_texts_async(texts))
+
+    def _stored_translation(self, post, field):
+        if not self.history or not post.get("link"):
+            return None
 
-            except Exception as e:
-                logger.debug(f"googletrans 시도 {attempt + 1}/{max_retries} 실패: {str(e)}")
+        try:
+            return self.history.translation(post, field)
+        except Exception as e:
+            logger.debug(f"게시글 기록 조회 실패: {str(e)}")
+            return None
 
-                if attempt < max_retries - 1:
-                    time.sleep(random.uniform(0.5, 1.5))
-                    self._initialize_translator()
+    def _record_translations(self, posts, translated_posts):
+        if not self.history:
+            return
 
-        logger.warning(f"모든 번역 방법 실패, 원본 반환: {text[:50]}...")
-        return text
+        try:
+            for post, translated_post in zip(posts, translated_posts):
+                if post.get("link"):
+                    self.history.record_translation(post, translated_post)
+        except Exception as e:
+            logger.warning(f"번역 기록 저장 실패: {str(e)}")
 
     def translate_post(self, post):
+        return self.translate_posts([post])[0]
+
+    def translate_posts(self, posts):
+        translated_posts = [post.copy() for post in posts]
+
         try:
-            translated_post = post.copy()
+            pending = []
+            reused = 0
+            for i, post in enumerate(posts):
+                for field in TRANSLATABLE_FIELDS:
+                    text = post.get(field)
+                    if not text or not text.strip() or self._is_korean(text):
+                        continue
+
+                    # 이전 실행에서 같은 원문을 번역해 둔 게시글은 저장된 번역을 그대로 사용
+                    stored = self._stored_translation(post, field)
+                    if stored:
+                        translated_posts[i][field] = stored
+                        reused += 1
+                        continue
 
-            if post.get("title"):
-                logger.info("제목 번역 중...")
-                translated_post["title"] = self.translate_to_korean(post["title"])
-                time.sleep(1)
+                    pending.append((i, field, text))
 
-            if post.get("description"):
-                logger.info("설명 번역 중...")
-                translated_post["description"] = self.translate_to_korean(post["description"])
-                time.sleep(1)
+            logger.info(f"게시글 {len(posts)}개 번역 중... ({len(pending)}개 항목, 이전 번역 재사용 {reused}개)")
+            with get_metrics().span("translation"):
+                results = self.translate_texts([text for _, _, text in pending])
 
-            if post.get("content"):
-                logger.info("본문 번역 중...")
-                translated_post["content"] = self.translate_to_korean(post["content"])
-                time.sleep(1)
+            for (i, field, _), translated_text in zip(pending, results):
+                translated_posts[i][field] = translated_text
 
-            return translated_post
+            self._record_translations(posts, translated_posts)
 
         except Exception as e:
             logger.error(f"게시글 번역 실패: {str(e)}")
-            return post
-
-    def translate_posts(self, posts):
-        translated_posts = []
-
-        for i, post in enumerate(posts):
-            logger.info(f"게시글 {i + 1}/{len(posts)} 번역 중...")
-            translated_post = self.translate_post(post)
-            translated_posts.append(translated_post)
 
         logger.info(f"총 {len(translated_posts)}개 게시글 번역 완료")
-        return translated_posts
\ No newline at end of file
+        if self.cache:
+            stats = self.cache.stats()
+            logger.info(f"번역 캐시: 적중 {stats['hits']}회, 미스 {stats['misses']}회 (저장 {stats['entries']}개)")
+        return translated_posts
@@ -0,0 +1,63 @@
+import logging
+import time
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class WaitTracker:
+    def __init__(self, poll_interval=0.1):
+        self.poll_interval = poll_interval
+        self.records = []
+
+    def until(self, label, condition, timeout, poll_interval=None):
+        poll_interval = poll_interval or self.poll_interval
+        start = time.monotonic()
+        deadline = start + timeout
+        result = False
+
+        while True:
+            try:
+                result = condition()
+            except Exception:
+                result = False
+
+            if result:
+                break
+
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            time.sleep(min(poll_interval, deadline - now))
+
+        self.records.append((label, time.monotonic() - start, timeout, bool(result)))
+        return result
+
+    def reset(self):
+        self.records = []
+
+    def summary(self):
+        summary = {}
+        for label, elapsed, budget, satisfied in self.records:
+            stats = summary.setdefault(label, {"count": 0, "elapsed": 0.0, "budget": 0.0, "timeouts": 0})
+            stats["count"] += 1
+            stats["elapsed"] += elapsed
+            stats["budget"] += budget
+            if not satisfied:
+                stats["timeouts"] += 1
+        return summary
+
+    def log_summary(self):
+        if not self.records:
+            return
+
+        summary = self.summary()
+        total_elapsed = sum(stats["elapsed"] for stats in summary.values())
+        total_budget = sum(stats["budget"] for stats in summary.values())
+        logger.info(f"대기 시간 요약: 총 {total_elapsed:.1f}초 / 예산 {total_budget:.1f}초 ({len(self.records)}회)")
+
+        for label, stats in sorted(summary.items(), key=lambda item: item[1]["elapsed"], reverse=True):
+            logger.info(
+                f"  - {label}: {stats['count']}회, {stats['elapsed']:.1f}초 / {stats['budget']:.1f}초, "
+                f"시간 초과 {stats['timeouts']}회"
+            )
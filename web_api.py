@@ -1,11 +1,11 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
-from datetime import datetime
+from fastapi.responses import JSONResponse, PlainTextResponse
+from datetime import datetime, timezone
 import logging
-from daily_scraper import DailyDevScraper
-from translator import KoreanTranslator
-from discord_sender import DiscordSender
+import threading
+from driver_pool import get_driver_pool
 from config import Config
+from metrics import get_metrics
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,6 +19,31 @@ app = FastAPI(
 config = Config()
 
 
+@app.on_event("startup")
+async def warm_up_driver_pool():
+    pool = get_driver_pool()
+    if pool:
+        threading.Thread(target=pool.warm_up, daemon=True).start()
+
+
+@app.on_event("startup")
+async def flush_discord_outbox():
+    def flush():
+        from discord_sender import DiscordSender
+
+        DiscordSender().flush_outbox()
+
+    if config.DISCORD_OUTBOX:
+        threading.Thread(target=flush, daemon=True).start()
+
+
+@app.on_event("shutdown")
+async def close_driver_pool():
+    pool = get_driver_pool()
+    if pool:
+        pool.close()
+
+
 @app.get("/")
 async def root():
     return {
@@ -54,13 +79,17 @@ async def scrape_posts(background_tasks: BackgroundTasks, limit: int = 10):
         raise HTTPException(status_code=500, detail=f"내부 서버 오류: {str(e)}")
 
 
+# Selenium/번역/전송은 블로킹 호출이므로 일반 함수로 두어 스레드풀에서 실행되게 함.
+# 이벤트 루프를 막지 않아야 동시 요청이 풀의 드라이버를 각각 빌려 쓰고 /health 등도 바로 응답함
 @app.get("/scrape-sync")
-async def scrape_posts_sync(limit: int = 10):
+def scrape_posts_sync(limit: int = 10):
     try:
         if limit < 1 or limit > 20:
             raise HTTPException(status_code=400, detail="limit은 1~20 사이의 값이어야 합니다.")
 
-        scraper = DailyDevScraper()
+        from daily_scraper import DailyDevScraper
+
+        scraper = DailyDevScraper(driver_pool=get_driver_pool())
         posts = scraper.scrape_posts(limit)
 
         if not posts:
@@ -81,7 +110,7 @@ async def scrape_posts_sync(limit: int = 10):
 
 
 @app.post("/translate")
-async def translate_text(text: str, target_lang: str = "ko"):
+def translate_text(text: str, target_lang: str = "ko"):
     try:
         if not text.strip():
             raise HTTPException(status_code=400, detail="번역할 텍스트가 없습니다.")
@@ -89,6 +118,8 @@ async def translate_text(text: str, target_lang: str = "ko"):
         if target_lang != "ko":
             raise HTTPException(status_code=400, detail="현재 한국어 번역만 지원합니다.")
 
+        from translator import KoreanTranslator
+
         translator = KoreanTranslator()
         translated_text = translator.translate_to_korean(text)
 
@@ -108,26 +139,81 @@ async def translate_text(text: str, target_lang: str = "ko"):
 
 @app.get("/config")
 async def get_config():
+    from cron_schedule import load_schedules
+    from http_client import get_http_client
+    from translation_backends import get_translation_backends
+
+    now = datetime.now(timezone.utc)
+
     return {
         "post_limit": config.POST_LIMIT,
         "schedule_time": config.SCHEDULE_TIME,
+        "schedules": [
+            {"schedule": schedule.name, "limit": schedule.limit, "next_run": schedule.next_after(now).isoformat()}
+            for schedule in load_schedules(config)
+        ],
         "daily_dev_url": config.DAILY_DEV_URL,
-        "webhook_configured": bool(config.DISCORD_WEBHOOK_URL),
+        "webhook_configured": bool(config.DISCORD_WEBHOOK_URLS),
+        "webhook_targets": len(config.DISCORD_WEBHOOK_URLS),
+        "driver_pool": get_driver_pool().stats() if get_driver_pool() else None,
+        "http": get_http_client().stats(),
+        "translation_backends": [
+            {"name": backend.name, "state": backend.breaker.state} for backend in get_translation_backends()
+        ],
         "timestamp": datetime.now().isoformat()
     }
 
 
-async def run_scraping_task(limit: int):
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(get_metrics().to_prometheus(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/metrics/json")
+async def metrics_json():
+    return get_metrics().snapshot()
+
+
+def run_scraping_task(limit: int):
+    get_metrics().start_run("api")
+    status = "failed"
+
     try:
         logger.info(f"백그라운드 크롤링 시작 (limit: {limit})")
 
-        scraper = DailyDevScraper()
+        from daily_scraper import DailyDevScraper
+        from discord_sender import DiscordSender
+        from translator import KoreanTranslator
+
+        scraper = DailyDevScraper(driver_pool=get_driver_pool())
+
+        if config.PIPELINE_STREAMING:
+            from pipeline import DigestPipeline
+
+            result = DigestPipeline(scraper, KoreanTranslator(), DiscordSender()).run(limit)
+            if not result["scraped"]:
+                logger.error("크롤링된 게시글이 없습니다.")
+            elif result["success"]:
+                logger.info(f"백그라운드 크롤링 작업 완료: {result['sent']}개 게시글")
+                status = "success" if result["sent"] else "skipped"
+            else:
+                logger.error("Discord 전송 실패")
+            return
+
         posts = scraper.scrape_posts(limit)
 
         if not posts:
             logger.error("크롤링된 게시글이 없습니다.")
             return
 
+        from post_history import apply_repeat_policy
+
+        posts = apply_repeat_policy(posts)
+        if not posts:
+            logger.info("새 게시글이 없어 전송을 건너뜁니다.")
+            status = "skipped"
+            return
+
         translator = KoreanTranslator()
         translated_posts = translator.translate_posts(posts)
 
@@ -136,12 +222,16 @@ async def run_scraping_task(limit: int):
 
         if success:
             logger.info(f"백그라운드 크롤링 작업 완료: {len(translated_posts)}개 게시글")
+            status = "success"
         else:
             logger.error("Discord 전송 실패")
 
     except Exception as e:
         logger.error(f"백그라운드 크롤링 작업 중 에러: {str(e)}")
 
+    finally:
+        get_metrics().finish_run(status)
+
 
 if __name__ == "__main__":
     import uvicorn